@@ -2,15 +2,70 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .First import First, LookaheadTable
+
 
 class AlternativeParser:
+    # Class attributes, to keep construction cheap
+    __applications = 0
+    __lookahead = None
+
     def __init__(self, elements, match=lambda x: x):
         self.__elements = elements
         self.__match = match
 
     def apply(self, cursor):
-        with cursor.backtracking as bt:  # @todo Here, we need backtracking only because of self.__expected.
-            for element in self.__elements:
-                if element.apply(cursor):
-                    return bt.success(self.__match(cursor.value))
-            return bt.failure()
+        if self.__lookahead is None:
+            # Building the lookahead table is only worth it for parsers that are applied many times
+            self.__applications += 1
+            if self.__applications > 8:
+                lookahead = LookaheadTable(self.__elements)
+                self.__lookahead = lookahead if lookahead.useful else False
+        if self.__lookahead:
+            steps, skipped = self.__lookahead.getPlan(cursor)
+            with cursor.backtracking as bt:
+                for expected, element in steps:
+                    if expected:
+                        cursor.addExpected(expected)
+                    if cursor.apply(element):
+                        return bt.success(cursor.match(self.__match, cursor.value))
+                if skipped:
+                    cursor.addExpected(skipped)
+                return bt.failure()
+        else:
+            with cursor.backtracking as bt:  # @todo Here, we need backtracking only because of self.__expected.
+                for element in self.__elements:
+                    if cursor.apply(element):
+                        return bt.success(cursor.match(self.__match, cursor.value))
+                return bt.failure()
+
+    def compileFunction(self, compiler):
+        lines = []
+        match = compiler.constant(self.__match)
+        for element in self.__elements:
+            lines += compiler.inline(element, "position", "end", "value")
+            lines += ["if end >= 0:", "    return end, %s(value)" % match]
+        if not self.__elements:
+            # Failing without expecting anything: position must still be joined, like on a Cursor
+            lines += ["if position >= failure[0]:", "    expect(failure, position, ())"]
+        lines.append("return FAILED")
+        return lines
+
+    def instruction(self, program):
+        return program.alternative(self.__elements, self.__match)
+
+    def computeFirst(self, getFirst):
+        firsts = [getFirst(element) for element in self.__elements]
+        if None in firsts:
+            return None
+        expected = set()
+        for first in firsts:
+            expected.update(first.expected)
+            if first.nullable:
+                break
+        return First(
+            set().union(*(first.literals for first in firsts)),
+            sum((first.classes for first in firsts), ()),
+            any(first.nullable for first in firsts),
+            expected
+        )
@@ -0,0 +1,13 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Compiler import Compiler
+from .CompiledParser import CompiledParser
+
+
+def compile(parser):
+    # Generates specialized Python code for the Literal, Set, Range, Sequence, Alternative, Optional and Repeated
+    # parsers reachable from parser. Other parsers are kept as they are, and are applied on the Cursor the compiled
+    # parser is applied on, so they use its memo. Compiled parsers themselves don't memoize.
+    return CompiledParser(parser, Compiler().build(parser))
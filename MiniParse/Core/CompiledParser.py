@@ -0,0 +1,25 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class CompiledParser:
+    # Behaves exactly like the parser it was compiled from, including its value and the ParsingError.
+    # On cursors that can't access tokens randomly, the original parser is applied instead.
+    def __init__(self, parser, function):
+        self.__parser = parser
+        self.__function = function
+
+    def apply(self, cursor):
+        tokens = cursor._tokens
+        if tokens is None:
+            return cursor.apply(self.__parser)
+        failure = [-1, None, cursor]
+        end, value = self.__function(tokens, len(tokens), cursor._position, failure)
+        if failure[0] >= 0:
+            cursor._merge(failure[0], failure[1])
+        if end < 0:
+            return cursor.failure()
+        cursor._merge(end, set())
+        cursor._position = end
+        return cursor.success(value)
@@ -0,0 +1,105 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Cursor import Cursor, _match
+
+
+class Compiler:
+    # Generates the source of one Python function per parser. They all have the same signature:
+    #   def f(tokens, length, position, failure)
+    # and return (end, value), with end == -1 on failure. failure is [maxPosition, expected, cursor] and is updated
+    # only on failures: a successful parse joins its own end position at the end, so successes don't need to be
+    # recorded. cursor is the Cursor the compiled parser is applied on.
+    # Parsers take part by implementing either:
+    #   compileInline(compiler, position, end, value): lines setting the variables end and value from position
+    #   compileFunction(compiler): lines of the body of the function
+    # Other parsers are applied on cursor (see _applyWithCursor).
+
+    def __init__(self):
+        self.__namespace = {"expect": _expect, "applyWithCursor": _applyWithCursor, "FAILED": (-1, None)}
+        self.__functions = {}
+        self.__keepAlive = []
+        self.__sources = []
+        self.__variables = 0
+
+    def constant(self, value):
+        name = "c%d" % len(self.__namespace)
+        self.__namespace[name] = value
+        return name
+
+    def variable(self, prefix):
+        self.__variables += 1
+        return "%s%d" % (prefix, self.__variables)
+
+    def inline(self, parser, position, end, value):
+        compileInline = getattr(parser, "compileInline", None)
+        if compileInline is None:
+            return ["%s, %s = %s(tokens, length, %s, failure)" % (end, value, self.function(parser), position)]
+        else:
+            return compileInline(self, position, end, value)
+
+    def function(self, parser):
+        name = self.__functions.get(id(parser))
+        if name is None:
+            # Registered before compiling parser, for recursive grammars
+            name = "f%d" % len(self.__functions)
+            self.__functions[id(parser)] = name
+            self.__keepAlive.append(parser)  # So that its id is not reused
+            compileFunction = getattr(parser, "compileFunction", None)
+            if compileFunction is not None:
+                body = compileFunction(self)
+            elif getattr(parser, "compileInline", None) is not None:
+                body = self.inline(parser, "position", "end", "value") + [
+                    "if end < 0:",
+                    "    return FAILED",
+                    "return end, value",
+                ]
+            else:
+                body = ["return applyWithCursor(%s, tokens, position, failure)" % self.constant(parser)]
+            self.__sources.append("def %s(tokens, length, position, failure):" % name)
+            self.__sources += self.indent(body)
+            self.__sources.append("")
+        return name
+
+    @property
+    def source(self):
+        return "\n".join(self.__sources)
+
+    def build(self, parser):
+        name = self.function(parser)
+        exec(self.source, self.__namespace)
+        return self.__namespace[name]
+
+    @staticmethod
+    def indent(lines):
+        return ["    " + line for line in lines]
+
+
+def _expect(failure, position, expected):
+    # Callers check that position >= failure[0], to avoid the call in the common case
+    if position > failure[0]:
+        failure[0] = position
+        failure[1] = set(expected)
+    else:
+        failure[1].update(expected)
+
+
+def _applyWithCursor(parser, tokens, position, failure):
+    # Applies parser on the caller's cursor, so that its memo is used. Compiled code needs actual values, so
+    # cursors that don't build them (deferring and recognizing cursors) are replaced by a plain Cursor.
+    # parser recurses as usual.
+    cursor = failure[2]
+    if cursor.match is not _match:
+        cursor = Cursor(tokens)
+    start, maxPosition, expected = cursor._position, cursor._maxPosition, cursor._expected
+    cursor._position = cursor._maxPosition = position
+    cursor._expected = None
+    if cursor.apply(parser):
+        result = (cursor._position, cursor.value)
+    else:
+        result = (-1, None)
+    if cursor._maxPosition >= failure[0]:
+        _expect(failure, cursor._maxPosition, cursor._expected or ())
+    cursor._position, cursor._maxPosition, cursor._expected = start, maxPosition, expected
+    return result
@@ -2,6 +2,8 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .DeferredAction import DeferredAction
+
 
 class _NoValueType:
     pass
@@ -9,9 +11,9 @@ _NoValue = _NoValueType()
 
 
 class Backtracker:
+    # A single Backtracker is shared by all frames of a Cursor: it always acts on the innermost open frame
     def __init__(self, cursor):
         self.__cursor = cursor
-        self.__failed = None
 
     def __enter__(self):
         self.__cursor._pushBacktracking()
@@ -19,115 +21,220 @@ class Backtracker:
 
     def __exit__(self, type, exception, traceback):
         if type is None:
-            assert self.__failed is not None
-            self.__cursor._popBacktracking(self.__failed)
+            self.__cursor._popBacktracking()
 
     def success(self, success):
-        assert self.__failed is None
-        self.__failed = False
+        self.__cursor._endBacktracking(False)
         return self.__cursor.success(success)
 
     def expected(self, expected):
-        assert self.__failed is None
-        self.__failed = True
+        self.__cursor._endBacktracking(True)
         return self.__cursor.expected(expected)
 
     def failure(self):
-        assert self.__failed is None
-        self.__failed = True
+        self.__cursor._endBacktracking(True)
         return self.__cursor.failure()
 
 
-# @todo TODO Understand exactly why the commented code is not needed
 class Cursor(object):
-    class __BacktrackingInfo:
-        def __init__(self, position):
-            self.initialPosition = position
-            self._maxPosition = position
-            self._expected = set()
-
-    def __init__(self, tokens):  # @todo Write tests demonstrating that tokens can be a simple iterator
+    # Merging the furthest failure of a frame into its parent is associative, so it is tracked once for the whole
+    # cursor instead of once per frame. The expected set is None until a failure is seen at the furthest position.
+    # Frames are stored in preallocated parallel lists indexed by self._depth.
+    # Parsers build their values with self.match(match, *arguments), which is match(*arguments), or the tuple of
+    # arguments when match is None. With deferred=True, it records a DeferredAction instead, and match functions
+    # are called by parseWithCursor, once, on the winning parse only. Compiled and iterative parsers still call
+    # their match functions immediately.
+    _tracksFailures = True
+
+    def __init__(self, tokens, memo=None, deferred=False):  # See StreamingCursor for tokens that are a simple iterator
         self.__tokens = tokens
-        self.__position = 0
+        self._position = 0
         self._maxPosition = 0
-        self.__value = _NoValue
-        self._expected = set()
-        self.__backtrackings = []
+        self._expected = None
+        self._value = _NoValue
+        self._depth = 0
+        self._starts = [0] * 16
+        self._failed = [None] * 16
+        self._backtracker = Backtracker(self)
+        self.__memo = memo
+        self.__deferred = deferred
+        # An attribute rather than a method, because it's called for each value
+        self.match = DeferredAction if deferred else _match
+
+    def apply(self, parser):
+        if self.__memo is None:
+            return parser.apply(self)
+        return self._applyWith(parser, parser.apply)
+
+    def _applyRequired(self, parser):
+        # Called by parsers that fail when parser fails, see StreamingCursor
+        return self.apply(parser)
+
+    def _applyWith(self, parser, apply):
+        if self.__memo is None:
+            return apply(self)
+        key = (parser, self._position)
+        entry = self.__memo.get(key)
+        if entry is None:
+            # Isolate what parser contributes to the furthest failure, so that it can be replayed
+            maxPosition, expected = self._maxPosition, self._expected
+            self._maxPosition, self._expected = -1, None
+            success = apply(self)
+            entry = (success, self._value, self._position, self._maxPosition, frozenset(self._expected or ()))
+            self.__memo.put(key, entry)
+            self._merge(maxPosition, expected)
+            return success
+        else:
+            success, self._value, self._position, maxPosition, expected = entry
+            self._merge(maxPosition, set(expected))
+            return success
+
+    def _merge(self, maxPosition, expected):
+        if maxPosition > self._maxPosition:
+            self._maxPosition = maxPosition
+            self._expected = expected
+        elif maxPosition == self._maxPosition and expected:
+            if self._expected:
+                self._expected.update(expected)
+            else:
+                self._expected = expected
+
+    @property
+    def deferred(self):
+        return self.__deferred
+
+    @property
+    def _tokens(self):
+        # None when tokens can't be accessed randomly
+        return self.__tokens
 
     @property
     def backtracking(self):
-        return Backtracker(self)
+        return self._backtracker
 
     def _pushBacktracking(self):
-        self.__backtrackings.append(self.__BacktrackingInfo(self.__position))
-
-    def _popBacktracking(self, failed):
-        orig = self.__backtrackings.pop()
-        if len(self.__backtrackings) > 0:
-            dest = self.__backtrackings[-1]
-        else:
-            dest = self
-        if orig._maxPosition > dest._maxPosition:
-            dest._maxPosition = orig._maxPosition
-            dest._expected = set(orig._expected)
-        elif orig._maxPosition == dest._maxPosition:
-            # if len(orig._expected) == 0:
-            #     dest._expected = set()
-            # else:
-                dest._expected.update(orig._expected)
+        depth = self._depth
+        if depth == len(self._starts):
+            self._starts.extend([0] * depth)
+            self._failed.extend([None] * depth)
+        self._starts[depth] = self._position
+        self._failed[depth] = None
+        self._depth = depth + 1
+
+    def _endBacktracking(self, failed):
+        assert self._failed[self._depth - 1] is None
+        self._failed[self._depth - 1] = failed
+
+    def _popBacktracking(self):
+        depth = self._depth - 1
+        failed = self._failed[depth]
+        assert failed is not None
+        self._depth = depth
         if failed:
-            self.__position = orig.initialPosition
-        # @todo if len(self.__backtrackings) == 0: take the opportunity to free the tokens before self.__position: we will never need them again
+            self._position = self._starts[depth]
 
     @property
     def current(self):
         assert not self.finished
-        return self.__tokens[self.__position]
+        return self.__tokens[self._position]
 
     def advance(self):
         assert not self.finished
-        assert len(self.__backtrackings) > 0
-        self.__position += 1
+        assert self._depth > 0
+        self._position += 1
+
+    def advanceWhile(self, accepts):
+        # Advances over the tokens accepted by accepts, and returns them
+        start = self._position
+        return list(self.__tokens[start:start + self.skipWhile(accepts)])
+
+    def skipWhile(self, accepts):
+        # Advances over the tokens accepted by accepts, and returns how many they are
+        assert self._depth > 0
+        tokens = self.__tokens
+        start = position = self._position
+        end = len(tokens)
+        while position < end and accepts(tokens[position]):
+            position += 1
+        self._position = position
+        return position - start
+
+    def advanceText(self, text):
+        # Advances over text if the tokens at the current position are its characters, and returns whether it did.
+        # For cursors over a str, a bytes or a memoryview, so text is compared to a slice of them (that doesn't copy
+        # a memoryview).
+        assert self._depth > 0
+        position = self._position
+        end = position + len(text)
+        if not self.__tokens[position:end] != text:
+            self._position = end
+            return True
+        else:
+            return False
+
+    def advancePattern(self, pattern):
+        # Advances over the match of the compiled regular expression pattern at the current position, and returns
+        # it, or None. For cursors over a str, a bytes or a memoryview.
+        assert self._depth > 0
+        match = pattern.match(self.__tokens, self._position)
+        if match is not None:
+            self._position = match.end()
+        return match
 
     @property
     def finished(self):
-        return self.__position == len(self.__tokens)
+        return self._position == len(self.__tokens)
+
+    @property
+    def position(self):
+        return self._position
 
     def success(self, success):
-        if len(self.__backtrackings) > 0:
-            bt = self.__backtrackings[-1]
-            if self.__position > bt._maxPosition:
-                bt._maxPosition = self.__position
-                bt._expected = set()
-        # else:
-        #     if self.__position > self._maxPosition:
-        #         self._maxPosition = self.__position
-        #         self._expected = set()
-        self.__value = success
+        if self._depth > 0 and self._position > self._maxPosition:
+            self._maxPosition = self._position
+            self._expected = None
+        self._value = success
         return True
 
     def expected(self, expected):
-        assert len(self.__backtrackings) > 0
-        # if len(self.__backtrackings) > 0:
-        bt = self.__backtrackings[-1]
-        assert self.__position == bt._maxPosition
-        bt._maxPosition = bt.initialPosition
-        bt._expected = set([expected])
-        # else:
-        #     assert self.__position == self._maxPosition
-        #     self._expected = set([expected])
+        assert self._depth > 0
+        position = self._position
+        if position > self._maxPosition:
+            self._maxPosition = position
+            self._expected = set([expected])
+        elif position == self._maxPosition:
+            if self._expected is None:
+                self._expected = set([expected])
+            else:
+                self._expected.add(expected)
         return self.failure()
 
+    def addExpected(self, expected):
+        # Records that any of expected would have been accepted at the current position
+        position = self._position
+        if position > self._maxPosition:
+            self._maxPosition = position
+            self._expected = set(expected)
+        elif position == self._maxPosition:
+            if self._expected is None:
+                self._expected = set(expected)
+            else:
+                self._expected.update(expected)
+
     def failure(self):
-        self.__value = _NoValue
+        self._value = _NoValue
         return False
 
     @property
     def error(self):
-        assert len(self.__backtrackings) == 0  # @todo Allow consultation of last error before end
-        return self._maxPosition, self._expected
+        assert self._depth == 0  # @todo Allow consultation of last error before end
+        return self._maxPosition, set(self._expected or ())
 
     @property
     def value(self):
-        assert self.__value is not _NoValue
-        return self.__value
+        assert self._value is not _NoValue
+        return self._value
+
+
+def _match(match, *arguments):
+    return arguments if match is None else match(*arguments)
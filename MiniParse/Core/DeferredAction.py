@@ -0,0 +1,41 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class _NotReplayedType:
+    pass
+_NotReplayed = _NotReplayedType()
+
+
+class DeferredAction:
+    # The value of a parser on a deferring Cursor: the match function and its arguments, which may themselves be
+    # DeferredActions, or lists and tuples of them. Nothing is called until the whole parse has succeeded.
+    # An action can be shared (by a Memo), so its value is computed once.
+    __slots__ = ("__match", "__arguments", "__value")
+
+    def __init__(self, match, *arguments):
+        self.__match = match
+        self.__arguments = arguments
+        self.__value = _NotReplayed
+
+    def replay(self):
+        if self.__value is _NotReplayed:
+            arguments = tuple(replay(argument) for argument in self.__arguments)
+            self.__value = arguments if self.__match is None else self.__match(*arguments)
+            self.__match = self.__arguments = None
+        return self.__value
+
+
+def replay(value):
+    # Values that contain no DeferredAction are returned as is, so that constant values keep their identity
+    if isinstance(value, DeferredAction):
+        return value.replay()
+    elif type(value) is list or type(value) is tuple:
+        replayed = [replay(item) for item in value]
+        for item, replayedItem in zip(value, replayed):
+            if item is not replayedItem:
+                return replayed if type(value) is list else tuple(replayed)
+        return value
+    else:
+        return value
@@ -0,0 +1,75 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .StreamingCursor import StreamingCursor
+from .RecognizingCursor import _recognizer, _noValue
+
+
+class EventCursor(StreamingCursor):
+    # A StreamingCursor that recognizes tokens like a RecognizingCursor, and reports the applications of RuleParsers
+    # and the consumed tokens to a handler, in order:
+    #   handler.enterRule(name, position), handler.token(token, position), handler.exitRule(name, position)
+    # Events are buffered while they can be backtracked, and discarded on failure. They are delivered when only
+    # fatal frames are open (see StreamingCursor), so memory stays bounded when parsing a long repetition of small
+    # items. Memo entries don't record events, so this cursor doesn't memoize.
+    _reportsRules = True
+
+    def __init__(self, tokens, handler):
+        StreamingCursor.__init__(self, tokens)
+        self.match = _noValue
+        self.__handler = handler
+        self.__events = []
+        self.__marks = []  # Length of self.__events for each open frame
+
+    def _applyParser(self, parser):
+        return _recognizer(parser)(self)
+
+    def _applyRule(self, name, parser):
+        # Events may have been delivered while applying parser, so self.__events is not kept in a local variable
+        mark = len(self.__events)
+        self.__events.append((self.__handler.enterRule, name, self._position))
+        if self._applyRequired(parser):
+            self.__events.append((self.__handler.exitRule, name, self._position))
+            self.__commit()
+            return True
+        else:
+            del self.__events[mark:]
+            return False
+
+    def _pushBacktracking(self):
+        StreamingCursor._pushBacktracking(self)
+        self.__marks.append(len(self.__events))
+
+    def _popBacktracking(self):
+        failed = self._failed[self._depth - 1]
+        mark = self.__marks.pop()
+        StreamingCursor._popBacktracking(self)
+        if failed:
+            del self.__events[mark:]
+        else:
+            self.__commit()
+
+    def advance(self):
+        position = self._position
+        token = self.current
+        StreamingCursor.advance(self)
+        self.__events.append((self.__handler.token, token, position))
+
+    def advanceWhile(self, accepts):
+        position = self._position
+        tokens = StreamingCursor.advanceWhile(self, accepts)
+        onToken = self.__handler.token
+        self.__events.extend((onToken, token, position + i) for i, token in enumerate(tokens))
+        return tokens
+
+    def skipWhile(self, accepts):
+        # The tokens are needed for their events
+        return len(self.advanceWhile(accepts))
+
+    def __commit(self):
+        if not self._recoverable:
+            events = self.__events
+            self.__events = []
+            for event, argument, position in events:
+                event(argument, position)
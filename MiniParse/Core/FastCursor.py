@@ -0,0 +1,57 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Cursor import Cursor, _NoValue
+
+
+class _FastBacktracker:
+    def __init__(self, cursor):
+        self.__cursor = cursor
+
+    def __enter__(self):
+        self.__cursor._pushBacktracking()
+        return self
+
+    def __exit__(self, type, exception, traceback):
+        if type is None:
+            cursor = self.__cursor
+            depth = cursor._depth - 1
+            cursor._depth = depth
+            if cursor._failed[depth]:
+                cursor._position = cursor._starts[depth]
+
+    def success(self, success):
+        cursor = self.__cursor
+        cursor._failed[cursor._depth - 1] = False
+        cursor._value = success
+        return True
+
+    def expected(self, expected):
+        return self.failure()
+
+    def failure(self):
+        cursor = self.__cursor
+        cursor._failed[cursor._depth - 1] = True
+        cursor._value = _NoValue
+        return False
+
+
+class FastCursor(Cursor):
+    # A Cursor that doesn't track the furthest failure. Its error is meaningless: when a parse fails with a
+    # FastCursor, it must be run again with a Cursor to produce the ParsingError.
+    _tracksFailures = False
+
+    def __init__(self, tokens, memo=None, deferred=False):
+        Cursor.__init__(self, tokens, memo, deferred)
+        self._backtracker = _FastBacktracker(self)
+
+    def success(self, success):
+        self._value = success
+        return True
+
+    def expected(self, expected):
+        return self.failure()
+
+    def addExpected(self, expected):
+        pass
@@ -0,0 +1,14 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .FastCursor import FastCursor
+from .RecognizingCursor import _Recognizing, _noValue
+
+
+class FastRecognizingCursor(_Recognizing, FastCursor):
+    # A RecognizingCursor that doesn't track the furthest failure, like a FastCursor: it only tells if parser
+    # accepts tokens, so RegularParsers can use their regular expression.
+    def __init__(self, tokens, memo=None):
+        FastCursor.__init__(self, tokens, memo)
+        self.match = _noValue
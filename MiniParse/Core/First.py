@@ -0,0 +1,87 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class First:
+    # What a parser can start with: token values (literals) and token classes, whether it can succeed without
+    # consuming anything, and the expected set it reports when it's applied to a token it can't start with.
+    def __init__(self, literals, classes, nullable, expected):
+        self.literals = frozenset(literals)
+        self.classes = tuple(classes)
+        self.nullable = nullable
+        self.expected = frozenset(expected)
+
+    def accepts(self, token):
+        return token in self.literals or isinstance(token, self.classes)
+
+
+def getFirst(parser, _visiting=None):
+    # Returns None when the parser doesn't implement computeFirst, or is reached again through a cycle
+    computeFirst = getattr(parser, "computeFirst", None)
+    if computeFirst is None:
+        return None
+    if _visiting is None:
+        _visiting = set()
+    if id(parser) in _visiting:
+        return None
+    _visiting.add(id(parser))
+    try:
+        return computeFirst(lambda p: getFirst(p, _visiting))
+    finally:
+        _visiting.remove(id(parser))
+
+
+class LookaheadTable:
+    # For each possible next token, the elements of an alternative that may succeed on it, in order.
+    # Each one is preceded by the expected set of the skipped elements that would have been tried before it,
+    # so that the furthest failure is exactly the same as with ordered trial.
+    # This relies on tokens comparing equal (==) exactly when they don't differ (!=), and hashing consistently.
+
+    def __init__(self, elements):
+        self.__elements = elements
+        self.__firsts = [getFirst(element) for element in elements]
+        self.__byValue = {}
+        for first in self.__firsts:
+            if first is not None:
+                for literal in first.literals:
+                    self.__byValue[literal] = (type(literal), self.__makePlan(lambda f: f.accepts(literal)))
+        self.__byType = {}
+        self.__atEnd = self.__makePlan(lambda f: False)
+        self.__anyToken = self.__makePlan(lambda f: True)
+
+    @property
+    def useful(self):
+        return any(first is not None and not first.nullable for first in self.__firsts)
+
+    def __makePlan(self, accepts):
+        steps = []
+        skipped = set()
+        for element, first in zip(self.__elements, self.__firsts):
+            if first is None or first.nullable or accepts(first):
+                steps.append((frozenset(skipped), element))
+                skipped = set()
+            else:
+                skipped.update(first.expected)
+        return tuple(steps), frozenset(skipped)
+
+    def getPlan(self, cursor):
+        if cursor.finished:
+            return self.__atEnd
+        token = cursor.current
+        if type(token).__hash__ is None:
+            return self.__anyToken
+        try:
+            type_, plan = self.__byValue[token]
+        except KeyError:
+            plan = self.__byType.get(type(token))
+            if plan is None:
+                plan = self.__makePlan(lambda f: isinstance(token, f.classes))
+                self.__byType[type(token)] = plan
+            return plan
+        except TypeError:  # Unhashable token
+            return self.__anyToken
+        if type_ is type(token):
+            return plan
+        else:
+            return self.__makePlan(lambda f: f.accepts(token))
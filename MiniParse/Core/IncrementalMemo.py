@@ -0,0 +1,87 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import bisect
+
+
+class IncrementalMemo:
+    # A memo that survives edits of the tokens (see ParsingSession). Entries are stored in one column per position,
+    # with their end and max positions relative to the column, so that inserting or removing columns shifts all
+    # following entries at once.
+    # An entry depends on the tokens from its position to its reach, the furthest of its end and max positions.
+    # (A parser can't examine a token without reaching its position through a success or a failure.) So an edit
+    # invalidates exactly the entries at a position before the edit and reaching it. Each column records the
+    # furthest reach of its entries, to skip columns that are not affected.
+    # Only the columns in the window of shortReach positions before the edit, and the columns that reach further
+    # (kept sorted in longColumns, usually a few outer rules), can be affected, so an edit doesn't examine the
+    # whole document (see benchmarks/IncrementalEdit.py).
+    shortReach = 32
+
+    def __init__(self):
+        self.__columns = []
+        self.__reaches = []
+        self.__longColumns = []
+
+    def get(self, key):
+        parser, position = key
+        if position < len(self.__columns):
+            column = self.__columns[position]
+            if column is not None:
+                entry = column.get(parser)
+                if entry is not None:
+                    success, value, length, maxLength, expected = entry
+                    return (success, value, position + length, -1 if maxLength < 0 else position + maxLength, expected)
+        return None
+
+    def put(self, key, entry):
+        parser, position = key
+        success, value, end, maxPosition, expected = entry
+        if position >= len(self.__columns):
+            missing = position + 1 - len(self.__columns)
+            self.__columns += [None] * missing
+            self.__reaches += [-1] * missing
+        column = self.__columns[position]
+        if column is None:
+            column = self.__columns[position] = {}
+        maxLength = -1 if maxPosition < 0 else maxPosition - position
+        column[parser] = (success, value, end - position, maxLength, expected)
+        reach = max(end - position, maxLength)
+        if reach > self.__reaches[position]:
+            if reach > self.shortReach >= self.__reaches[position]:
+                bisect.insort(self.__longColumns, position)
+            self.__reaches[position] = reach
+
+    def edit(self, start, removedCount, insertedCount):
+        # Tokens [start, start + removedCount) have been replaced by insertedCount tokens
+        end = start + removedCount
+        self.__columns[start:end] = [None] * insertedCount
+        self.__reaches[start:end] = [-1] * insertedCount
+        longColumns = self.__longColumns
+        before = bisect.bisect_left(longColumns, start)
+        after = bisect.bisect_left(longColumns, end)
+        longColumns[before:] = [position + insertedCount - removedCount for position in longColumns[after:]]
+        stop = min(start, len(self.__columns))
+        window = max(0, stop - self.shortReach)
+        for position in longColumns[:bisect.bisect_left(longColumns, window)]:
+            self.__invalidate(position, start)
+        for position in range(window, stop):
+            self.__invalidate(position, start)
+        longColumns[:before] = [position for position in longColumns[:before] if self.__reaches[position] > self.shortReach]
+
+    def __invalidate(self, position, start):
+        # Discards the entries of the column at position that reach start
+        reaches = self.__reaches
+        if position + reaches[position] >= start:
+            column = self.__columns[position]
+            reach = -1
+            for parser, entry in list(column.items()):
+                entryReach = max(entry[2], entry[3])
+                if position + entryReach >= start:
+                    del column[parser]
+                elif entryReach > reach:
+                    reach = entryReach
+            reaches[position] = reach
+
+    def __len__(self):
+        return sum(len(column) for column in self.__columns if column is not None)
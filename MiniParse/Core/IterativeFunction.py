@@ -0,0 +1,16 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .IterativeParser import IterativeParser
+
+
+def iterative(parser, maxDepth=None):
+    # Builds a parser that runs the Literal, Set, Range, Sequence, Alternative, Optional, Repeated, Repetition,
+    # Restriction and Rule parsers reachable from parser without recursion, so that deeply nested inputs don't
+    # hit Python's recursion limit. Other parsers are kept as they are, and are applied on the Cursor the iterative
+    # parser is applied on, so they use its memo. They recurse as usual.
+    # With maxDepth, parsing raises a ParsingError instead of nesting more than maxDepth parsers. Only the parsers
+    # above are counted: nesting inside other parsers is not limited.
+    # Iterative parsers themselves don't memoize.
+    return IterativeParser(parser, maxDepth)
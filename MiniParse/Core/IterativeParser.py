@@ -0,0 +1,232 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Program import Program, LITERAL, SET, SEQUENCE, ALTERNATIVE, OPTIONAL, REPEATED, REPETITION, RESTRICTION, RULE, FOREIGN
+from .Compiler import _expect, _applyWithCursor
+from .ParsingError import ParsingError
+
+
+class IterativeParser:
+    # Behaves exactly like the parser it was built from, including its value and the ParsingError, but doesn't
+    # recurse: its Program is run in a single loop, with an explicit stack of frames [instruction, index, position,
+    # values]. Nesting is limited by maxDepth frames instead of Python's recursion limit, except inside FOREIGN
+    # parsers, which recurse.
+    # Failures are tracked like in compiled code (see Compiler).
+    # On cursors that can't access tokens randomly, the original parser is applied instead.
+    def __init__(self, parser, maxDepth):
+        self.__parser = parser
+        self.__program = Program(parser)
+        self.__maxDepth = maxDepth
+
+    def apply(self, cursor):
+        tokens = cursor._tokens
+        if tokens is None:
+            return cursor.apply(self.__parser)
+        failure = [-1, None, cursor]
+        end, value = self.__run(tokens, cursor._position, failure)
+        if failure[0] >= 0:
+            cursor._merge(failure[0], failure[1])
+        if end < 0:
+            return cursor.failure()
+        cursor._merge(end, set())
+        cursor._position = end
+        return cursor.success(value)
+
+    def __run(self, tokens, position, failure):
+        instructions = self.__program.instructions
+        maxDepth = self.__maxDepth
+        length = len(tokens)
+        stack = []
+        instruction = instructions[self.__program.root]
+        while True:
+            # Call instruction at position, until a result is known in end and value (end == -1 on failure)
+            while True:
+                kind = instruction[0]
+                if kind == LITERAL:
+                    if position < length and not tokens[position] != instruction[1]:
+                        end = position + 1
+                        value = instruction[2]
+                    else:
+                        end = -1
+                        value = None
+                        if position >= failure[0]:
+                            _expect(failure, position, (instruction[1],))
+                    break
+                elif kind == SET:
+                    end = -1
+                    value = None
+                    if position < length:
+                        value = tokens[position]
+                        try:
+                            if value in instruction[1]:
+                                end = position + 1
+                        except TypeError:
+                            pass
+                    if end < 0:
+                        if position >= failure[0]:
+                            _expect(failure, position, instruction[1])
+                    else:
+                        value = instruction[2](value)
+                    break
+                elif kind == RULE:
+                    instruction = instructions[instruction[1]]
+                elif kind == FOREIGN:
+                    end, value = _applyWithCursor(instruction[1], tokens, position, failure)
+                    break
+                elif kind == REPEATED and _isToken(instructions, instruction[1]):
+                    end, value = self.__repeatToken(instructions, instruction, tokens, length, position, failure)
+                    break
+                elif maxDepth is not None and len(stack) >= maxDepth:
+                    raise ParsingError("Maximum depth exceeded", position, set())
+                elif kind == SEQUENCE:
+                    elements = instruction[1]
+                    if elements:
+                        stack.append([instruction, 0, position, []])
+                        instruction = instructions[elements[0]]
+                    else:
+                        end = position
+                        value = () if instruction[2] is None else instruction[2]()
+                        break
+                elif kind == ALTERNATIVE:
+                    elements = instruction[1]
+                    if elements:
+                        stack.append([instruction, 0, position, None])
+                        instruction = instructions[elements[0]]
+                    else:
+                        end = -1
+                        value = None
+                        if position >= failure[0]:
+                            _expect(failure, position, ())
+                        break
+                elif kind == REPETITION:
+                    if instruction[2] > 0:
+                        stack.append([instruction, 0, position, []])
+                        instruction = instructions[instruction[1]]
+                    else:
+                        end = position
+                        value = instruction[3]([])
+                        break
+                elif kind == RESTRICTION:
+                    # Exception first, with the furthest failure saved in the frame and restored after it
+                    stack.append([instruction, 0, position, (failure[0], failure[1])])
+                    failure[0], failure[1] = -1, None
+                    instruction = instructions[instruction[2]]
+                else:
+                    assert kind in (OPTIONAL, REPEATED)
+                    stack.append([instruction, 0, position, []])
+                    instruction = instructions[instruction[1]]
+
+            # Return the result to the frames, until one of them calls another instruction
+            while stack:
+                frame = stack[-1]
+                instruction = frame[0]
+                kind = instruction[0]
+                if kind == SEQUENCE:
+                    if end >= 0:
+                        values = frame[3]
+                        values.append(value)
+                        index = frame[1] + 1
+                        elements = instruction[1]
+                        if index < len(elements):
+                            frame[1] = index
+                            position = end
+                            instruction = instructions[elements[index]]
+                            break
+                        value = tuple(values) if instruction[2] is None else instruction[2](*values)
+                    stack.pop()
+                elif kind == ALTERNATIVE:
+                    if end >= 0:
+                        value = instruction[2](value)
+                    else:
+                        index = frame[1] + 1
+                        elements = instruction[1]
+                        if index < len(elements):
+                            frame[1] = index
+                            position = frame[2]
+                            instruction = instructions[elements[index]]
+                            break
+                    stack.pop()
+                elif kind == OPTIONAL:
+                    if end >= 0:
+                        value = instruction[3](value)
+                    else:
+                        end = frame[2]
+                        value = instruction[2]
+                    stack.pop()
+                elif kind == REPEATED:
+                    if end >= 0:
+                        frame[3].append(value)
+                        frame[2] = position = end
+                        instruction = instructions[instruction[1]]
+                        break
+                    end = frame[2]
+                    value = instruction[2](frame[3])
+                    stack.pop()
+                elif kind == REPETITION:
+                    if end >= 0:
+                        values = frame[3]
+                        values.append(value)
+                        if len(values) < instruction[2]:
+                            position = end
+                            instruction = instructions[instruction[1]]
+                            break
+                        value = instruction[3](values)
+                    stack.pop()
+                else:
+                    assert kind == RESTRICTION
+                    if frame[1] == 0:
+                        # The exception is only a lookahead: it doesn't contribute to the furthest failure
+                        failure[0], failure[1] = frame[3]
+                        frame[1] = 1
+                        frame[3] = end
+                        position = frame[2]
+                        instruction = instructions[instruction[1]]
+                        break
+                    if end >= 0:
+                        if end == frame[3]:
+                            end = -1
+                        else:
+                            value = instruction[3](value)
+                    stack.pop()
+            else:
+                return end, value
+
+    @staticmethod
+    def __repeatToken(instructions, instruction, tokens, length, position, failure):
+        # Same as RepeatedParser.applyRepeatedly
+        child = _resolve(instructions, instruction[1])
+        values = []
+        if child[0] == LITERAL:
+            token = child[1]
+            while position < length and not tokens[position] != token:
+                values.append(child[2])
+                position += 1
+            expected = (token,)
+        else:
+            accepted = child[1]
+            match = child[2]
+            while position < length:
+                token = tokens[position]
+                try:
+                    if token not in accepted:
+                        break
+                except TypeError:
+                    break
+                values.append(match(token))
+                position += 1
+            expected = accepted
+        if position >= failure[0]:
+            _expect(failure, position, expected)
+        return position, instruction[2](values)
+
+
+def _resolve(instructions, index):
+    instruction = instructions[index]
+    while instruction[0] == RULE:
+        instruction = instructions[instruction[1]]
+    return instruction
+
+
+def _isToken(instructions, index):
+    return _resolve(instructions, index)[0] in (LITERAL, SET)
@@ -2,6 +2,8 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .First import First
+
 
 class LiteralParser:
     def __init__(self, value, match=None):
@@ -15,3 +17,32 @@ class LiteralParser:
             else:
                 cursor.advance()
                 return bt.success(self.__match)
+
+    def applyRepeatedly(self, cursor):
+        # Same as applying self until it fails, in a single backtracking frame
+        with cursor.backtracking as bt:
+            value = self.__value
+            count = cursor.skipWhile(lambda token: not token != value)
+            cursor.addExpected((value,))
+            return bt.success([self.__match] * count)
+
+    def compileInline(self, compiler, position, end, value):
+        return [
+            "if %s < length and not tokens[%s] != %s:" % (position, position, compiler.constant(self.__value)),
+            "    %s = %s + 1" % (end, position),
+            "    %s = %s" % (value, compiler.constant(self.__match)),
+            "else:",
+            "    %s = -1" % end,
+            "    if %s >= failure[0]:" % position,
+            "        expect(failure, %s, %s)" % (position, compiler.constant((self.__value,))),
+        ]
+
+    def instruction(self, program):
+        return program.literal(self.__value, self.__match)
+
+    def computeFirst(self, getFirst):
+        try:
+            hash(self.__value)
+        except TypeError:
+            return None
+        return First([self.__value], [], False, [self.__value])
@@ -0,0 +1,29 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class LocatedTokens(list):
+    # A list of tokens, with the offsets where they start in the text of locations (a SourceLocations). It's built
+    # from (offset, token) pairs, as produced by a lexer: located can be a generator, so that no intermediate list
+    # of pairs is needed. ParsingErrors raised by parse on LocatedTokens have the line and column of the token where
+    # they happened.
+    def __init__(self, located, locations):
+        list.__init__(self)
+        self.__offsets = []
+        self.__locations = locations
+        appendToken = self.append
+        appendOffset = self.__offsets.append
+        for offset, token in located:
+            appendToken(token)
+            appendOffset(offset)
+
+    def offset(self, index):
+        # The end of the text for the index just after the last token
+        if index < len(self.__offsets):
+            return self.__offsets[index]
+        else:
+            return len(self.__locations.text)
+
+    def lineAndColumn(self, index):
+        return self.__locations.lineAndColumn(self.offset(index))
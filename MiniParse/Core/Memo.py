@@ -0,0 +1,33 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+
+
+class Memo:
+    def __init__(self, maxSize=None, lru=True):
+        assert maxSize is None or maxSize > 0
+        self.__maxSize = maxSize
+        self.__lru = lru
+        self.__entries = collections.OrderedDict()
+
+    @property
+    def maxSize(self):
+        return self.__maxSize
+
+    def get(self, key):
+        entry = self.__entries.get(key)
+        if entry is not None and self.__lru:
+            # Python 2.7's OrderedDict has no move_to_end
+            del self.__entries[key]
+            self.__entries[key] = entry
+        return entry
+
+    def put(self, key, entry):
+        self.__entries[key] = entry
+        if self.__maxSize is not None and len(self.__entries) > self.__maxSize:
+            self.__entries.popitem(last=False)
+
+    def __len__(self):
+        return len(self.__entries)
@@ -0,0 +1,176 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .First import First
+from .SetParser import SetParser
+from .SequenceParser import SequenceParser
+from .AlternativeParser import AlternativeParser
+from .OptionalParser import OptionalParser
+from .RepeatedParser import RepeatedParser
+from .RuleParser import RuleParser
+
+
+class OperatorPrecedenceParser:
+    # Parses the same tokens, with the same values and the same expected sets, as a chain of rules E(k), one per
+    # level from the lowest precedence E(0) to the operand E(n):
+    #   (operators, "left"):   E(k) = E(k+1), {operators, E(k+1)}   value: match(first, [(operator, value), ...])
+    #   (operators, "right"):  E(k) = E(k+1), [operators, E(k)]     value: match(left, None or (operator, right))
+    #   (operators, "prefix"): E(k) = {operators}, E(k+1)           value: match([operator, ...], value)
+    # match is the optional third item of the level. Without it, the value is the tuple of the arguments, like
+    # with a SequenceParser.
+    # But instead of descending through all levels for each operand, it parses operators and operands in a single
+    # loop, with a stack of the levels where operators have been seen, and a single backtracking frame per operand.
+    # Operators are single tokens, and a binary operator can't be in several levels.
+    # Compiled and iterative parsers run the chain of rules itself, so that nesting is not limited by recursion.
+    def __init__(self, operand, levels, match=lambda x: x):
+        self.__operand = operand
+        self.__levels = []
+        self.__binaryLevels = {}
+        self.__prefixes = []
+        for index, level in enumerate(levels):
+            operators, associativity = level[:2]
+            assert associativity in ("left", "right", "prefix")
+            self.__levels.append((associativity, level[2] if len(level) > 2 else None))
+            if associativity == "prefix":
+                self.__prefixes.append((index, frozenset(operators)))
+            else:
+                for operator in operators:
+                    assert operator not in self.__binaryLevels
+                    self.__binaryLevels[operator] = index
+        self.__binaryOperators = frozenset(self.__binaryLevels)
+        self.__match = match
+        self.__operators = [level[0] for level in levels]
+        self.__chain = None
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            # Frames: [level, first, rest, operator] for "left", [level, left, operator] for "right" and
+            # [level, operators] for "prefix", by increasing level
+            stack = []
+            prefixes = self.__applyPrefixes(cursor, 0)
+            if not cursor.apply(self.__operand):
+                return bt.failure()
+            stack += prefixes
+            value = cursor.value
+            top = len(self.__levels)  # The level of value
+            while True:
+                level = self.__nextBinaryLevel(cursor)
+                if level is None:
+                    break
+                value = self.__reduce(cursor, stack, value, top, level + 1)
+                top = level + 1
+                with cursor.backtracking as step:
+                    operator = cursor.current
+                    cursor.advance()
+                    cursor.success(operator)
+                    prefixes = self.__applyPrefixes(cursor, level + 1)
+                    if cursor.apply(self.__operand):
+                        step.success(cursor.value)
+                    else:
+                        step.failure()
+                        break
+                if self.__levels[level][0] == "left" and stack and stack[-1][0] == level:
+                    frame = stack[-1]
+                    frame[2].append((frame[3], value))
+                    frame[3] = operator
+                elif self.__levels[level][0] == "left":
+                    stack.append([level, value, [], operator])
+                else:
+                    stack.append([level, value, operator])
+                stack += prefixes
+                value = cursor.value
+                top = len(self.__levels)
+            return bt.success(cursor.match(self.__match, self.__reduce(cursor, stack, value, top, 0)))
+
+    def __applyPrefixes(self, cursor, minLevel):
+        # Like the RepeatedParsers of the prefix levels above minLevel
+        frames = []
+        for level, operators in self.__prefixes:
+            if level >= minLevel:
+                found = cursor.advanceWhile(lambda token: _contains(operators, token))
+                cursor.addExpected(operators)
+                if found:
+                    frames.append([level, found])
+        return frames
+
+    def __nextBinaryLevel(self, cursor):
+        if not cursor.finished:
+            level = _get(self.__binaryLevels, cursor.current)
+            if level is not None:
+                return level
+        cursor.addExpected(self.__binaryOperators)
+        return None
+
+    def __reduce(self, cursor, stack, value, top, bottom):
+        # value is the value of E(top): build the value of E(bottom)
+        for level in range(top - 1, bottom - 1, -1):
+            associativity, match = self.__levels[level]
+            if associativity == "left":
+                if stack and stack[-1][0] == level:
+                    level, first, rest, operator = stack.pop()
+                    rest.append((operator, value))
+                    args = (first, rest)
+                else:
+                    args = (value, [])
+            elif associativity == "right":
+                args = (value, None)
+                while stack and stack[-1][0] == level:
+                    value = cursor.match(match, *args)
+                    level, left, operator = stack.pop()
+                    args = (left, (operator, value))
+            else:
+                if stack and stack[-1][0] == level:
+                    args = (stack.pop()[1], value)
+                else:
+                    args = ([], value)
+            value = cursor.match(match, *args)
+        return value
+
+    def compileFunction(self, compiler):
+        return compiler.inline(self.__getChain(), "position", "end", "value") + [
+            "if end < 0:",
+            "    return FAILED",
+            "return end, value",
+        ]
+
+    def instruction(self, program):
+        return program.rule(self.__getChain())
+
+    def __getChain(self):
+        if self.__chain is None:
+            rules = [RuleParser("E" + str(k)) for k in range(len(self.__levels))] + [self.__operand]
+            for k, ((associativity, match), operators) in enumerate(zip(self.__levels, self.__operators)):
+                operators = SetParser(operators)
+                if associativity == "left":
+                    definition = [rules[k + 1], RepeatedParser(SequenceParser([operators, rules[k + 1]]))]
+                elif associativity == "right":
+                    definition = [rules[k + 1], OptionalParser(SequenceParser([operators, rules[k]]))]
+                else:
+                    definition = [RepeatedParser(operators), rules[k + 1]]
+                rules[k].define(SequenceParser(definition, match))
+            self.__chain = AlternativeParser([rules[0]], self.__match)
+        return self.__chain
+
+    def computeFirst(self, getFirst):
+        first = getFirst(self.__operand)
+        if first is None:
+            return None
+        prefixes = set()
+        for level, operators in self.__prefixes:
+            prefixes |= operators
+        return First(first.literals | prefixes, first.classes, first.nullable, first.expected | prefixes)
+
+
+def _get(dictionary, token):
+    try:
+        return dictionary.get(token)
+    except TypeError:  # Unhashable token
+        return None
+
+
+def _contains(operators, token):
+    try:
+        return token in operators
+    except TypeError:  # Unhashable token
+        return False
@@ -2,6 +2,8 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .First import First
+
 
 class OptionalParser:
     def __init__(self, parser, noMatch=None, match=lambda x: x):
@@ -10,7 +12,23 @@ class OptionalParser:
         self.__match = match
 
     def apply(self, cursor):
-        if self.__parser.apply(cursor):
-            return cursor.success(self.__match(cursor.value))
+        if cursor.apply(self.__parser):
+            return cursor.success(cursor.match(self.__match, cursor.value))
         else:
             return cursor.success(self.__noMatch)
+
+    def compileFunction(self, compiler):
+        return compiler.inline(self.__parser, "position", "end", "value") + [
+            "if end < 0:",
+            "    return position, %s" % compiler.constant(self.__noMatch),
+            "return end, %s(value)" % compiler.constant(self.__match),
+        ]
+
+    def instruction(self, program):
+        return program.optional(self.__parser, self.__noMatch, self.__match)
+
+    def computeFirst(self, getFirst):
+        first = getFirst(self.__parser)
+        if first is None:
+            return None
+        return First(first.literals, first.classes, True, first.expected)
@@ -0,0 +1,13 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .ParseFunction import parseWithCursor
+from .EventCursor import EventCursor
+
+
+def parseEvents(parser, tokens, handler):
+    # Parses tokens, which can be any iterable, without building any value: calls the enterRule, token and exitRule
+    # methods of handler as parsing commits (see EventCursor). Returns None, or raises the same ParsingError as
+    # parse, after delivering the events committed before the error.
+    parseWithCursor(parser, EventCursor(tokens, handler))
@@ -3,15 +3,68 @@
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
 from .Cursor import Cursor
+from .FastCursor import FastCursor
+from .StreamingCursor import StreamingCursor
+from .Memo import Memo
+from .DeferredAction import replay
+from .LocatedTokens import LocatedTokens
 from .ParsingError import ParsingError
 
 
-def parse(parser, tokens):
-    c = Cursor(tokens)
-    if parser.apply(c):
-        if c.finished:
-            return c.value
+def parse(parser, tokens, memoize=False, optimistic=False, streaming=False, deferred=False):
+    # With optimistic=True, tokens are first parsed without error bookkeeping, and parsed again with it only if
+    # this first pass fails. tokens must then support being parsed twice.
+    # With streaming=True, tokens can be any iterable, and are not kept in memory longer than needed.
+    # With deferred=True, match functions are called only once the whole parse has succeeded (see Cursor).
+    if streaming:
+        assert not optimistic
+        return parseWithCursor(parser, StreamingCursor(tokens, _makeMemo(memoize), deferred))
+    if optimistic:
+        c = FastCursor(tokens, _makeFirstPassMemo(memoize), deferred)
+        if c.apply(parser) and c.finished:
+            return _result(c)
+    return parseWithCursor(parser, Cursor(tokens, _makeMemo(memoize), deferred))
+
+
+def parseWithCursor(parser, cursor):
+    if cursor.apply(parser):
+        if cursor.finished:
+            return _result(cursor)
         else:
-            raise ParsingError("Syntax error", *c.error)
+            raise _error(cursor)
+    else:
+        raise _error(cursor)
+
+
+def _result(cursor):
+    if cursor.deferred:
+        return replay(cursor.value)
+    else:
+        return cursor.value
+
+
+def _error(cursor):
+    position, expected = cursor.error
+    tokens = cursor._tokens
+    return ParsingError("Syntax error", position, expected, tokens if isinstance(tokens, LocatedTokens) else None)
+
+
+def _makeMemo(memoize):
+    # memoize can be False, True (unbounded memo), a maximum number of entries, or a Memo-like object
+    if memoize is False or memoize is None:
+        return None
+    elif memoize is True:
+        return Memo()
+    elif isinstance(memoize, int):
+        return Memo(memoize)
+    else:
+        return memoize
+
+
+def _makeFirstPassMemo(memoize):
+    # The first pass of optimistic parsing records no failures, so its memo entries can't be reused by the second
+    # pass: a Memo-like object is replaced by a Memo of the same maxSize
+    if memoize is None or isinstance(memoize, int):
+        return _makeMemo(memoize)
     else:
-        raise ParsingError("Syntax error", *c.error)
+        return Memo(getattr(memoize, "maxSize", None))
@@ -0,0 +1,75 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+import importlib
+import itertools
+
+from .ParseFunction import parse
+from .ParsingError import ParsingError
+
+
+def parseMany(parser, inputs, workers=1, chunkSize=256, **options):
+    # Yields, in order, the value parsed from each input, or the ParsingError it raised. options are passed to parse.
+    # With workers > 1, chunks of inputs are parsed in a pool of worker processes. parser must then be the name
+    # "module:attribute" of a parser, because parser graphs are generally not picklable (match functions can be
+    # lambdas): each worker imports it once. Batches of a single chunk are parsed in this process.
+    if workers > 1:
+        _checkName(parser)
+    inputs = iter(inputs)
+    chunk = list(itertools.islice(inputs, chunkSize))
+    if workers == 1 or len(chunk) < chunkSize:
+        parser = _resolve(parser)
+        while chunk:
+            for result in _parseChunk(parser, chunk, options):
+                yield result
+            chunk = list(itertools.islice(inputs, chunkSize))
+    else:
+        import concurrent.futures  # Not needed in serial mode
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            # Bounded, so that inputs are consumed as results are yielded
+            pending = collections.deque()
+            while chunk or pending:
+                while chunk and len(pending) < 2 * workers:
+                    pending.append(executor.submit(_parseChunkInWorker, parser, chunk, options))
+                    chunk = list(itertools.islice(inputs, chunkSize))
+                for result in pending.popleft().result():
+                    yield result
+
+
+def _parseChunk(parser, chunk, options):
+    results = []
+    for tokens in chunk:
+        try:
+            results.append(parse(parser, tokens, **options))
+        except ParsingError as e:
+            results.append(e)
+    return results
+
+
+_workerParsers = {}
+
+
+def _parseChunkInWorker(name, chunk, options):
+    parser = _workerParsers.get(name)
+    if parser is None:
+        parser = _workerParsers[name] = _resolve(name)
+    return _parseChunk(parser, chunk, options)
+
+
+def _isName(parser):
+    return isinstance(parser, str)
+
+
+def _checkName(parser):
+    if not _isName(parser):
+        raise TypeError("With several workers, the parser must be given as a 'module:attribute' name")
+
+
+def _resolve(parser):
+    if _isName(parser):
+        module, attribute = parser.split(":")
+        return getattr(importlib.import_module(module), attribute)
+    else:
+        return parser
@@ -0,0 +1,88 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .LocatedTokens import LocatedTokens
+from .ParseFunction import parse
+from .ParseManyFunction import _checkName, _resolve
+from .ParsingError import ParsingError
+from .RepeatedParser import RepeatedParser
+
+
+def parseSharded(record, tokens, isBoundary, match=lambda x: x, workers=1, shardSize=4096, **options):
+    # Same value and ParsingError as parse(RepeatedParser(record, match), tokens, **options), for inputs made of
+    # independent records. tokens are split into shards of about shardSize tokens, after tokens accepted by
+    # isBoundary, and shards are parsed separately, in a pool of worker processes when workers > 1 (record must then
+    # be a "module:attribute" name, see parseMany).
+    # Boundaries must be safe: a record never extends past a boundary token, and never looks at the tokens after it
+    # (like the ";" that terminates a rule in EBNF).
+    # A shard that fails before its end fails exactly like the whole input would. A shard that fails at its end
+    # may be missing the tokens that follow it, so the tokens from its start are then parsed again in this process.
+    if workers > 1:
+        _checkName(record)
+    if not isinstance(tokens, LocatedTokens):
+        tokens = list(tokens)
+    starts = _shardStarts(tokens, isBoundary, shardSize)
+    shards = [tokens[start:end] for start, end in zip(starts, starts[1:] + [len(tokens)])]
+    values = []
+    for index, result in enumerate(_parseShards(record, shards, workers, options)):
+        start = starts[index]
+        if isinstance(result, ParsingError):
+            if result.position == len(shards[index]) and index < len(shards) - 1:
+                result = _parseShard(_resolve(record), tokens[start:], options)
+            if isinstance(result, ParsingError):
+                raise ParsingError(
+                    result.message, start + result.position, result.expected,
+                    tokens if isinstance(tokens, LocatedTokens) else None
+                )
+            values += result
+            break
+        values += result
+    return match(values)
+
+
+def _shardStarts(tokens, isBoundary, shardSize):
+    starts = [0]
+    for position, token in enumerate(tokens):
+        if position + 1 - starts[-1] >= shardSize and position + 1 < len(tokens) and isBoundary(token):
+            starts.append(position + 1)
+    return starts
+
+
+def _parseShards(record, shards, workers, options):
+    # Yields the result of each shard, in order, until the first ParsingError
+    if workers == 1 or len(shards) == 1:
+        record = _resolve(record)
+        for shard in shards:
+            result = _parseShard(record, shard, options)
+            yield result
+            if isinstance(result, ParsingError):
+                return
+    else:
+        import concurrent.futures  # Not needed in serial mode
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            futures = [executor.submit(_parseShardInWorker, record, shard, options) for shard in shards]
+            for future in futures:
+                result = future.result()
+                yield result
+                if isinstance(result, ParsingError):
+                    for pending in futures:
+                        pending.cancel()
+                    return
+
+
+def _parseShard(record, shard, options):
+    try:
+        return parse(RepeatedParser(record), shard, **options)
+    except ParsingError as e:
+        return e
+
+
+_workerRecords = {}
+
+
+def _parseShardInWorker(name, shard, options):
+    record = _workerRecords.get(name)
+    if record is None:
+        record = _workerRecords[name] = _resolve(name)
+    return _parseShard(record, shard, options)
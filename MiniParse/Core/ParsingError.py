@@ -4,8 +4,32 @@
 
 
 class ParsingError(Exception):
-    def __init__(self, message, position, expected):
+    # locations is anything with a lineAndColumn(position) method, like LocatedTokens or SourceLocations. line and
+    # column are computed from it on first access, and are None without it. locations is not pickled (it can hold
+    # all the tokens, and parseMany returns errors from worker processes).
+    def __init__(self, message, position, expected, locations=None):
         Exception.__init__(self, message, position, expected)
         self.message = message
         self.position = position
         self.expected = expected
+        self.__locations = locations
+        self.__lineAndColumn = None
+
+    def __reduce__(self):
+        return (ParsingError, self.args)
+
+    @property
+    def line(self):
+        return self.__getLineAndColumn()[0]
+
+    @property
+    def column(self):
+        return self.__getLineAndColumn()[1]
+
+    def __getLineAndColumn(self):
+        if self.__lineAndColumn is None:
+            if self.__locations is None:
+                self.__lineAndColumn = (None, None)
+            else:
+                self.__lineAndColumn = self.__locations.lineAndColumn(self.position)
+        return self.__lineAndColumn
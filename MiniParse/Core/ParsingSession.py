@@ -0,0 +1,34 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Cursor import Cursor
+from .IncrementalMemo import IncrementalMemo
+from .ParseFunction import parseWithCursor
+
+
+class ParsingSession:
+    # Parses tokens that are edited between parses. Each parse memoizes the results of all parsers, and an edit
+    # discards only the results that depend on the edited tokens, so the next parse reuses all others.
+    # Values and errors are the same as parse(parser, tokens) on the edited tokens.
+    def __init__(self, parser, tokens):
+        self.__parser = parser
+        self.__tokens = list(tokens)
+        self.__memo = IncrementalMemo()
+
+    @property
+    def tokens(self):
+        return list(self.__tokens)
+
+    @property
+    def memo(self):
+        return self.__memo
+
+    def parse(self):
+        return parseWithCursor(self.__parser, Cursor(self.__tokens, self.__memo))
+
+    def edit(self, start, removedCount, insertedTokens):
+        assert 0 <= start and start + removedCount <= len(self.__tokens)
+        insertedTokens = list(insertedTokens)
+        self.__tokens[start:start + removedCount] = insertedTokens
+        self.__memo.edit(start, removedCount, len(insertedTokens))
@@ -0,0 +1,69 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+LITERAL = 0
+SET = 1
+SEQUENCE = 2
+ALTERNATIVE = 3
+OPTIONAL = 4
+REPEATED = 5
+REPETITION = 6
+RESTRICTION = 7
+RULE = 8
+FOREIGN = 9
+
+
+class Program:
+    # A parser graph flattened into instructions: tuples whose first item is one of the kinds above, referencing
+    # other instructions by index. Parsers take part by implementing instruction(program), calling one of the
+    # methods below. Other parsers are FOREIGN, and are applied on a Cursor (see MiniParse.Core.Compiler).
+
+    def __init__(self, parser):
+        self.instructions = []
+        self.__indexes = {}
+        self.__keepAlive = []
+        self.root = self.index(parser)
+
+    def index(self, parser):
+        index = self.__indexes.get(id(parser))
+        if index is None:
+            # Registered before its instruction is built, for recursive grammars
+            index = len(self.instructions)
+            self.__indexes[id(parser)] = index
+            self.__keepAlive.append(parser)  # So that its id is not reused
+            self.instructions.append(None)
+            instruction = getattr(parser, "instruction", None)
+            if instruction is None:
+                self.instructions[index] = (FOREIGN, parser)
+            else:
+                self.instructions[index] = instruction(self)
+        return index
+
+    def literal(self, value, match):
+        return (LITERAL, value, match)
+
+    def tokenSet(self, values, match):
+        return (SET, values, match)
+
+    def sequence(self, elements, match):
+        return (SEQUENCE, tuple(self.index(element) for element in elements), match)
+
+    def alternative(self, elements, match):
+        return (ALTERNATIVE, tuple(self.index(element) for element in elements), match)
+
+    def optional(self, parser, noMatch, match):
+        return (OPTIONAL, self.index(parser), noMatch, match)
+
+    def repeated(self, parser, match):
+        return (REPEATED, self.index(parser), match)
+
+    def repetition(self, n, parser, match):
+        return (REPETITION, self.index(parser), n, match)
+
+    def restriction(self, base, exception, match):
+        return (RESTRICTION, self.index(base), self.index(exception), match)
+
+    def rule(self, parser):
+        return (RULE, self.index(parser))
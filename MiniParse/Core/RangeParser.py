@@ -0,0 +1,16 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .SetParser import SetParser
+
+
+class RangeParser(SetParser):
+    # Bounds are included. They are either integers or single characters, compared by code point.
+    # The whole range is expected on failure, so it's stored as a set.
+    def __init__(self, first, last, match=lambda x: x):
+        if isinstance(first, int):
+            values = range(first, last + 1)
+        else:
+            values = [chr(c) for c in range(ord(first), ord(last) + 1)]
+        SetParser.__init__(self, values, match)
@@ -0,0 +1,43 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Cursor import Cursor
+
+
+class _Recognizing(object):
+    # Applies the recognize method of parsers that have one, for RecognizingCursor and FastRecognizingCursor
+    _reportsRules = False
+
+    def apply(self, parser):
+        return self._applyWith(parser, _recognizer(parser))
+
+    def _applyRule(self, name, parser):
+        # Called by RuleParser.recognize
+        return self.apply(parser)
+
+
+class RecognizingCursor(_Recognizing, Cursor):
+    # A Cursor that only recognizes tokens: match functions are not called, and all values are None. Parsers that
+    # build lists of values have a recognize method, applied instead of apply, that doesn't build them.
+    # Failures are tracked as usual, so the error is the same as with a Cursor.
+    def __init__(self, tokens, memo=None):
+        Cursor.__init__(self, tokens, memo)
+        self.match = _noValue
+
+
+_recognizes = {}
+
+
+def _recognizer(parser):
+    recognizes = _recognizes.get(type(parser))
+    if recognizes is None:
+        recognizes = _recognizes[type(parser)] = hasattr(parser, "recognize")
+    if recognizes:
+        return parser.recognize
+    else:
+        return parser.apply
+
+
+def _noValue(match, *arguments):
+    return None
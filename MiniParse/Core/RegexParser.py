@@ -0,0 +1,35 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import re
+
+
+class RegexParser:
+    # A regular expression, for parsing a str, a bytes or a memoryview directly. It's matched at the current
+    # position, and match is called with the matched text. On failure, expected (the pattern by default) is
+    # expected at the current position.
+    def __init__(self, pattern, match=lambda x: x, expected=None):
+        if not hasattr(pattern, "match"):
+            pattern = re.compile(pattern)
+        self.__pattern = pattern
+        self.__match = match
+        self.__expected = pattern.pattern if expected is None else expected
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            m = cursor.advancePattern(self.__pattern)
+            if m is None:
+                return bt.expected(self.__expected)
+            else:
+                return bt.success(cursor.match(self.__match, m.group()))
+
+    def compileFunction(self, compiler):
+        return [
+            "m = %s(tokens, position)" % compiler.constant(self.__pattern.match),
+            "if m is None:",
+            "    if position >= failure[0]:",
+            "        expect(failure, position, %s)" % compiler.constant((self.__expected,)),
+            "    return FAILED",
+            "return m.end(), %s(m.group())" % compiler.constant(self.__match),
+        ]
@@ -0,0 +1,48 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import re
+
+
+class RegularParser:
+    # parser, with a regular expression that matches exactly the same characters (see
+    # MiniParse.Meta.Generable.Syntax.regularPatterns). The regular expression gives neither values nor expected
+    # sets, so it only speeds up recognition: on text, by cursors that need no values and don't track failures
+    # (the first pass of validate(optimistic=True)), the match span is used instead of applying parser. parse
+    # needs the values of the match functions, so it always applies parser: RegularParser doesn't make it faster.
+    def __init__(self, pattern, parser):
+        if not hasattr(pattern, "match"):
+            pattern = re.compile(pattern)
+        self.__pattern = pattern
+        self.__text = type(pattern.pattern)
+        self.__parser = parser
+
+    def apply(self, cursor):
+        return self.__parser.apply(cursor)
+
+    def recognize(self, cursor):
+        if cursor._tracksFailures or not isinstance(cursor._tokens, self.__text):
+            return cursor._applyRequired(self.__parser)
+        with cursor.backtracking as bt:
+            if cursor.advancePattern(self.__pattern) is None:
+                return bt.failure()
+            else:
+                return bt.success(None)
+
+    @property
+    def applyRepeatedly(self):
+        return self.__parser.applyRepeatedly  # AttributeError if parser doesn't have it
+
+    def compileFunction(self, compiler):
+        return compiler.inline(self.__parser, "position", "end", "value") + [
+            "if end < 0:",
+            "    return FAILED",
+            "return end, value",
+        ]
+
+    def instruction(self, program):
+        return program.rule(self.__parser)
+
+    def computeFirst(self, getFirst):
+        return getFirst(self.__parser)
@@ -2,14 +2,56 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .First import First
+
 
 class RepeatedParser:
+    # Primitive parsers can be applied repeatedly in a tight loop. This is known only on first apply, because
+    # parser can be a RuleParser that's not defined yet.
+    __applyRepeatedly = None
+
     def __init__(self, parser, match=lambda x: x):
         self.__parser = parser
         self.__match = match
 
     def apply(self, cursor):
-        values = []
-        while self.__parser.apply(cursor):
-            values.append(cursor.value)
-        return cursor.success(self.__match(values))
+        if self.__applyRepeatedly is None:
+            self.__applyRepeatedly = getattr(self.__parser, "applyRepeatedly", False)
+        if self.__applyRepeatedly:
+            self.__applyRepeatedly(cursor)
+            values = cursor.value
+        else:
+            values = []
+            while cursor.apply(self.__parser):
+                values.append(cursor.value)
+        return cursor.success(cursor.match(self.__match, values))
+
+    def recognize(self, cursor):
+        if self.__applyRepeatedly is None:
+            self.__applyRepeatedly = getattr(self.__parser, "applyRepeatedly", False)
+        # The tight loop would skip the RuleParser of "{Rule}"
+        if self.__applyRepeatedly and not cursor._reportsRules:
+            self.__applyRepeatedly(cursor)
+        else:
+            while cursor.apply(self.__parser):
+                pass
+        return cursor.success(None)
+
+    def compileFunction(self, compiler):
+        return ["values = []", "while True:"] + compiler.indent(
+            compiler.inline(self.__parser, "position", "end", "value") + [
+                "if end < 0:",
+                "    break",
+                "values.append(value)",
+                "position = end",
+            ]
+        ) + ["return position, %s(values)" % compiler.constant(self.__match)]
+
+    def instruction(self, program):
+        return program.repeated(self.__parser, self.__match)
+
+    def computeFirst(self, getFirst):
+        first = getFirst(self.__parser)
+        if first is None:
+            return None
+        return First(first.literals, first.classes, True, first.expected)
@@ -0,0 +1,38 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .First import First
+
+
+class RepetitionParser:
+    # Exactly n times parser
+    def __init__(self, n, parser, match=lambda x: x):
+        self.__n = n
+        self.__parser = parser
+        self.__match = match
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            values = []
+            for i in range(self.__n):
+                if cursor._applyRequired(self.__parser):
+                    values.append(cursor.value)
+                else:
+                    return bt.failure()
+            return bt.success(cursor.match(self.__match, values))
+
+    def recognize(self, cursor):
+        with cursor.backtracking as bt:
+            for i in range(self.__n):
+                if not cursor._applyRequired(self.__parser):
+                    return bt.failure()
+            return bt.success(None)
+
+    def instruction(self, program):
+        return program.repetition(self.__n, self.__parser, self.__match)
+
+    def computeFirst(self, getFirst):
+        if self.__n == 0:
+            return First([], [], True, [])
+        return getFirst(self.__parser)
@@ -0,0 +1,30 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class RestrictionParser:
+    # What base matches, except when exception matches exactly the same tokens.
+    # exception is only a lookahead: what it accepts or expects is not reported in the furthest failure.
+    def __init__(self, base, exception, match=lambda x: x):
+        self.__base = base
+        self.__exception = exception
+        self.__match = match
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            excludedEnd = None
+            maxPosition, expected = cursor._maxPosition, cursor._expected
+            cursor._maxPosition, cursor._expected = -1, None
+            with cursor.backtracking as lookahead:
+                if cursor.apply(self.__exception):
+                    excludedEnd = cursor.position
+                lookahead.failure()
+            cursor._maxPosition, cursor._expected = maxPosition, expected
+            if cursor.apply(self.__base) and cursor.position != excludedEnd:
+                return bt.success(cursor.match(self.__match, cursor.value))
+            else:
+                return bt.failure()
+
+    def instruction(self, program):
+        return program.restriction(self.__base, self.__exception, self.__match)
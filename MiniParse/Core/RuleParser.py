@@ -0,0 +1,42 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+
+class RuleParser:
+    # A named parser, defined after its creation so that rules can reference each other.
+    def __init__(self, name):
+        self.__name = name
+        self.__parser = None
+
+    @property
+    def name(self):
+        return self.__name
+
+    def define(self, parser):
+        assert self.__parser is None
+        self.__parser = parser
+
+    def apply(self, cursor):
+        return self.__parser.apply(cursor)
+
+    def recognize(self, cursor):
+        # So that the definition is recognized too, and so that the cursor knows about rules
+        return cursor._applyRule(self.__name, self.__parser)
+
+    @property
+    def applyRepeatedly(self):
+        return self.__parser.applyRepeatedly  # AttributeError if the definition doesn't have it
+
+    def compileFunction(self, compiler):
+        return compiler.inline(self.__parser, "position", "end", "value") + [
+            "if end < 0:",
+            "    return FAILED",
+            "return end, value",
+        ]
+
+    def instruction(self, program):
+        return program.rule(self.__parser)
+
+    def computeFirst(self, getFirst):
+        return getFirst(self.__parser)
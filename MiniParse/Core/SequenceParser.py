@@ -2,6 +2,8 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+from .First import First
+
 
 class SequenceParser:
     def __init__(self, elements, match=None):
@@ -12,11 +14,51 @@ class SequenceParser:
         with cursor.backtracking as bt:
             values = []
             for element in self.__elements:
-                if element.apply(cursor):
+                if cursor._applyRequired(element):
                     values.append(cursor.value)
                 else:
                     return bt.failure()
-            if self.__match is None:
-                return bt.success(tuple(values))
-            else:
-                return bt.success(self.__match(*values))
+            return bt.success(cursor.match(self.__match, *values))
+
+    def recognize(self, cursor):
+        with cursor.backtracking as bt:
+            for element in self.__elements:
+                if not cursor._applyRequired(element):
+                    return bt.failure()
+            return bt.success(None)
+
+    def compileFunction(self, compiler):
+        lines = []
+        position = "position"
+        values = []
+        for element in self.__elements:
+            end = compiler.variable("end")
+            value = compiler.variable("value")
+            lines += compiler.inline(element, position, end, value)
+            lines += ["if %s < 0:" % end, "    return FAILED"]
+            position = end
+            values.append(value)
+        if self.__match is None:
+            result = "(%s)" % "".join(value + ", " for value in values)
+        else:
+            result = "%s(%s)" % (compiler.constant(self.__match), ", ".join(values))
+        lines.append("return %s, %s" % (position, result))
+        return lines
+
+    def instruction(self, program):
+        return program.sequence(self.__elements, self.__match)
+
+    def computeFirst(self, getFirst):
+        literals = set()
+        classes = ()
+        expected = set()
+        for element in self.__elements:
+            first = getFirst(element)
+            if first is None:
+                return None
+            literals.update(first.literals)
+            classes += first.classes
+            expected.update(first.expected)
+            if not first.nullable:
+                return First(literals, classes, False, expected)
+        return First(literals, classes, True, expected)
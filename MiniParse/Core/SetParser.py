@@ -0,0 +1,66 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .First import First
+
+
+class SetParser:
+    def __init__(self, values, match=lambda x: x):
+        self.__values = frozenset(values)
+        self.__match = match
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            if not cursor.finished:
+                token = cursor.current
+                try:
+                    accepted = token in self.__values
+                except TypeError:  # Unhashable token
+                    accepted = False
+                if accepted:
+                    cursor.advance()
+                    return bt.success(cursor.match(self.__match, token))
+            cursor.addExpected(self.__values)
+            return bt.failure()
+
+    def applyRepeatedly(self, cursor):
+        # Same as applying self until it fails, in a single backtracking frame
+        with cursor.backtracking as bt:
+            try:
+                tokens = cursor.advanceWhile(self.__values.__contains__)
+            except TypeError:  # Unhashable token, scan again more carefully
+                tokens = cursor.advanceWhile(self.__accepts)
+            cursor.addExpected(self.__values)
+            match = self.__match
+            return bt.success([cursor.match(match, token) for token in tokens])
+
+    def __accepts(self, token):
+        try:
+            return token in self.__values
+        except TypeError:
+            return False
+
+    def compileInline(self, compiler, position, end, value):
+        values = compiler.constant(self.__values)
+        return [
+            "%s = -1" % end,
+            "if %s < length:" % position,
+            "    %s = tokens[%s]" % (value, position),
+            "    try:",
+            "        if %s in %s:" % (value, values),
+            "            %s = %s + 1" % (end, position),
+            "    except TypeError:",
+            "        pass",
+            "if %s < 0:" % end,
+            "    if %s >= failure[0]:" % position,
+            "        expect(failure, %s, %s)" % (position, values),
+            "else:",
+            "    %s = %s(%s)" % (value, compiler.constant(self.__match), value),
+        ]
+
+    def instruction(self, program):
+        return program.tokenSet(self.__values, self.__match)
+
+    def computeFirst(self, getFirst):
+        return First(self.__values, [], False, self.__values)
@@ -0,0 +1,27 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import bisect
+import re
+
+_newLine = re.compile("\n")
+
+
+class SourceLocations:
+    # Line and column (both counted from 0) of offsets in a text. The offsets where lines start are found on the
+    # first lookup only, and each lookup is then a binary search in them.
+    def __init__(self, text):
+        self.__text = text
+        self.__lineStarts = None
+
+    @property
+    def text(self):
+        return self.__text
+
+    def lineAndColumn(self, offset):
+        assert 0 <= offset <= len(self.__text)
+        if self.__lineStarts is None:
+            self.__lineStarts = [0] + [m.end() for m in _newLine.finditer(self.__text)]
+        line = bisect.bisect_right(self.__lineStarts, offset) - 1
+        return line, offset - self.__lineStarts[line]
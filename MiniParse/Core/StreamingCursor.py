@@ -0,0 +1,132 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .Cursor import Cursor
+
+
+class StreamingCursor(Cursor):
+    # A Cursor over any iterable. Tokens are pulled when needed, and released when they can't be revisited.
+    # A frame is "fatal" when its failure can only make the whole parse fail: it's opened directly by a fatal
+    # application of a parser (not inside another frame of the same application, like the lookahead of a
+    # RestrictionParser). The outermost application is fatal, and so are the applications with _applyRequired (by a
+    # SequenceParser, a RepetitionParser or a RuleParser) directly in a fatal frame, or in a fatal application that
+    # has no frame. Backtracking can only return to the start of a recoverable frame, so tokens before the start of
+    # the outermost recoverable frame (or before the current position when there is none) are released. So a
+    # repetition of small items is parsed in bounded memory, even when it's nested in sequences and rules.
+    # This relies on parsers failing in a backtracking frame when they have consumed tokens, like all MiniParse
+    # parsers.
+
+    def __init__(self, tokens, memo=None, deferred=False):
+        Cursor.__init__(self, None, memo, deferred)
+        self.__tokens = iter(tokens)
+        self.__exhausted = False
+        self.__buffer = []
+        self.__offset = 0  # Position of self.__buffer[0]
+        self.__peakBufferSize = 0
+        self.__root = True
+        self.__fatal = True  # Whether the current application is fatal
+        self.__entryDepth = 0  # Number of open frames when the current application started
+        self.__fatalFrames = []  # For each open frame
+        self.__outermostRecoverableFrame = None  # Its depth
+
+    def apply(self, parser):
+        if self.__root:
+            # Applied by parseWithCursor
+            self.__root = False
+            return self._applyRequired(parser)
+        return self.__applyIn(False, parser)
+
+    def _applyRequired(self, parser):
+        if self._depth == self.__entryDepth:
+            fatal = self.__fatal
+        else:
+            fatal = self.__fatalFrames[-1]
+        return self.__applyIn(fatal, parser)
+
+    def __applyIn(self, fatal, parser):
+        context = (self.__fatal, self.__entryDepth)
+        self.__fatal = fatal
+        self.__entryDepth = self._depth
+        success = self._applyParser(parser)
+        self.__fatal, self.__entryDepth = context
+        return success
+
+    def _applyParser(self, parser):
+        return Cursor.apply(self, parser)
+
+    @property
+    def bufferSize(self):
+        return len(self.__buffer)
+
+    @property
+    def peakBufferSize(self):
+        return self.__peakBufferSize
+
+    @property
+    def current(self):
+        assert not self.finished
+        return self.__buffer[self._position - self.__offset]
+
+    @property
+    def finished(self):
+        if self._position - self.__offset < len(self.__buffer):
+            return False
+        if not self.__exhausted:
+            try:
+                token = next(self.__tokens)
+            except StopIteration:
+                self.__exhausted = True
+            else:
+                self.__buffer.append(token)
+                self.__peakBufferSize = max(self.__peakBufferSize, len(self.__buffer))
+                return False
+        return True
+
+    def advanceWhile(self, accepts):
+        assert self._depth > 0
+        tokens = []
+        while not self.finished:
+            token = self.current
+            if not accepts(token):
+                break
+            tokens.append(token)
+            self._position += 1
+        return tokens
+
+    def skipWhile(self, accepts):
+        assert self._depth > 0
+        start = self._position
+        while not self.finished and accepts(self.current):
+            self._position += 1
+        return self._position - start
+
+    def _pushBacktracking(self):
+        fatal = self.__fatal and self._depth == self.__entryDepth
+        if not fatal and self.__outermostRecoverableFrame is None:
+            self.__outermostRecoverableFrame = self._depth
+        self.__fatalFrames.append(fatal)
+        Cursor._pushBacktracking(self)
+
+    def _popBacktracking(self):
+        self.__fatalFrames.pop()
+        Cursor._popBacktracking(self)
+        if self.__outermostRecoverableFrame == self._depth:
+            self.__outermostRecoverableFrame = None
+        if self.__outermostRecoverableFrame is None:
+            self._release(self._position)
+        else:
+            self._release(self._starts[self.__outermostRecoverableFrame])
+
+    @property
+    def _recoverable(self):
+        # Whether backtracking can return before the current position
+        return self.__outermostRecoverableFrame is not None
+
+    def _release(self, position):
+        # Tokens before position will not be revisited
+        released = position - self.__offset
+        # Releasing only when at least half of the buffer can go keeps the cost amortized
+        if released > 0 and 2 * released >= len(self.__buffer):
+            del self.__buffer[:released]
+            self.__offset = position
@@ -0,0 +1,36 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .First import First
+
+
+class TextLiteralParser:
+    # A literal of several characters, for parsing a str, a bytes or a memoryview directly: value is a str or a
+    # bytes, matched against the characters at the current position. It is expected as a whole on failure.
+    def __init__(self, value, match=None):
+        assert len(value) > 0
+        self.__value = value
+        self.__match = match or value
+
+    def apply(self, cursor):
+        with cursor.backtracking as bt:
+            if cursor.advanceText(self.__value):
+                return bt.success(self.__match)
+            else:
+                return bt.expected(self.__value)
+
+    def compileInline(self, compiler, position, end, value):
+        return [
+            "if not tokens[%s:%s + %d] != %s:" % (position, position, len(self.__value), compiler.constant(self.__value)),
+            "    %s = %s + %d" % (end, position, len(self.__value)),
+            "    %s = %s" % (value, compiler.constant(self.__match)),
+            "else:",
+            "    %s = -1" % end,
+            "    if %s >= failure[0]:" % position,
+            "        expect(failure, %s, %s)" % (position, compiler.constant((self.__value,))),
+        ]
+
+    def computeFirst(self, getFirst):
+        # value[0] is a character of a str, and an int of a bytes, like the tokens of the text
+        return First([self.__value[0]], [], False, [self.__value])
@@ -0,0 +1,19 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from .ParseFunction import parseWithCursor, _makeMemo, _makeFirstPassMemo
+from .RecognizingCursor import RecognizingCursor
+from .FastRecognizingCursor import FastRecognizingCursor
+
+
+def validate(parser, tokens, memoize=False, optimistic=False):
+    # Checks that parser accepts tokens, without building any value: returns None, or raises the same ParsingError
+    # as parse.
+    # With optimistic=True, tokens are first recognized without error bookkeeping, using the regular expressions of
+    # RegularParsers, and recognized again with it only if this first pass fails.
+    if optimistic:
+        c = FastRecognizingCursor(tokens, _makeFirstPassMemo(memoize))
+        if c.apply(parser) and c.finished:
+            return
+    parseWithCursor(parser, RecognizingCursor(tokens, _makeMemo(memoize)))
@@ -0,0 +1,66 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import array
+
+from .ParseFunction import parse
+from .ParsingError import ParsingError
+from .LiteralParser import LiteralParser
+from .SetParser import SetParser
+
+
+class Vocabulary:
+    # Numbers terminals with small ints (their index in terminals), so that tokens can be stored as ids in an
+    # array("i"), a NumPy int32 array or any other buffer of C ints: 4 bytes per token instead of a Python object,
+    # and ids are compared as ints. Parsers are built on ids (see literal and set), but their values and the expected
+    # sets of the errors of self.parse are terminals.
+    def __init__(self, terminals):
+        self.__terminals = list(terminals)
+        self.__ids = dict((terminal, id) for id, terminal in enumerate(self.__terminals))
+        assert len(self.__ids) == len(self.__terminals)
+
+    def __len__(self):
+        return len(self.__terminals)
+
+    def id(self, terminal):
+        return self.__ids[terminal]
+
+    def terminal(self, id):
+        return self.__terminals[id]
+
+    def literal(self, terminal, match=None):
+        return LiteralParser(self.__ids[terminal], terminal if match is None else match)
+
+    def set(self, terminals, match=None):
+        return SetParser([self.__ids[terminal] for terminal in terminals], self.terminal if match is None else match)
+
+    def encode(self, tokens):
+        # KeyError for a token that is not a terminal
+        ids = self.__ids
+        return array.array("i", [ids[token] for token in tokens])
+
+    def view(self, buffer):
+        # A view of buffer whose items are Python ints, without copying it: a Cursor can read tokens from it.
+        # buffer can also be raw bytes holding C ints, like a multiprocessing.shared_memory.SharedMemory's buffer.
+        view = memoryview(buffer)
+        if view.format != "i":
+            assert view.itemsize in (1, array.array("i").itemsize)
+            view = view.cast("B").cast("i")
+        return view
+
+    def parse(self, parser, buffer, **options):
+        try:
+            return parse(parser, self.view(buffer), **options)
+        except ParsingError as e:
+            raise self.translate(e)
+
+    def translate(self, error):
+        # The same error, with ids replaced by terminals in its expected set (names of token classes are kept)
+        return ParsingError(error.message, error.position, set(self.__translate(expected) for expected in error.expected))
+
+    def __translate(self, expected):
+        if isinstance(expected, int) and 0 <= expected < len(self.__terminals):
+            return self.__terminals[expected]
+        else:
+            return expected
@@ -2,10 +2,31 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
-from .ParseFunction import parse
+from .ParseFunction import parse, parseWithCursor
+from .ParseManyFunction import parseMany
+from .ParseShardedFunction import parseSharded
+from .ValidateFunction import validate
+from .ParseEventsFunction import parseEvents
+from .CompileFunction import compile
+from .IterativeFunction import iterative
 from .ParsingError import ParsingError
+from .SourceLocations import SourceLocations
+from .LocatedTokens import LocatedTokens
+from .Vocabulary import Vocabulary
+from .Memo import Memo
+from .ParsingSession import ParsingSession
+from .StreamingCursor import StreamingCursor
 from .LiteralParser import LiteralParser
+from .SetParser import SetParser
+from .RangeParser import RangeParser
+from .TextLiteralParser import TextLiteralParser
+from .RegexParser import RegexParser
+from .RegularParser import RegularParser
 from .SequenceParser import SequenceParser
 from .AlternativeParser import AlternativeParser
 from .OptionalParser import OptionalParser
 from .RepeatedParser import RepeatedParser
+from .RepetitionParser import RepetitionParser
+from .RestrictionParser import RestrictionParser
+from .RuleParser import RuleParser
+from .OperatorPrecedenceParser import OperatorPrecedenceParser
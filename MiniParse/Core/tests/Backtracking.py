@@ -0,0 +1,56 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import LiteralParser, SequenceParser, AlternativeParser
+from MiniParse.Core.Cursor import Cursor
+from MiniParse.Core.StreamingCursor import StreamingCursor
+from .Framework import ParserTestCase
+
+
+class DeepNestingTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = LiteralParser(42)
+        for i in range(100):
+            self.p = SequenceParser([self.p], lambda x: x)
+
+    def testSuccess(self):
+        self.expectSuccess([42], 42)
+
+    def testFailure(self):
+        self.expectFailure([41], 0, [42])
+
+
+class BacktrackerTestCase(unittest.TestCase):
+    def testNestedFrames(self):
+        cursor = Cursor([42, 43])
+        with cursor.backtracking as bt1:
+            cursor.advance()
+            with cursor.backtracking as bt2:
+                cursor.advance()
+                bt2.failure()
+            self.assertEqual(cursor.current, 43)
+            bt1.success(None)
+        self.assertFalse(cursor.finished)
+
+    def testSkipWhile(self):
+        for cursor in [Cursor([42, 42, 43]), StreamingCursor(iter([42, 42, 43]))]:
+            with cursor.backtracking as bt:
+                self.assertEqual(cursor.skipWhile(lambda token: token == 42), 2)
+                self.assertEqual(cursor.current, 43)
+                self.assertEqual(cursor.skipWhile(lambda token: token == 42), 0)
+                bt.success(None)
+
+    def testExpectedSetIsNotMaterializedOnSuccess(self):
+        cursor = Cursor([42, 43])
+        self.assertTrue(cursor.apply(SequenceParser([LiteralParser(42), LiteralParser(43)])))
+        self.assertIsNone(cursor._expected)
+        self.assertEqual(cursor.error, (2, set()))
+
+    def testExpectedSetsAreMergedAtFurthestPosition(self):
+        cursor = Cursor([42])
+        p = AlternativeParser([SequenceParser([LiteralParser(42), LiteralParser(43)]), SequenceParser([LiteralParser(42), LiteralParser(44)])])
+        self.assertFalse(cursor.apply(p))
+        self.assertEqual(cursor.error, (1, set([43, 44])))
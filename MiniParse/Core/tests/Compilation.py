@@ -0,0 +1,116 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, validate, compile, ParsingError, LiteralParser, SetParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, RuleParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+from .Memoization import CountingParser
+
+
+class CompiledSequenceTestCase(StockParsers.SequenceTestCase):
+    def setUp(self):
+        StockParsers.SequenceTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledUnambiguousAlternativeTestCase(StockParsers.UnambiguousAlternativeTestCase):
+    def setUp(self):
+        StockParsers.UnambiguousAlternativeTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    def setUp(self):
+        StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledOptionalTestCase(StockParsers.OptionalTestCase):
+    def setUp(self):
+        StockParsers.OptionalTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledRepetitionTestCase(StockParsers.RepetitionTestCase):
+    def setUp(self):
+        StockParsers.RepetitionTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledSetTestCase(StockParsers.SetTestCase):
+    def setUp(self):
+        StockParsers.SetTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledSetRepetitionTestCase(StockParsers.SetRepetitionTestCase):
+    def setUp(self):
+        StockParsers.SetRepetitionTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class CompiledMinimalArithmetic(MinimalArithmetic):
+    # factor is not a stock parser: it's applied on a Cursor from the compiled code
+    def setUp(self):
+        MinimalArithmetic.setUp(self)
+        self.p = compile(self.p)
+
+
+class StreamingCompiledMinimalArithmetic(CompiledMinimalArithmetic):
+    parseOptions = {"streaming": True}
+
+
+class CompilationTestCase(unittest.TestCase):
+    def testRecursiveGrammar(self):
+        nested = RuleParser("nested")
+        nested.define(AlternativeParser([
+            LiteralParser("x"),
+            SequenceParser([LiteralParser("("), nested, LiteralParser(")")], match=lambda o, v, c: [v]),
+        ]))
+        p = compile(nested)
+        self.assertEqual(parse(p, "((x))"), [["x"]])
+        with self.assertRaises(ParsingError) as cm:
+            parse(p, "((x)")
+        self.assertEqual(cm.exception.position, 4)
+        self.assertEqual(cm.exception.expected, set([")"]))
+
+    def testCompiledParserInsideParser(self):
+        p = SequenceParser([compile(RepeatedParser(SetParser("ab"))), LiteralParser("c")])
+        self.assertEqual(parse(p, "abac"), (["a", "b", "a"], "c"))
+        with self.assertRaises(ParsingError) as cm:
+            parse(p, "abd")
+        self.assertEqual(cm.exception.position, 2)
+        self.assertEqual(cm.exception.expected, set(["a", "b", "c"]))
+
+    def testMatchFunctions(self):
+        p = compile(SequenceParser(
+            [
+                OptionalParser(LiteralParser("-", match=-1), noMatch=1),
+                RepeatedParser(SetParser("0123456789", match=int), match=lambda digits: sum(digits)),
+            ],
+            match=lambda sign, value: sign * value
+        ))
+        self.assertEqual(parse(p, "-123"), -6)
+        self.assertEqual(parse(p, "45"), 9)
+
+    def testForeignParsersUseTheMemo(self):
+        x = CountingParser(LiteralParser("x"))
+        p = compile(AlternativeParser([SequenceParser([x, LiteralParser("a")]), SequenceParser([x, LiteralParser("b")])]))
+        self.assertEqual(parse(p, "xb"), ("x", "b"))
+        self.assertEqual(len(x.calls), 2)
+        del x.calls[:]
+        self.assertEqual(parse(p, "xb", memoize=True), ("x", "b"))
+        self.assertEqual(len(x.calls), 1)
+
+    def testForeignParsersBuildValuesForCompiledCode(self):
+        x = CountingParser(LiteralParser("x", match=1))
+        p = compile(SequenceParser([x, LiteralParser("y", match=2)], match=lambda a, b: a + b))
+        self.assertEqual(parse(p, "xy", deferred=True), 3)
+        self.assertIsNone(validate(p, "xy"))
+        with self.assertRaises(ParsingError) as cm:
+            validate(p, "xz")
+        self.assertEqual(cm.exception.position, 1)
+        self.assertEqual(cm.exception.expected, set(["y"]))
@@ -0,0 +1,115 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, ParsingError, LiteralParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, RuleParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+from . import OperatorPrecedence
+
+
+class DeferredSequenceTestCase(StockParsers.SequenceTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredOptionalTestCase(StockParsers.OptionalTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredRepetitionTestCase(StockParsers.RepetitionTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredSetRepetitionTestCase(StockParsers.SetRepetitionTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredExactRepetitionTestCase(StockParsers.ExactRepetitionTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredRestrictionTestCase(StockParsers.RestrictionTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"deferred": True}
+
+
+class DeferredMemoizedMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"deferred": True, "memoize": True}
+
+
+class DeferredOptimisticMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"deferred": True, "optimistic": True}
+
+
+class DeferredStreamingMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"deferred": True, "streaming": True}
+
+
+class DeferredOperatorPrecedenceTestCase(OperatorPrecedence.OperatorPrecedenceTestCase):
+    parseOptions = {"deferred": True}
+
+
+class DeferredParsingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def make(name):
+            def match(*args):
+                self.calls.append(name)
+                return (name,) + args
+            return match
+
+        # "a b" is recognized by the first alternative of item before it fails on "c"
+        item = AlternativeParser(
+            [
+                SequenceParser([LiteralParser("a"), LiteralParser("b"), LiteralParser("c")], make("abc")),
+                SequenceParser([LiteralParser("a"), LiteralParser("b")], make("ab")),
+            ],
+            make("item")
+        )
+        self.p = RepeatedParser(item, make("items"))
+
+    def testMatchesAreCalledOnWinningParseOnly(self):
+        self.assertEqual(
+            parse(self.p, ["a", "b", "a", "b", "c"], deferred=True),
+            ("items", [("item", ("ab", "a", "b")), ("item", ("abc", "a", "b", "c"))])
+        )
+        self.assertEqual(self.calls, ["ab", "item", "abc", "item", "items"])
+
+    def testSameValueAsImmediateMatches(self):
+        self.assertEqual(
+            parse(self.p, ["a", "b", "a", "b", "c"], deferred=True),
+            parse(self.p, ["a", "b", "a", "b", "c"])
+        )
+
+    def testNoMatchIsCalledOnFailure(self):
+        with self.assertRaises(ParsingError):
+            parse(self.p, ["a", "b", "a"], deferred=True)
+        self.assertEqual(self.calls, [])
+
+    def testMemoizedActionsAreReplayedOnce(self):
+        p = AlternativeParser([SequenceParser([self.p, LiteralParser("x")]), self.p])
+        self.assertEqual(
+            parse(p, ["a", "b"], deferred=True, memoize=True),
+            ("items", [("item", ("ab", "a", "b"))])
+        )
+        self.assertEqual(self.calls, ["ab", "item", "items"])
+
+    def testConstantValuesKeepTheirIdentity(self):
+        nothing = []
+        p = SequenceParser([OptionalParser(LiteralParser("a"), nothing), LiteralParser("b")])
+        self.assertIs(parse(p, ["b"], deferred=True)[0], nothing)
+
+    def testDeepNesting(self):
+        p = RuleParser("p")
+        p.define(AlternativeParser([SequenceParser([LiteralParser("("), p, LiteralParser(")")], lambda l, v, r: v + 1), LiteralParser("x", 1)]))
+        self.assertEqual(parse(p, ["("] * 100 + ["x"] + [")"] * 100, deferred=True), 101)
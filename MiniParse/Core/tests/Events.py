@@ -0,0 +1,140 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parseEvents, parseWithCursor, parse, compile, ParsingError, LiteralParser, SetParser, SequenceParser, AlternativeParser, RepeatedParser, RestrictionParser, RuleParser
+from MiniParse.Core.EventCursor import EventCursor
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+
+    def enterRule(self, name, position):
+        self.events.append(("enter", name, position))
+
+    def token(self, token, position):
+        self.events.append(("token", token, position))
+
+    def exitRule(self, name, position):
+        self.events.append(("exit", name, position))
+
+
+class ParseEventsTestCase(unittest.TestCase):
+    def setUp(self):
+        # Document = {Record}, ";"
+        # Record = Key, ("=", Value | "?")
+        # Key = {letter}-
+        # Value = Key | digit
+        self.document = RuleParser("Document")
+        record = RuleParser("Record")
+        key = RuleParser("Key")
+        value = RuleParser("Value")
+        letter = SetParser("abc")
+        self.document.define(SequenceParser([RepeatedParser(record), LiteralParser(";")]))
+        record.define(SequenceParser([key, AlternativeParser([SequenceParser([LiteralParser("="), value]), LiteralParser("?")])]))
+        key.define(SequenceParser([letter, RepeatedParser(letter)]))
+        value.define(AlternativeParser([key, SetParser("0123456789")]))
+
+    def testEvents(self):
+        recorder = Recorder()
+        self.assertIsNone(parseEvents(self.document, "a=1bc?;", recorder))
+        self.assertEqual(
+            recorder.events,
+            [
+                ("enter", "Document", 0),
+                ("enter", "Record", 0),
+                ("enter", "Key", 0), ("token", "a", 0), ("exit", "Key", 1),
+                ("token", "=", 1),
+                # Value's first alternative, Key, failed on "1": its enter event was discarded
+                ("enter", "Value", 2), ("token", "1", 2), ("exit", "Value", 3),
+                ("exit", "Record", 3),
+                ("enter", "Record", 3),
+                ("enter", "Key", 3), ("token", "b", 3), ("token", "c", 4), ("exit", "Key", 5),
+                ("token", "?", 5),
+                ("exit", "Record", 6),
+                ("token", ";", 6),
+                ("exit", "Document", 7),
+            ]
+        )
+
+    def testBacktrackedEventsAreDiscarded(self):
+        # "a" "=" is recognized by the first alternative before it fails
+        p = RuleParser("p")
+        p.define(AlternativeParser([
+            SequenceParser([self.document, LiteralParser("!")]),
+            self.document,
+        ]))
+        recorder = Recorder()
+        parseEvents(p, "a?;", recorder)
+        self.assertEqual(
+            recorder.events,
+            [
+                ("enter", "p", 0),
+                ("enter", "Document", 0),
+                ("enter", "Record", 0),
+                ("enter", "Key", 0), ("token", "a", 0), ("exit", "Key", 1),
+                ("token", "?", 1),
+                ("exit", "Record", 2),
+                ("token", ";", 2),
+                ("exit", "Document", 3),
+                ("exit", "p", 3),
+            ]
+        )
+
+    def testSameErrorAsParse(self):
+        for tokens in ["", "a", "a=", "a=1", "a=1b", "a=1b?;x", "1"]:
+            with self.assertRaises(ParsingError) as parsed:
+                parse(self.document, tokens)
+            with self.assertRaises(ParsingError) as evented:
+                parseEvents(self.document, tokens, Recorder())
+            self.assertEqual(evented.exception.args, parsed.exception.args)
+
+    def testEventsAreDeliveredAsParsingCommits(self):
+        recorder = Recorder()
+        lags = []
+
+        def tokens():
+            for i in range(1000):
+                lags.append(i - len([event for event in recorder.events if event[0] == "token"]))
+                yield "ab=1"[i % 4]
+            yield ";"
+
+        parseEvents(self.document, tokens(), recorder)
+        # Tokens of a Record are delivered before the tokens of the next Record are pulled
+        self.assertEqual(len(lags), 1000)
+        self.assertLessEqual(max(lags), 4)
+        self.assertEqual(len(recorder.events), 6 * 250 + 1001 + 2)
+
+    def testTokensAreReleased(self):
+        cursor = EventCursor(iter("ab=1" * 1000 + ";"), Recorder())
+        parseWithCursor(self.document, cursor)
+        self.assertLessEqual(cursor.peakBufferSize, 8)
+
+    def testCompiledParserIsAppliedAsOriginalParser(self):
+        expected = Recorder()
+        parseEvents(self.document, "a=1bc?;", expected)
+        actual = Recorder()
+        parseEvents(compile(self.document), "a=1bc?;", actual)
+        self.assertEqual(actual.events, expected.events)
+
+    def testRestrictionLookaheadIsBacktracked(self):
+        # The exception's events are discarded, and its tokens are not released before the base is applied
+        e = RuleParser("E")
+        e.define(RepeatedParser(SetParser("ab")))
+        x = RuleParser("X")
+        x.define(LiteralParser("a"))
+        p = SequenceParser([RestrictionParser(e, x), LiteralParser(";")])
+        recorder = Recorder()
+        self.assertIsNone(parseEvents(p, iter("ab;"), recorder))
+        self.assertEqual(
+            recorder.events,
+            [("enter", "E", 0), ("token", "a", 0), ("token", "b", 1), ("exit", "E", 2), ("token", ";", 2)]
+        )
+        with self.assertRaises(ParsingError) as parsed:
+            parse(p, "a;")
+        with self.assertRaises(ParsingError) as evented:
+            parseEvents(p, iter("a;"), Recorder())
+        self.assertEqual(evented.exception.args, parsed.exception.args)
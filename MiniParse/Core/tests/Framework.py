@@ -8,12 +8,14 @@ from MiniParse import parse, ParsingError
 
 
 class ParserTestCase(unittest.TestCase):
+    parseOptions = {}
+
     def expectSuccess(self, input, value):
-        self.assertEqual(parse(self.p, input), value)
+        self.assertEqual(parse(self.p, input, **self.parseOptions), value)
 
     def expectFailure(self, input, position, expected):
         with self.assertRaises(ParsingError) as cm:
-            parse(self.p, input)
+            parse(self.p, input, **self.parseOptions)
         self.assertEqual(cm.exception.message, "Syntax error")
         self.assertEqual(cm.exception.position, position)
         self.assertEqual(cm.exception.expected, set(expected))
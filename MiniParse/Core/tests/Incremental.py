@@ -0,0 +1,103 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import random
+import unittest
+
+from MiniParse import parse, ParsingSession, ParsingError, LiteralParser, SetParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, RuleParser
+from MiniParse.Core.IncrementalMemo import IncrementalMemo
+from .Memoization import CountingParser
+
+
+class ParsingSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        # Nested lists of digits: [1,[2,3],[]]
+        self.digit = CountingParser(SetParser("0123456789", int))
+        value = RuleParser("value")
+        items = SequenceParser(
+            [value, RepeatedParser(SequenceParser([LiteralParser(","), value], lambda comma, v: v))],
+            lambda first, others: [first] + others
+        )
+        value.define(AlternativeParser([
+            self.digit,
+            SequenceParser([LiteralParser("["), OptionalParser(items, []), LiteralParser("]")], lambda o, v, c: v),
+        ]))
+        self.p = value
+
+    def expectSameAsParse(self, session):
+        try:
+            expected = parse(self.p, session.tokens)
+        except ParsingError as e:
+            with self.assertRaises(ParsingError) as cm:
+                session.parse()
+            self.assertEqual((cm.exception.position, cm.exception.expected), (e.position, e.expected))
+        else:
+            self.assertEqual(session.parse(), expected)
+
+    def testParse(self):
+        session = ParsingSession(self.p, "[1,[2,3],[]]")
+        self.assertEqual(session.parse(), [1, [2, 3], []])
+
+    def testReplaceToken(self):
+        session = ParsingSession(self.p, "[1,[2,3],[]]")
+        session.parse()
+        session.edit(4, 1, "7")
+        self.assertEqual(session.tokens, list("[1,[7,3],[]]"))
+        self.assertEqual(session.parse(), [1, [7, 3], []])
+
+    def testInsertAndRemoveTokens(self):
+        session = ParsingSession(self.p, "[1,[2,3],[]]")
+        session.parse()
+        session.edit(10, 0, "4,5")
+        self.assertEqual(session.parse(), [1, [2, 3], [4, 5]])
+        session.edit(1, 8, "")
+        self.assertEqual(session.parse(), [[4, 5]])
+
+    def testErrorAfterEdit(self):
+        session = ParsingSession(self.p, "[1,[2,3],[]]")
+        session.parse()
+        session.edit(6, 1, "x")
+        with self.assertRaises(ParsingError) as cm:
+            session.parse()
+        self.assertEqual(cm.exception.position, 6)
+        self.assertEqual(cm.exception.expected, set("0123456789["))
+        session.edit(6, 1, "3")
+        self.assertEqual(session.parse(), [1, [2, 3], []])
+
+    def testAppendAtEnd(self):
+        session = ParsingSession(self.p, "[1")
+        self.expectSameAsParse(session)
+        session.edit(2, 0, "]")
+        self.assertEqual(session.parse(), [1])
+
+    def testOnlyEditedPartIsReparsed(self):
+        tokens = "[" + ",".join("[1,2,3]" for i in range(100)) + "]"
+        session = ParsingSession(self.p, tokens)
+        session.parse()
+        self.assertEqual(len(self.digit.calls), 401)  # Also tried before each "["
+        del self.digit.calls[:]
+        session.edit(len(tokens) - 3, 1, "9")
+        self.assertEqual(session.parse()[-1], [1, 2, 9])
+        self.assertEqual(len(self.digit.calls), 1)
+
+    def testRandomEdits(self):
+        r = random.Random(42)
+        for i in range(50):
+            session = ParsingSession(self.p, "[1,[2,3],[[4]],5]")
+            for j in range(10):
+                start = r.randrange(len(session.tokens) + 1)
+                removedCount = r.randrange(min(3, len(session.tokens) - start) + 1)
+                session.edit(start, removedCount, [r.choice("[],12") for k in range(r.randrange(3))])
+                self.expectSameAsParse(session)
+
+
+class ShortReachParsingSessionTestCase(ParsingSessionTestCase):
+    # Most columns are then indexed as long columns
+    def setUp(self):
+        ParsingSessionTestCase.setUp(self)
+        self.shortReach = IncrementalMemo.shortReach
+        IncrementalMemo.shortReach = 1
+
+    def tearDown(self):
+        IncrementalMemo.shortReach = self.shortReach
@@ -0,0 +1,132 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import sys
+import unittest
+
+from MiniParse import parse, iterative, ParsingError, LiteralParser, SequenceParser, AlternativeParser, RuleParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+from .Memoization import CountingParser
+
+
+class IterativeSequenceTestCase(StockParsers.SequenceTestCase):
+    def setUp(self):
+        StockParsers.SequenceTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeUnambiguousAlternativeTestCase(StockParsers.UnambiguousAlternativeTestCase):
+    def setUp(self):
+        StockParsers.UnambiguousAlternativeTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    def setUp(self):
+        StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeOptionalTestCase(StockParsers.OptionalTestCase):
+    def setUp(self):
+        StockParsers.OptionalTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeRepetitionTestCase(StockParsers.RepetitionTestCase):
+    def setUp(self):
+        StockParsers.RepetitionTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeSetTestCase(StockParsers.SetTestCase):
+    def setUp(self):
+        StockParsers.SetTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeSetRepetitionTestCase(StockParsers.SetRepetitionTestCase):
+    def setUp(self):
+        StockParsers.SetRepetitionTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeExactRepetitionTestCase(StockParsers.ExactRepetitionTestCase):
+    def setUp(self):
+        StockParsers.ExactRepetitionTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeRestrictionTestCase(StockParsers.RestrictionTestCase):
+    def setUp(self):
+        StockParsers.RestrictionTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeExceptionIsNotExpectedTestCase(StockParsers.ExceptionIsNotExpectedTestCase):
+    def setUp(self):
+        StockParsers.ExceptionIsNotExpectedTestCase.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeMinimalArithmetic(MinimalArithmetic):
+    # factor is not a stock parser: it's applied on a Cursor from the loop
+    def setUp(self):
+        MinimalArithmetic.setUp(self)
+        self.p = iterative(self.p)
+
+
+class IterativeParsingTestCase(unittest.TestCase):
+    def setUp(self):
+        nested = RuleParser("nested")
+        nested.define(AlternativeParser([
+            LiteralParser("x"),
+            SequenceParser([LiteralParser("("), nested, LiteralParser(")")], match=lambda o, v, c: [v]),
+        ]))
+        self.nested = nested
+
+    def testDeeplyNestedInput(self):
+        depth = 4 * sys.getrecursionlimit()
+        value = parse(iterative(self.nested), "(" * depth + "x" + ")" * depth)
+        for i in range(depth):
+            value, = value
+        self.assertEqual(value, "x")
+
+    def testDeeplyNestedError(self):
+        depth = 4 * sys.getrecursionlimit()
+        with self.assertRaises(ParsingError) as cm:
+            parse(iterative(self.nested), "(" * depth + "x" + ")" * (depth - 1))
+        self.assertEqual(cm.exception.position, 2 * depth)
+        self.assertEqual(cm.exception.expected, set([")"]))
+
+    def testMaxDepth(self):
+        p = iterative(self.nested, maxDepth=25)  # Two frames per level: alternative and sequence
+        self.assertEqual(parse(p, "(" * 10 + "x" + ")" * 10), [[[[[[[[[["x"]]]]]]]]]])
+        with self.assertRaises(ParsingError) as cm:
+            parse(p, "(" * 30 + "x" + ")" * 30)
+        self.assertEqual(cm.exception.message, "Maximum depth exceeded")
+        self.assertEqual(cm.exception.position, 12)
+        self.assertEqual(cm.exception.expected, set())
+
+    def testSameErrorsAsRecursiveParser(self):
+        p = iterative(self.nested)
+        for tokens in ["", "(", "((x)", "x)", "(()", "((y))", "(x))"]:
+            with self.assertRaises(ParsingError) as expected:
+                parse(self.nested, tokens)
+            with self.assertRaises(ParsingError) as actual:
+                parse(p, tokens)
+            self.assertEqual(
+                (actual.exception.position, actual.exception.expected),
+                (expected.exception.position, expected.exception.expected)
+            )
+
+    def testForeignParsersUseTheMemo(self):
+        x = CountingParser(LiteralParser("x"))
+        p = iterative(AlternativeParser([SequenceParser([x, LiteralParser("a")]), SequenceParser([x, LiteralParser("b")])]))
+        self.assertEqual(parse(p, "xb"), ("x", "b"))
+        self.assertEqual(len(x.calls), 2)
+        del x.calls[:]
+        self.assertEqual(parse(p, "xb", memoize=True), ("x", "b"))
+        self.assertEqual(len(x.calls), 1)
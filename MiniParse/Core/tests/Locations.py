@@ -0,0 +1,69 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import pickle
+import unittest
+
+from MiniParse import parse, ParsingError, SourceLocations, LocatedTokens, LiteralParser, SequenceParser, RepeatedParser
+
+
+class SourceLocationsTestCase(unittest.TestCase):
+    def testLineAndColumn(self):
+        text = "ab\nc\n\ndef"
+        locations = SourceLocations(text)
+        for offset in range(len(text) + 1):
+            lines = text[:offset].split("\n")
+            self.assertEqual(locations.lineAndColumn(offset), (len(lines) - 1, len(lines[-1])))
+
+    def testEmptyText(self):
+        self.assertEqual(SourceLocations("").lineAndColumn(0), (0, 0))
+
+
+class LocatedTokensTestCase(unittest.TestCase):
+    def setUp(self):
+        # "a b\n  a\nc" lexed
+        self.locations = SourceLocations("a b\n  a\nc")
+        self.tokens = LocatedTokens(iter([(0, "a"), (2, "b"), (6, "a"), (8, "c")]), self.locations)
+        self.p = SequenceParser([RepeatedParser(SequenceParser([LiteralParser("a"), LiteralParser("b")])), LiteralParser("a")])
+
+    def testIsTheListOfTokens(self):
+        self.assertEqual(self.tokens, ["a", "b", "a", "c"])
+
+    def testOffsets(self):
+        self.assertEqual([self.tokens.offset(i) for i in range(5)], [0, 2, 6, 8, 9])
+        self.assertEqual([self.tokens.lineAndColumn(i) for i in range(5)], [(0, 0), (0, 2), (1, 2), (2, 0), (2, 1)])
+
+    def testParsingErrorHasLineAndColumn(self):
+        with self.assertRaises(ParsingError) as cm:
+            parse(self.p, self.tokens)
+        self.assertEqual(cm.exception.args, ("Syntax error", 3, set(["b"])))
+        self.assertEqual((cm.exception.line, cm.exception.column), (2, 0))
+
+    def testParsingErrorAtEnd(self):
+        with self.assertRaises(ParsingError) as cm:
+            parse(self.p, LocatedTokens([(0, "a"), (2, "b")], self.locations))
+        self.assertEqual((cm.exception.line, cm.exception.column), (2, 1))
+
+    def testLineAndColumnAreComputedOnFirstAccess(self):
+        calls = []
+
+        class Locations:
+            def lineAndColumn(self, position):
+                calls.append(position)
+                return (position, 0)
+
+        e = ParsingError("Syntax error", 3, set(), Locations())
+        self.assertEqual(calls, [])
+        self.assertEqual((e.line, e.column, e.line), (3, 0, 3))
+        self.assertEqual(calls, [3])
+
+    def testWithoutLocations(self):
+        with self.assertRaises(ParsingError) as cm:
+            parse(self.p, ["a", "c"])
+        self.assertEqual((cm.exception.line, cm.exception.column), (None, None))
+
+    def testPickledWithoutLocations(self):
+        e = pickle.loads(pickle.dumps(ParsingError("Syntax error", 3, set(["b"]), self.tokens)))
+        self.assertEqual(e.args, ("Syntax error", 3, set(["b"])))
+        self.assertEqual(e.line, None)
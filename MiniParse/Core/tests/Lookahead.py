@@ -0,0 +1,98 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, ParsingError, LiteralParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser
+from MiniParse.Core.First import getFirst
+
+
+class CountingLiteralParser(LiteralParser):
+    def __init__(self, value):
+        LiteralParser.__init__(self, value)
+        self.calls = 0
+
+    def apply(self, cursor):
+        self.calls += 1
+        return LiteralParser.apply(self, cursor)
+
+
+class Opaque:
+    def __init__(self, parser):
+        self.parser = parser
+
+    def apply(self, cursor):
+        return cursor.apply(self.parser)
+
+
+class FirstTestCase(unittest.TestCase):
+    def testLiteral(self):
+        first = getFirst(LiteralParser(42))
+        self.assertEqual(first.literals, set([42]))
+        self.assertFalse(first.nullable)
+        self.assertEqual(first.expected, set([42]))
+
+    def testSequenceStopsAtFirstNonNullableElement(self):
+        first = getFirst(SequenceParser([OptionalParser(LiteralParser(42)), LiteralParser(43), LiteralParser(44)]))
+        self.assertEqual(first.literals, set([42, 43]))
+        self.assertFalse(first.nullable)
+        self.assertEqual(first.expected, set([42, 43]))
+
+    def testNullableSequence(self):
+        first = getFirst(SequenceParser([OptionalParser(LiteralParser(42)), RepeatedParser(LiteralParser(43))]))
+        self.assertTrue(first.nullable)
+        self.assertEqual(first.expected, set([42, 43]))
+
+    def testAlternativeExpectedStopsAtFirstNullableElement(self):
+        first = getFirst(AlternativeParser([LiteralParser(42), OptionalParser(LiteralParser(43)), LiteralParser(44)]))
+        self.assertEqual(first.literals, set([42, 43, 44]))
+        self.assertTrue(first.nullable)
+        self.assertEqual(first.expected, set([42, 43]))
+
+    def testUnknownParser(self):
+        self.assertIsNone(getFirst(Opaque(LiteralParser(42))))
+        self.assertIsNone(getFirst(SequenceParser([Opaque(LiteralParser(42))])))
+        self.assertIsNotNone(getFirst(SequenceParser([LiteralParser(41), Opaque(LiteralParser(42))])))
+
+    def testCycle(self):
+        elements = [LiteralParser(42)]
+        p = AlternativeParser(elements)
+        elements.append(SequenceParser([p]))
+        self.assertIsNone(getFirst(p))
+
+
+class LookaheadTestCase(unittest.TestCase):
+    def setUp(self):
+        self.skipped = CountingLiteralParser(44)
+        self.p = AlternativeParser([
+            SequenceParser([LiteralParser(42), LiteralParser(43)]),
+            SequenceParser([self.skipped, LiteralParser(45)]),
+            SequenceParser([OptionalParser(LiteralParser(46)), LiteralParser(47)]),
+            Opaque(SequenceParser([LiteralParser(48), LiteralParser(49)])),
+            SequenceParser([LiteralParser(42), LiteralParser(50)]),
+        ])
+
+    def check(self, input):
+        try:
+            return parse(self.p, input)
+        except ParsingError as e:
+            return e.position, e.expected
+
+    def testSameResultsAsOrderedTrial(self):
+        inputs = [[], [41], [42], [42, 43], [42, 50], [42, 51], [44, 45], [44], [46, 47], [47], [48, 49], [48, 41], [49]]
+        expected = [self.check(input) for input in inputs]
+        for i in range(10):
+            self.assertEqual([self.check(input) for input in inputs], expected)
+
+    def testSkippedElementsAreNotApplied(self):
+        for i in range(20):
+            self.check([47])
+        self.assertLess(self.skipped.calls, 20)
+
+    def testUnhashableTokens(self):
+        p = AlternativeParser([LiteralParser(42), LiteralParser(43)])
+        for i in range(20):
+            with self.assertRaises(ParsingError) as cm:
+                parse(p, [[42]])
+            self.assertEqual(cm.exception.expected, set([42, 43]))
@@ -0,0 +1,100 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, ParsingError, Memo, LiteralParser, SequenceParser, AlternativeParser, RepeatedParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+
+
+class CountingParser:
+    def __init__(self, parser):
+        self.parser = parser
+        self.calls = []
+
+    def apply(self, cursor):
+        self.calls.append(cursor)
+        return cursor.apply(self.parser)
+
+
+class MemoizedSequenceTestCase(StockParsers.SequenceTestCase):
+    parseOptions = {"memoize": True}
+
+
+class MemoizedAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    parseOptions = {"memoize": True}
+
+
+class MemoizedOptionalTestCase(StockParsers.OptionalTestCase):
+    parseOptions = {"memoize": True}
+
+
+class MemoizedRepetitionTestCase(StockParsers.RepetitionTestCase):
+    parseOptions = {"memoize": True}
+
+
+class MemoizedExceptionIsNotExpectedTestCase(StockParsers.ExceptionIsNotExpectedTestCase):
+    parseOptions = {"memoize": True}
+
+
+class MemoizedMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"memoize": True}
+
+
+class BoundedMemoizedMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"memoize": 2}
+
+
+class MemoizationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.prefix = CountingParser(SequenceParser([LiteralParser(42), LiteralParser(43)]))
+        self.p = AlternativeParser([
+            SequenceParser([self.prefix, LiteralParser(44)]),
+            SequenceParser([self.prefix, LiteralParser(45)]),
+            self.prefix,
+        ])
+
+    def testSharedPrefixIsParsedOncePerPosition(self):
+        self.assertEqual(parse(self.p, [42, 43], memoize=True), (42, 43))
+        self.assertEqual(len(self.prefix.calls), 1)
+
+    def testSharedPrefixIsReparsedWithoutMemoization(self):
+        self.assertEqual(parse(self.p, [42, 43]), (42, 43))
+        self.assertEqual(len(self.prefix.calls), 3)
+
+    def testFailureIsMemoized(self):
+        memo = Memo()
+        with self.assertRaises(ParsingError) as cm:
+            parse(self.p, [42, 41], memoize=memo)
+        self.assertEqual(cm.exception.position, 1)
+        self.assertEqual(cm.exception.expected, set([43]))
+        self.assertEqual(len(self.prefix.calls), 1)
+
+    def testMemoIsBounded(self):
+        memo = Memo(3)
+        p = RepeatedParser(SequenceParser([LiteralParser(42), LiteralParser(43)]))
+        self.assertEqual(parse(p, [42, 43] * 10, memoize=memo), [(42, 43)] * 10)
+        self.assertEqual(len(memo), 3)
+
+
+class MemoTestCase(unittest.TestCase):
+    def testLruEviction(self):
+        memo = Memo(2)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        self.assertEqual(memo.get("a"), 1)
+        memo.put("c", 3)
+        self.assertEqual(memo.get("a"), 1)
+        self.assertIsNone(memo.get("b"))
+        self.assertEqual(memo.get("c"), 3)
+
+    def testFifoEviction(self):
+        memo = Memo(2, lru=False)
+        memo.put("a", 1)
+        memo.put("b", 2)
+        self.assertEqual(memo.get("a"), 1)
+        memo.put("c", 3)
+        self.assertIsNone(memo.get("a"))
+        self.assertEqual(memo.get("b"), 2)
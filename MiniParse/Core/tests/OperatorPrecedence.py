@@ -0,0 +1,113 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import functools
+import itertools
+import sys
+import unittest
+
+from MiniParse import parse, compile, iterative, ParsingError, OperatorPrecedenceParser, LiteralParser, SetParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, RuleParser
+from .Framework import ParserTestCase
+
+
+def leftTree(first, rest):
+    return functools.reduce(lambda left, pair: (pair[0], left, pair[1]), rest, first)
+
+
+def rightTree(left, rest):
+    return left if rest is None else (rest[0], left, rest[1])
+
+
+def prefixTree(operators, value):
+    for operator in reversed(operators):
+        value = (operator, value)
+    return value
+
+
+class OperatorPrecedenceTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = OperatorPrecedenceParser(
+            SetParser("abc"),
+            [
+                ("+-", "left", leftTree),
+                ("*", "left", leftTree),
+                ("!", "prefix", prefixTree),
+                ("^", "right", rightTree),
+            ]
+        )
+
+    def testOperand(self):
+        self.expectSuccess("a", "a")
+
+    def testLeftAssociativity(self):
+        self.expectSuccess("a-b+c", ("+", ("-", "a", "b"), "c"))
+
+    def testRightAssociativity(self):
+        self.expectSuccess("a^b^c", ("^", "a", ("^", "b", "c")))
+
+    def testPrecedence(self):
+        self.expectSuccess("a+b*c^a", ("+", "a", ("*", "b", ("^", "c", "a"))))
+        self.expectSuccess("a^b*c+a", ("+", ("*", ("^", "a", "b"), "c"), "a"))
+
+    def testPrefix(self):
+        self.expectSuccess("!!a^b*c", ("*", ("!", ("!", ("^", "a", "b"))), "c"))
+        self.expectSuccess("a*!b", ("*", "a", ("!", "b")))
+
+    def testPrefixNotAllowedAfterHigherOperator(self):
+        self.expectFailure("a^!b", 2, ["a", "b", "c"])
+
+    def testFailures(self):
+        self.expectFailure("", 0, ["a", "b", "c", "!"])
+        self.expectFailure("a+", 2, ["a", "b", "c", "!"])
+        self.expectFailure("a^", 2, ["a", "b", "c"])
+        self.expectFailure("ab", 1, ["+", "-", "*", "^"])
+
+    def testDefaultValuesAreTuples(self):
+        self.p = OperatorPrecedenceParser(SetParser("ab"), [("+", "left"), ("-", "prefix"), ("^", "right")])
+        self.expectSuccess("a", (([], ("a", None)), []))
+        self.expectSuccess("-a+b^a", ((["-"], ("a", None)), [("+", ([], ("b", ("^", ("a", None)))))]))
+
+    def testBacktracksBeforeOperatorWithoutOperand(self):
+        self.p = SequenceParser([self.p, LiteralParser("+"), LiteralParser("!")])
+        self.expectSuccess("a*b+!", (("*", "a", "b"), "+", "!"))
+
+
+class OperatorPrecedenceAsRuleChainTestCase(unittest.TestCase):
+    # Same values and errors as the equivalent chain of rules, on all short inputs
+    def setUp(self):
+        self.levels = [("+", "left"), ("-", "prefix"), ("*", "right"), ("!", "prefix")]
+        self.expression = RuleParser("expression")
+        self.operand = AlternativeParser([SetParser("ab"), SequenceParser([LiteralParser("("), self.expression, LiteralParser(")")])])
+        self.expression.define(OperatorPrecedenceParser(self.operand, self.levels))
+
+    def testSameAsRuleChain(self):
+        levels = self.levels
+        expression = self.expression
+        operand = self.operand
+        compiled = compile(expression)
+        iterated = iterative(expression)
+
+        rules = [RuleParser(str(k)) for k in range(len(levels))] + [operand]
+        rules[0].define(SequenceParser([rules[1], RepeatedParser(SequenceParser([SetParser("+"), rules[1]]))]))
+        rules[1].define(SequenceParser([RepeatedParser(SetParser("-")), rules[2]]))
+        rules[2].define(SequenceParser([rules[3], OptionalParser(SequenceParser([SetParser("*"), rules[2]]))]))
+        rules[3].define(SequenceParser([RepeatedParser(SetParser("!")), rules[4]]))
+
+        for length in range(5):
+            for tokens in itertools.product("ab+-*!()", repeat=length):
+                expected = self.parse(rules[0], tokens)
+                self.assertEqual(self.parse(expression, tokens), expected)
+                self.assertEqual(self.parse(compiled, tokens), expected)
+                self.assertEqual(self.parse(iterated, tokens), expected)
+
+    def testDeeplyNestedInputIsParsedIteratively(self):
+        depth = 4 * sys.getrecursionlimit()
+        value = parse(iterative(self.expression), "(" * depth + "a" + ")" * depth + "+b")
+        self.assertEqual(value[1], [("+", ([], (([], "b"), None)))])
+
+    def parse(self, parser, tokens):
+        try:
+            return parse(parser, tokens)
+        except ParsingError as e:
+            return (e.position, e.expected)
@@ -0,0 +1,54 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, Memo, LiteralParser, SequenceParser
+from MiniParse.Core.ParseFunction import _makeFirstPassMemo
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+
+
+class OptimisticSequenceTestCase(StockParsers.SequenceTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticRepetitionTestCase(StockParsers.RepetitionTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticMemoizedMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"optimistic": True, "memoize": True}
+
+
+class OptimisticParsingTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+        def match(a, b):
+            self.calls += 1
+            return a + b
+
+        self.p = SequenceParser([LiteralParser(42), LiteralParser(43)], match)
+
+    def testSuccessParsesOnce(self):
+        self.assertEqual(parse(self.p, [42, 43], optimistic=True), 85)
+        self.assertEqual(self.calls, 1)
+
+    def testFirstPassMemoIsAsBoundedAsMemoObject(self):
+        memo = Memo(3)
+        firstPassMemo = _makeFirstPassMemo(memo)
+        self.assertIsNot(firstPassMemo, memo)
+        self.assertEqual(firstPassMemo.maxSize, 3)
+        self.assertIsNone(_makeFirstPassMemo(Memo()).maxSize)
+        self.assertEqual(parse(self.p, [42, 43], optimistic=True, memoize=memo), 85)
+        self.assertEqual(len(memo), 0)  # The successful first pass didn't use it
@@ -0,0 +1,53 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parseMany, ParsingError, LiteralParser, SetParser, SequenceParser, RepeatedParser
+
+
+parser = SequenceParser([LiteralParser("a"), RepeatedParser(SetParser("bc"))], lambda a, bs: a + "".join(bs))
+
+
+class ParseManyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.p = parser
+
+    def testValuesAndErrorsInOrder(self):
+        results = list(parseMany(self.p, ["ab", "x", "abcb", "a", "ac!"]))
+        self.assertEqual(results[0], "ab")
+        self.assertEqual(results[2], "abcb")
+        self.assertEqual(results[3], "a")
+        self.assertIsInstance(results[1], ParsingError)
+        self.assertEqual((results[1].position, results[1].expected), (0, set(["a"])))
+        self.assertIsInstance(results[4], ParsingError)
+        self.assertEqual((results[4].position, results[4].expected), (2, set(["b", "c"])))
+
+    def testSeveralChunks(self):
+        inputs = ("a" + "b" * i for i in range(10))
+        self.assertEqual(list(parseMany(self.p, inputs, chunkSize=3)), ["a" + "b" * i for i in range(10)])
+
+    def testEmptyBatch(self):
+        self.assertEqual(list(parseMany(self.p, [])), [])
+
+    def testSmallBatchIsParsedInThisProcess(self):
+        self.assertEqual(list(parseMany("MiniParse.Core.tests.ParseMany:parser", ["a", "ab"], workers=4)), ["a", "ab"])
+
+    def testWorkers(self):
+        inputs = ["a" + "b" * (i % 5) if i % 7 else "x" for i in range(40)]
+        results = list(parseMany("MiniParse.Core.tests.ParseMany:parser", inputs, workers=2, chunkSize=4))
+        for input, result in zip(inputs, results):
+            if input == "x":
+                self.assertEqual((result.position, result.expected), (0, set(["a"])))
+            else:
+                self.assertEqual(result, input)
+
+    def testOptionsArePassedToParse(self):
+        self.assertEqual(list(parseMany(self.p, ["abc"], memoize=True, optimistic=True)), ["abc"])
+
+    def testWorkersNeedAParserName(self):
+        # Even when the inputs would fit in a single chunk
+        for inputs in [["a"], ["a"] * 10]:
+            with self.assertRaises(TypeError):
+                list(parseMany(self.p, inputs, workers=2, chunkSize=4))
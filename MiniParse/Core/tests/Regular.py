@@ -0,0 +1,93 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import itertools
+import unittest
+
+from MiniParse import parse, validate, compile, iterative, ParsingError, LiteralParser, SetParser, SequenceParser, OptionalParser, RepeatedParser, RegularParser
+from .Validation import Validating
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+
+
+class OptimisticValidatingSequenceTestCase(Validating, StockParsers.SequenceTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticValidatingRepetitionTestCase(Validating, StockParsers.RepetitionTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticValidatingRestrictionTestCase(Validating, StockParsers.RestrictionTestCase):
+    parseOptions = {"optimistic": True}
+
+
+class OptimisticValidatingMinimalArithmetic(Validating, MinimalArithmetic):
+    parseOptions = {"optimistic": True}
+
+
+class RegularParserTestCase(unittest.TestCase):
+    def setUp(self):
+        # Int = ["-"], Digit, {Digit};
+        digit = SetParser("0123456789", int)
+        self.int = SequenceParser([OptionalParser(LiteralParser("-")), digit, RepeatedParser(digit)], lambda sign, first, rest: 0)
+        self.p = RegularParser(r"(?=(?P<g1>(?:\-)?))(?P=g1)[0-9](?=(?P<g2>(?:[0-9])*))(?P=g2)", self.int)
+
+    def testValueAndErrorComeFromParser(self):
+        self.assertEqual(parse(self.p, "-12"), parse(self.int, "-12"))
+        for p in [self.p, compile(self.p)]:
+            with self.assertRaises(ParsingError) as cm:
+                parse(p, "-1a")
+            self.assertEqual(cm.exception.position, 2)
+            self.assertEqual(cm.exception.expected, set("0123456789"))
+
+    def testSameResultsAsParser(self):
+        for length in range(5):
+            for tokens in itertools.product("-1a", repeat=length):
+                tokens = "".join(tokens)
+                self.assertEqual(self.validate(self.p, tokens, optimistic=True), self.validate(self.int, tokens))
+
+    def testSameParseResultsAsParser(self):
+        # Ints = Int, {",", Int};
+        ints = lambda p: SequenceParser([p, RepeatedParser(SequenceParser([LiteralParser(","), p]))])
+        regular, combinators = ints(self.p), ints(self.int)
+        options = [
+            {}, {"optimistic": True}, {"memoize": True}, {"optimistic": True, "memoize": 4},
+            {"optimistic": True, "deferred": True}, {"streaming": True},
+        ]
+        for length in range(6):
+            for tokens in itertools.product("-1a,", repeat=length):
+                tokens = "".join(tokens)
+                expected = self.parse(combinators, tokens)
+                for o in options:
+                    self.assertEqual(self.parse(regular, tokens, **o), expected)
+                self.assertEqual(self.parse(compile(regular), tokens), expected)
+                self.assertEqual(self.parse(iterative(regular), tokens), expected)
+
+    def testRegularExpressionIsUsedOnlyByOptimisticValidation(self):
+        p = RegularParser("b", LiteralParser("a"))
+        self.assertIsNone(validate(p, "b", optimistic=True))
+        self.assertEqual(self.validate(p, "b"), (0, set(["a"])))
+        self.assertEqual(self.validate(p, "a", optimistic=True), None)
+        self.assertEqual(self.parse(p, "a", optimistic=True), "a")
+        self.assertEqual(self.parse(p, "b", optimistic=True), (0, set(["a"])))
+
+    def testTokensThatAreNotTextUseParser(self):
+        p = RegularParser("b", LiteralParser("a"))
+        self.assertIsNone(validate(p, ["a"], optimistic=True))
+        self.assertEqual(self.validate(p, ["b"], optimistic=True), (0, set(["a"])))
+
+    @staticmethod
+    def parse(parser, tokens, **options):
+        try:
+            return parse(parser, tokens, **options)
+        except ParsingError as e:
+            return (e.position, e.expected)
+
+    @staticmethod
+    def validate(parser, tokens, **options):
+        try:
+            return validate(parser, tokens, **options)
+        except ParsingError as e:
+            return (e.position, e.expected)
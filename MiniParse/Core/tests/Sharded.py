@@ -0,0 +1,81 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import itertools
+import unittest
+
+from MiniParse import parse, parseSharded, ParsingError, SourceLocations, LocatedTokens, LiteralParser, SequenceParser, AlternativeParser, RepeatedParser
+
+# record = ("a" | "(", {"a" | ";"}, ")"), ";";
+# ";" is a boundary between records, but can also appear between parentheses.
+record = SequenceParser(
+    [
+        AlternativeParser([
+            LiteralParser("a"),
+            SequenceParser([LiteralParser("("), RepeatedParser(AlternativeParser([LiteralParser("a"), LiteralParser(";")])), LiteralParser(")")]),
+        ]),
+        LiteralParser(";"),
+    ],
+    lambda item, terminator: item
+)
+
+
+def isBoundary(token):
+    return token == ";"
+
+
+class ParseShardedTestCase(unittest.TestCase):
+    def parse(self, function, *args, **kwds):
+        try:
+            return function(*args, **kwds)
+        except ParsingError as e:
+            return (e.position, e.expected)
+
+    def testSameResultsAsParse(self):
+        for length in range(8):
+            for tokens in itertools.product("a;()", repeat=length):
+                expected = self.parse(parse, RepeatedParser(record, len), tokens)
+                for shardSize in (1, 2, 5):
+                    self.assertEqual(self.parse(parseSharded, record, tokens, isBoundary, len, shardSize=shardSize), expected)
+
+    def testValuesInOrder(self):
+        tokens = list("a;(a;a);a;") * 100
+        self.assertEqual(parseSharded(record, tokens, isBoundary, shardSize=7), parse(RepeatedParser(record), tokens))
+
+    def testErrorPositionIsGlobal(self):
+        tokens = list("a;a;a;a;a)a;")
+        with self.assertRaises(ParsingError) as cm:
+            parseSharded(record, tokens, isBoundary, shardSize=2)
+        self.assertEqual(cm.exception.args, ("Syntax error", 9, set([";"])))
+
+    def testErrorLocation(self):
+        text = "a;\na;\nb;"
+        tokens = LocatedTokens(((offset, token) for offset, token in enumerate(text) if token != "\n"), SourceLocations(text))
+        with self.assertRaises(ParsingError) as cm:
+            parse(RepeatedParser(record), tokens)
+        self.assertEqual((cm.exception.line, cm.exception.column), (2, 0))
+        for shardSize in (1, 2, 10):
+            with self.assertRaises(ParsingError) as cm:
+                parseSharded(record, tokens, isBoundary, shardSize=shardSize)
+            self.assertEqual((cm.exception.position, cm.exception.line, cm.exception.column), (4, 2, 0))
+
+    def testWorkersNeedARecordName(self):
+        for tokens in [list("a;"), list("a;") * 10]:
+            with self.assertRaises(TypeError):
+                parseSharded(record, tokens, isBoundary, workers=2, shardSize=2)
+
+    def testEmptyInput(self):
+        self.assertEqual(parseSharded(record, [], isBoundary), [])
+
+    def testWorkers(self):
+        tokens = list("a;(a;a);a;") * 100
+        self.assertEqual(
+            parseSharded("MiniParse.Core.tests.Sharded:record", tokens, isBoundary, workers=2, shardSize=50),
+            parse(RepeatedParser(record), tokens)
+        )
+        tokens[555] = ")"
+        self.assertEqual(
+            self.parse(parseSharded, "MiniParse.Core.tests.Sharded:record", tokens, isBoundary, workers=2, shardSize=50),
+            self.parse(parse, RepeatedParser(record), tokens)
+        )
@@ -4,7 +4,7 @@
 
 import unittest
 
-from MiniParse import LiteralParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser
+from MiniParse import LiteralParser, SetParser, RangeParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, RepetitionParser, RestrictionParser, RuleParser
 from .Framework import ParserTestCase
 
 
@@ -181,3 +181,142 @@ class RepetitionTestCase(ParserTestCase):
 
     def testFailure1(self):
         self.expectFailure([42, 42, 41], 2, [42])
+
+
+class SetTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = SetParser([42, 43, 44])
+
+    def testSuccess(self):
+        self.expectSuccess([43], 43)
+
+    def testFailure1(self):
+        self.expectFailure([41], 0, [42, 43, 44])
+
+    def testFailure10(self):
+        self.expectFailure([], 0, [42, 43, 44])
+
+    def testUnhashableToken(self):
+        self.expectFailure([[42]], 0, [42, 43, 44])
+
+
+class RangeTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RangeParser("a", "e")
+
+    def testSuccess(self):
+        self.expectSuccess("c", "c")
+
+    def testFailure1(self):
+        self.expectFailure("f", 0, "abcde")
+
+    def testFailure10(self):
+        self.expectFailure("", 0, "abcde")
+
+
+class IntegerRangeTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RangeParser(42, 44)
+
+    def testSuccess(self):
+        self.expectSuccess([44], 44)
+
+    def testFailure(self):
+        self.expectFailure([45], 0, [42, 43, 44])
+
+
+class SetRepetitionTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = SequenceParser([
+            RepeatedParser(SetParser([42, 43], lambda x: x + 1)),
+            LiteralParser(44),
+        ])
+
+    def testSuccess0(self):
+        self.expectSuccess([44], ([], 44))
+
+    def testSuccess3(self):
+        self.expectSuccess([42, 43, 42, 44], ([43, 44, 43], 44))
+
+    def testFailure(self):
+        self.expectFailure([42, 43, 41], 2, [42, 43, 44])
+
+    def testFailureAtEnd(self):
+        self.expectFailure([42, 43], 2, [42, 43, 44])
+
+    def testUnhashableToken(self):
+        self.expectFailure([42, [43]], 1, [42, 43, 44])
+
+
+class ExactRepetitionTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RepetitionParser(3, LiteralParser(42))
+
+    def testSuccess(self):
+        self.expectSuccess([42, 42, 42], [42, 42, 42])
+
+    def testFailure2(self):
+        self.expectFailure([42, 42], 2, [42])
+
+    def testFailure4(self):
+        self.expectFailure([42, 42, 42, 42], 3, [])
+
+
+class RestrictionTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RestrictionParser(RepeatedParser(LiteralParser(42)), SequenceParser([LiteralParser(42), LiteralParser(42)]))
+
+    def testSuccess1(self):
+        self.expectSuccess([42], [42])
+
+    def testSuccess3(self):
+        self.expectSuccess([42, 42, 42], [42, 42, 42])
+
+    def testFailure(self):
+        self.expectFailure([42, 42], 2, [42])
+
+
+class ExceptionIsNotExpectedTestCase(ParserTestCase):
+    def setUp(self):
+        # ("a" - ("a", "b")), "c"
+        self.p = SequenceParser(
+            [RestrictionParser(LiteralParser("a"), SequenceParser([LiteralParser("a"), LiteralParser("b")])), LiteralParser("c")],
+            lambda a, c: a + c
+        )
+
+    def testSuccess(self):
+        self.expectSuccess(["a", "c"], "ac")
+
+    def testFailureOfRestriction(self):
+        self.expectFailure(["b"], 0, ["a"])
+
+    def testFailureAfterRestriction(self):
+        self.expectFailure(["a", "x"], 1, ["c"])
+
+    def testFailureAfterSuccessOfException(self):
+        self.expectFailure(["a", "b"], 1, ["c"])
+
+
+class RecursiveRuleTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RuleParser("nested")
+        self.p.define(AlternativeParser([
+            LiteralParser(42),
+            SequenceParser([LiteralParser("("), self.p, LiteralParser(")")], match=lambda o, v, c: [v]),
+        ]))
+
+    def testName(self):
+        self.assertEqual(self.p.name, "nested")
+
+    def testSuccess(self):
+        self.expectSuccess(["(", "(", 42, ")", ")"], [[42]])
+
+    def testFailure(self):
+        self.expectFailure(["(", 42], 2, [")"])
+
+    def testRepeatedRule(self):
+        digit = RuleParser("digit")
+        self.p = RepeatedParser(digit)
+        digit.define(SetParser([1, 2, 3]))
+        self.expectSuccess([1, 3, 2], [1, 3, 2])
+        self.expectFailure([1, 4], 1, [1, 2, 3])
@@ -0,0 +1,94 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import parse, parseWithCursor, ParsingError, StreamingCursor, Memo, LiteralParser, SequenceParser, AlternativeParser, RepeatedParser, RuleParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+
+
+class StreamingSequenceTestCase(StockParsers.SequenceTestCase):
+    parseOptions = {"streaming": True}
+
+
+class StreamingAlternativeWithCommonPrefixAndDifferentLengthsTestCase(StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    parseOptions = {"streaming": True}
+
+
+class StreamingRepetitionTestCase(StockParsers.RepetitionTestCase):
+    parseOptions = {"streaming": True}
+
+
+class StreamingSetRepetitionTestCase(StockParsers.SetRepetitionTestCase):
+    parseOptions = {"streaming": True}
+
+
+class StreamingMinimalArithmetic(MinimalArithmetic):
+    parseOptions = {"streaming": True}
+
+
+class StreamingCursorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.p = RepeatedParser(AlternativeParser([
+            SequenceParser([LiteralParser(42), LiteralParser(43), LiteralParser(44)]),
+            SequenceParser([LiteralParser(42), LiteralParser(43), LiteralParser(45)]),
+        ]))
+
+    def records(self, count):
+        for i in range(count):
+            yield 42
+            yield 43
+            yield 44 if i % 2 else 45
+
+    def testTokensAreNotAllKept(self):
+        cursor = StreamingCursor(self.records(10000))
+        value = parseWithCursor(self.p, cursor)
+        self.assertEqual(len(value), 10000)
+        self.assertLessEqual(cursor.peakBufferSize, 6)
+
+    def testTokensAreNotAllKeptInWrappedRepetition(self):
+        # "start", {record}, "end" in a rule
+        rule = RuleParser("file")
+        rule.define(SequenceParser([LiteralParser("start"), self.p, LiteralParser("end")]))
+
+        def tokens():
+            yield "start"
+            for t in self.records(10000):
+                yield t
+            yield "end"
+
+        for parser in [SequenceParser([rule]), rule]:
+            for memoize in [False, True]:
+                cursor = StreamingCursor(tokens(), Memo() if memoize else None)
+                value = parseWithCursor(parser, cursor)
+                self.assertEqual(len(value[1] if parser is rule else value[0][1]), 10000)
+                self.assertLessEqual(cursor.peakBufferSize, 6)
+
+    def testTokensAreKeptWhileTheyCanBeRevisited(self):
+        # ("start", {record}, "end") | ("start", {record}, "stop"): the whole input is kept until "stop"
+        p = AlternativeParser([
+            SequenceParser([LiteralParser("start"), self.p, LiteralParser(end)]) for end in ["end", "stop"]
+        ])
+
+        def tokens():
+            yield "start"
+            for t in self.records(100):
+                yield t
+            yield "stop"
+
+        cursor = StreamingCursor(tokens())
+        self.assertEqual(parseWithCursor(p, cursor)[2], "stop")
+        self.assertGreaterEqual(cursor.peakBufferSize, 300)
+
+    def testErrorPositionIsGlobal(self):
+        def tokens():
+            for t in self.records(1000):
+                yield t
+            yield 42
+            yield 46
+        with self.assertRaises(ParsingError) as cm:
+            parse(self.p, tokens(), streaming=True)
+        self.assertEqual(cm.exception.position, 3001)
+        self.assertEqual(cm.exception.expected, set([43]))
@@ -0,0 +1,114 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import re
+import unittest
+
+from MiniParse import parse, compile, validate, ParsingError, TextLiteralParser, RegexParser, SetParser, SequenceParser, AlternativeParser, RepeatedParser
+from .Framework import ParserTestCase
+
+
+class TextLiteralTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = TextLiteralParser("while")
+
+    def testSuccess(self):
+        self.expectSuccess("while", "while")
+
+    def testFailure(self):
+        self.expectFailure("whale", 0, ["while"])
+
+    def testShortInput(self):
+        self.expectFailure("whil", 0, ["while"])
+
+    def testPartialSuccess(self):
+        self.expectFailure("whiles", 5, [])
+
+
+class CompiledTextLiteralTestCase(TextLiteralTestCase):
+    def setUp(self):
+        TextLiteralTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class RegexTestCase(ParserTestCase):
+    def setUp(self):
+        self.p = RegexParser("[0-9]+", int)
+
+    def testSuccess(self):
+        self.expectSuccess("123", 123)
+
+    def testFailure(self):
+        self.expectFailure("a", 0, ["[0-9]+"])
+
+    def testPartialSuccess(self):
+        self.expectFailure("12a", 2, [])
+
+
+class CompiledRegexTestCase(RegexTestCase):
+    def setUp(self):
+        RegexTestCase.setUp(self)
+        self.p = compile(self.p)
+
+
+class ScannerlessTestCase(unittest.TestCase):
+    # Statements = {Statement}
+    # Statement = "let", Name, "=", Number, ";"
+    def makeParser(self, literal, pattern):
+        blank = RegexParser(pattern(r"\s*"))
+        name = RegexParser(pattern(r"[a-z]+"), expected="name")
+        number = RegexParser(pattern(r"[0-9]+"), int, expected="number")
+        statement = SequenceParser(
+            [
+                blank, TextLiteralParser(literal("let")),
+                blank, name,
+                blank, TextLiteralParser(literal("=")),
+                blank, number,
+                blank, TextLiteralParser(literal(";")),
+            ],
+            lambda b1, l, b2, n, b3, e, b4, v, b5, s: (n, v)
+        )
+        return SequenceParser([RepeatedParser(statement), blank], lambda statements, b: statements)
+
+    def testStr(self):
+        p = self.makeParser(lambda s: s, lambda s: s)
+        self.assertEqual(parse(p, "let a = 12;\nlet bc=3 ;  "), [("a", 12), ("bc", 3)])
+
+    def testBytes(self):
+        p = self.makeParser(lambda s: s.encode(), lambda s: re.compile(s.encode()))
+        self.assertEqual(parse(p, b"let a = 12;\nlet bc=3 ;  "), [(b"a", 12), (b"bc", 3)])
+
+    def testMemoryview(self):
+        p = self.makeParser(lambda s: s.encode(), lambda s: re.compile(s.encode()))
+        self.assertEqual(parse(p, memoryview(b"let a = 12;\nlet bc=3 ;  ")), [(b"a", 12), (b"bc", 3)])
+
+    def testErrors(self):
+        p = self.makeParser(lambda s: s, lambda s: s)
+        for text, position, expected in [
+            ("let a = 12", 10, [";"]),
+            ("let = 12;", 4, ["name"]),
+            ("let a = b;", 8, ["number"]),
+            ("let a = 1; lex", 11, ["let"]),
+        ]:
+            with self.assertRaises(ParsingError) as cm:
+                parse(p, text)
+            self.assertEqual((cm.exception.position, cm.exception.expected), (position, set(expected)))
+            with self.assertRaises(ParsingError) as cm:
+                parse(compile(p), text)
+            self.assertEqual((cm.exception.position, cm.exception.expected), (position, set(expected)))
+
+    def testCompiled(self):
+        p = self.makeParser(lambda s: s, lambda s: s)
+        self.assertEqual(parse(compile(p), "let a = 12;\nlet bc=3 ;  "), [("a", 12), ("bc", 3)])
+
+    def testValidate(self):
+        p = self.makeParser(lambda s: s, lambda s: s)
+        self.assertIsNone(validate(p, "let a = 12;\nlet bc=3 ;  "))
+
+    def testLookahead(self):
+        # The text literals are dispatched on their first character
+        keywords = ["if", "then", "else", "end", "elif", "while", "do", "for", "in", "to"]
+        p = RepeatedParser(AlternativeParser([TextLiteralParser(keyword) for keyword in keywords] + [SetParser(" ")]))
+        text = " ".join(keywords * 10)
+        self.assertEqual(parse(p, text), [w for keyword in keywords * 10 for w in (keyword, " ")][:-1])
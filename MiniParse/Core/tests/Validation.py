@@ -0,0 +1,101 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import unittest
+
+from MiniParse import validate, parse, ParsingError, LiteralParser, SetParser, SequenceParser, AlternativeParser, RepeatedParser, RuleParser
+from . import StockParsers
+from .MinimalArithmetic import MinimalArithmetic
+from . import OperatorPrecedence
+
+
+class Validating:
+    # Same tests, but only the result of validation is checked
+    def expectSuccess(self, input, value):
+        self.assertIsNone(validate(self.p, input, **self.parseOptions))
+
+    def expectFailure(self, input, position, expected):
+        with self.assertRaises(ParsingError) as cm:
+            validate(self.p, input, **self.parseOptions)
+        self.assertEqual(cm.exception.message, "Syntax error")
+        self.assertEqual(cm.exception.position, position)
+        self.assertEqual(cm.exception.expected, set(expected))
+
+
+class ValidatingLiteralTestCase(Validating, StockParsers.LiteralTestCase):
+    pass
+
+
+class ValidatingSequenceTestCase(Validating, StockParsers.SequenceTestCase):
+    pass
+
+
+class ValidatingAlternativeWithCommonPrefixAndDifferentLengthsTestCase(Validating, StockParsers.AlternativeWithCommonPrefixAndDifferentLengthsTestCase):
+    pass
+
+
+class ValidatingOptionalTestCase(Validating, StockParsers.OptionalTestCase):
+    pass
+
+
+class ValidatingRepetitionTestCase(Validating, StockParsers.RepetitionTestCase):
+    pass
+
+
+class ValidatingSetRepetitionTestCase(Validating, StockParsers.SetRepetitionTestCase):
+    pass
+
+
+class ValidatingExactRepetitionTestCase(Validating, StockParsers.ExactRepetitionTestCase):
+    pass
+
+
+class ValidatingRestrictionTestCase(Validating, StockParsers.RestrictionTestCase):
+    pass
+
+
+class ValidatingExceptionIsNotExpectedTestCase(Validating, StockParsers.ExceptionIsNotExpectedTestCase):
+    pass
+
+
+class ValidatingMinimalArithmetic(Validating, MinimalArithmetic):
+    pass
+
+
+class ValidatingMemoizedMinimalArithmetic(Validating, MinimalArithmetic):
+    parseOptions = {"memoize": True}
+
+
+class ValidatingOperatorPrecedenceTestCase(Validating, OperatorPrecedence.OperatorPrecedenceTestCase):
+    pass
+
+
+class ValidationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+        def match(*args):
+            self.calls += 1
+            return args
+
+        digit = SetParser("0123456789", match)
+        number = SequenceParser([digit, RepeatedParser(digit, match)], match)
+        self.list = RuleParser("list")
+        self.list.define(SequenceParser([
+            LiteralParser("["),
+            RepeatedParser(AlternativeParser([number, self.list], match), match),
+            LiteralParser("]"),
+        ], match))
+
+    def testNoMatchIsCalled(self):
+        validate(self.list, "[12[3[]]45]")
+        self.assertEqual(self.calls, 0)
+
+    def testSameErrorAsParse(self):
+        for tokens in ["", "[", "[1", "[12[3[]]45", "[12[3[]]45]]", "[a]", "12"]:
+            with self.assertRaises(ParsingError) as parsed:
+                parse(self.list, tokens)
+            with self.assertRaises(ParsingError) as validated:
+                validate(self.list, tokens)
+            self.assertEqual(validated.exception.args, parsed.exception.args)
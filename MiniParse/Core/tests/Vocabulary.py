@@ -0,0 +1,76 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import array
+import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma no cover
+    numpy = None
+
+from MiniParse import Vocabulary, ParsingError, SequenceParser, AlternativeParser, RepeatedParser, compile
+from .MinimalArithmetic import MinimalArithmetic
+
+
+class VocabularyMinimalArithmetic(MinimalArithmetic):
+    # Same grammar, built on ids, parsing encoded inputs
+    def setUp(self):
+        MinimalArithmetic.setUp(self)
+        v = self.vocabulary = Vocabulary(["1", "+", "*", "(", ")"])
+
+        class factor:
+            @staticmethod
+            def apply(c):
+                return AlternativeParser([v.literal("1"), SequenceParser([v.literal("("), expr, v.literal(")")])]).apply(c)
+
+        term = SequenceParser([factor, RepeatedParser(SequenceParser([v.literal("*"), factor]))])
+        expr = SequenceParser([term, RepeatedParser(SequenceParser([v.literal("+"), term]))])
+        self.p = expr
+
+    def expectSuccess(self, input, value):
+        self.assertEqual(self.vocabulary.parse(self.p, self.vocabulary.encode(input), **self.parseOptions), value)
+
+    def expectFailure(self, input, position, expected):
+        with self.assertRaises(ParsingError) as cm:
+            self.vocabulary.parse(self.p, self.vocabulary.encode(input), **self.parseOptions)
+        self.assertEqual(cm.exception.args, ("Syntax error", position, set(expected)))
+
+
+class OptimisticVocabularyMinimalArithmetic(VocabularyMinimalArithmetic):
+    parseOptions = {"optimistic": True}
+
+
+class VocabularyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.v = Vocabulary(["a", "b", "c"])
+        self.p = SequenceParser([self.v.literal("a"), RepeatedParser(self.v.set(["b", "c"]))])
+
+    def testIds(self):
+        self.assertEqual(len(self.v), 3)
+        self.assertEqual(self.v.id("b"), 1)
+        self.assertEqual(self.v.terminal(1), "b")
+        self.assertEqual(self.v.encode("acb"), array.array("i", [0, 2, 1]))
+
+    def testValuesAreTerminals(self):
+        self.assertEqual(self.v.parse(self.p, self.v.encode("abcb")), ("a", ["b", "c", "b"]))
+
+    def testErrorsAreTranslated(self):
+        for p in [self.p, compile(self.p)]:
+            with self.assertRaises(ParsingError) as cm:
+                self.v.parse(p, self.v.encode("abca"))
+            self.assertEqual(cm.exception.args, ("Syntax error", 3, set(["b", "c"])))
+
+    def testViewDoesNotCopy(self):
+        tokens = self.v.encode("abc")
+        view = self.v.view(tokens)
+        tokens[2] = 1
+        self.assertEqual(list(view), [0, 1, 1])
+
+    def testBytes(self):
+        self.assertEqual(self.v.parse(self.p, self.v.encode("ab").tobytes()), ("a", ["b"]))
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def testNumPy(self):  # pragma no cover
+        self.assertEqual(self.v.parse(self.p, numpy.array([0, 2, 1], dtype=numpy.int32)), ("a", ["c", "b"]))
@@ -6,3 +6,21 @@ from .StockParsers import *
 from .BadBehavior import *
 from .MinimalArithmetic import *
 from .CustomizedValue import *
+from .Memoization import *
+from .Backtracking import *
+from .OptimisticParsing import *
+from .Streaming import *
+from .Lookahead import *
+from .Compilation import *
+from .Iterative import *
+from .ParseMany import *
+from .Incremental import *
+from .OperatorPrecedence import *
+from .Deferred import *
+from .Validation import *
+from .Events import *
+from .Text import *
+from .Regular import *
+from .Locations import *
+from .Vocabulary import *
+from .Sharded import *
@@ -0,0 +1,395 @@
+# This file was generated by MiniParse.Meta. Manual modifications will likely be lost.
+# Command line:
+#     python -m MiniParse.Meta --in MiniParse/Examples/StringArithmetic/Grammar.ebnf generate --backend direct --out MiniParse/Examples/StringArithmetic/DirectParser.py --import ParsingUtilities --match-name-lambda 'lambda n: "ParsingUtilities.make" + n' --main-rule StringExpr
+
+from . import ParsingUtilities
+
+
+class ParsingError(Exception):
+    def __init__(self, message, position, expected):
+        Exception.__init__(self, message, position, expected)
+        self.message = message
+        self.position = position
+        self.expected = expected
+
+
+def _expect(failure, position, expected):
+    if position > failure[0]:
+        failure[0] = position
+        failure[1] = set(expected)
+    else:
+        failure[1].update(expected)
+
+
+_constant0 = ParsingUtilities.makeStringExpr
+_constant1 = ParsingUtilities.makeStringTerm
+_constant2 = ParsingUtilities.makeStringFactor
+_constant3 = ParsingUtilities.makeString
+_constant4 = frozenset(['a', 'b', 'c', 'd', 'e', 'f'])
+_constant5 = ParsingUtilities.makeChar
+_constant6 = frozenset(['*', '/'])
+_constant7 = ParsingUtilities.makeIntTerm
+_constant8 = ParsingUtilities.makeIntFactor
+_constant9 = frozenset(['+', '-'])
+_constant10 = ParsingUtilities.makeIntExpr
+_constant11 = ParsingUtilities.makeInt
+_constant12 = frozenset(['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'])
+_constant13 = ParsingUtilities.makeDigit
+
+
+def _parse9(tokens, length, position, failure):
+    if position < length and not tokens[position] != '+':
+        end5 = position + 1
+        value6 = '+'
+    else:
+        end5 = -1
+        value6 = None
+        if position >= failure[0]:
+            _expect(failure, position, ('+',))
+    if end5 < 0:
+        return -1, None
+    end7, value8 = StringTermParser(tokens, length, end5, failure)
+    if end7 < 0:
+        return -1, None
+    return end7, (value6, value8, )
+
+
+def _parse10(tokens, length, position, failure):
+    values = []
+    while True:
+        end, value = _parse9(tokens, length, position, failure)
+        if end < 0:
+            break
+        values.append(value)
+        position = end
+    return position, values
+
+
+def StringExprParser(tokens, length, position, failure):
+    end1, value2 = StringTermParser(tokens, length, position, failure)
+    if end1 < 0:
+        return -1, None
+    end3, value4 = _parse10(tokens, length, end1, failure)
+    if end3 < 0:
+        return -1, None
+    return end3, _constant0(value2, value4)
+
+
+def _parse17(tokens, length, position, failure):
+    end13, value14 = IntTermParser(tokens, length, position, failure)
+    if end13 < 0:
+        return -1, None
+    if end13 < length and not tokens[end13] != '*':
+        end15 = end13 + 1
+        value16 = '*'
+    else:
+        end15 = -1
+        value16 = None
+        if end13 >= failure[0]:
+            _expect(failure, end13, ('*',))
+    if end15 < 0:
+        return -1, None
+    return end15, (value14, value16, )
+
+
+def _parse18(tokens, length, position, failure):
+    end, value = _parse17(tokens, length, position, failure)
+    if end < 0:
+        return position, None
+    return end, value
+
+
+def StringTermParser(tokens, length, position, failure):
+    end11, value12 = _parse18(tokens, length, position, failure)
+    if end11 < 0:
+        return -1, None
+    end19, value20 = StringFactorParser(tokens, length, end11, failure)
+    if end19 < 0:
+        return -1, None
+    return end19, _constant1(value12, value20)
+
+
+def _parse27(tokens, length, position, failure):
+    if position < length and not tokens[position] != '(':
+        end21 = position + 1
+        value22 = '('
+    else:
+        end21 = -1
+        value22 = None
+        if position >= failure[0]:
+            _expect(failure, position, ('(',))
+    if end21 < 0:
+        return -1, None
+    end23, value24 = StringExprParser(tokens, length, end21, failure)
+    if end23 < 0:
+        return -1, None
+    if end23 < length and not tokens[end23] != ')':
+        end25 = end23 + 1
+        value26 = ')'
+    else:
+        end25 = -1
+        value26 = None
+        if end23 >= failure[0]:
+            _expect(failure, end23, (')',))
+    if end25 < 0:
+        return -1, None
+    return end25, (value22, value24, value26, )
+
+
+def StringFactorParser(tokens, length, position, failure):
+    end, value = StringParser(tokens, length, position, failure)
+    if end >= 0:
+        return end, _constant2(value)
+    end, value = _parse27(tokens, length, position, failure)
+    if end >= 0:
+        return end, _constant2(value)
+    return -1, None
+
+
+def _parse32(tokens, length, position, failure):
+    values = []
+    while True:
+        end, value = CharParser(tokens, length, position, failure)
+        if end < 0:
+            break
+        values.append(value)
+        position = end
+    return position, values
+
+
+def StringParser(tokens, length, position, failure):
+    if position < length and not tokens[position] != '"':
+        end28 = position + 1
+        value29 = '"'
+    else:
+        end28 = -1
+        value29 = None
+        if position >= failure[0]:
+            _expect(failure, position, ('"',))
+    if end28 < 0:
+        return -1, None
+    end30, value31 = _parse32(tokens, length, end28, failure)
+    if end30 < 0:
+        return -1, None
+    if end30 < length and not tokens[end30] != '"':
+        end33 = end30 + 1
+        value34 = '"'
+    else:
+        end33 = -1
+        value34 = None
+        if end30 >= failure[0]:
+            _expect(failure, end30, ('"',))
+    if end33 < 0:
+        return -1, None
+    return end33, _constant3(value29, value31, value34)
+
+
+def CharParser(tokens, length, position, failure):
+    end = -1
+    if position < length:
+        value = tokens[position]
+        try:
+            if value in _constant4:
+                end = position + 1
+        except TypeError:
+            pass
+    if end < 0:
+        value = None
+        if position >= failure[0]:
+            _expect(failure, position, _constant4)
+    else:
+        value = _constant5(value)
+    return end, value
+
+
+def _parse43(tokens, length, position, failure):
+    end39 = -1
+    if position < length:
+        value40 = tokens[position]
+        try:
+            if value40 in _constant6:
+                end39 = position + 1
+        except TypeError:
+            pass
+    if end39 < 0:
+        value40 = None
+        if position >= failure[0]:
+            _expect(failure, position, _constant6)
+    else:
+        value40 = value40
+    if end39 < 0:
+        return -1, None
+    end41, value42 = IntFactorParser(tokens, length, end39, failure)
+    if end41 < 0:
+        return -1, None
+    return end41, (value40, value42, )
+
+
+def _parse44(tokens, length, position, failure):
+    values = []
+    while True:
+        end, value = _parse43(tokens, length, position, failure)
+        if end < 0:
+            break
+        values.append(value)
+        position = end
+    return position, values
+
+
+def IntTermParser(tokens, length, position, failure):
+    end35, value36 = IntFactorParser(tokens, length, position, failure)
+    if end35 < 0:
+        return -1, None
+    end37, value38 = _parse44(tokens, length, end35, failure)
+    if end37 < 0:
+        return -1, None
+    return end37, _constant7(value36, value38)
+
+
+def _parse51(tokens, length, position, failure):
+    if position < length and not tokens[position] != '(':
+        end45 = position + 1
+        value46 = '('
+    else:
+        end45 = -1
+        value46 = None
+        if position >= failure[0]:
+            _expect(failure, position, ('(',))
+    if end45 < 0:
+        return -1, None
+    end47, value48 = IntExprParser(tokens, length, end45, failure)
+    if end47 < 0:
+        return -1, None
+    if end47 < length and not tokens[end47] != ')':
+        end49 = end47 + 1
+        value50 = ')'
+    else:
+        end49 = -1
+        value50 = None
+        if end47 >= failure[0]:
+            _expect(failure, end47, (')',))
+    if end49 < 0:
+        return -1, None
+    return end49, (value46, value48, value50, )
+
+
+def IntFactorParser(tokens, length, position, failure):
+    end, value = IntParser(tokens, length, position, failure)
+    if end >= 0:
+        return end, _constant8(value)
+    end, value = _parse51(tokens, length, position, failure)
+    if end >= 0:
+        return end, _constant8(value)
+    return -1, None
+
+
+def _parse60(tokens, length, position, failure):
+    end56 = -1
+    if position < length:
+        value57 = tokens[position]
+        try:
+            if value57 in _constant9:
+                end56 = position + 1
+        except TypeError:
+            pass
+    if end56 < 0:
+        value57 = None
+        if position >= failure[0]:
+            _expect(failure, position, _constant9)
+    else:
+        value57 = value57
+    if end56 < 0:
+        return -1, None
+    end58, value59 = IntTermParser(tokens, length, end56, failure)
+    if end58 < 0:
+        return -1, None
+    return end58, (value57, value59, )
+
+
+def _parse61(tokens, length, position, failure):
+    values = []
+    while True:
+        end, value = _parse60(tokens, length, position, failure)
+        if end < 0:
+            break
+        values.append(value)
+        position = end
+    return position, values
+
+
+def IntExprParser(tokens, length, position, failure):
+    end52, value53 = IntTermParser(tokens, length, position, failure)
+    if end52 < 0:
+        return -1, None
+    end54, value55 = _parse61(tokens, length, end52, failure)
+    if end54 < 0:
+        return -1, None
+    return end54, _constant10(value53, value55)
+
+
+def _parse64(tokens, length, position, failure):
+    if position < length and not tokens[position] != '-':
+        end = position + 1
+        value = '-'
+    else:
+        end = -1
+        value = None
+        if position >= failure[0]:
+            _expect(failure, position, ('-',))
+    if end < 0:
+        return position, None
+    return end, value
+
+
+def _parse69(tokens, length, position, failure):
+    values = []
+    while True:
+        end, value = DigitParser(tokens, length, position, failure)
+        if end < 0:
+            break
+        values.append(value)
+        position = end
+    return position, values
+
+
+def IntParser(tokens, length, position, failure):
+    end62, value63 = _parse64(tokens, length, position, failure)
+    if end62 < 0:
+        return -1, None
+    end65, value66 = DigitParser(tokens, length, end62, failure)
+    if end65 < 0:
+        return -1, None
+    end67, value68 = _parse69(tokens, length, end65, failure)
+    if end67 < 0:
+        return -1, None
+    return end67, _constant11(value63, value66, value68)
+
+
+def DigitParser(tokens, length, position, failure):
+    end = -1
+    if position < length:
+        value = tokens[position]
+        try:
+            if value in _constant12:
+                end = position + 1
+        except TypeError:
+            pass
+    if end < 0:
+        value = None
+        if position >= failure[0]:
+            _expect(failure, position, _constant12)
+    else:
+        value = _constant13(value)
+    return end, value
+
+
+class Parser:
+    def __call__(self, tokens):
+        failure = [0, set()]
+        length = len(tokens)
+        end, value = StringExprParser(tokens, length, 0, failure)
+        if end == length:
+            return value
+        if end > failure[0]:
+            failure[0], failure[1] = end, set()
+        raise ParsingError("Syntax error", failure[0], failure[1])
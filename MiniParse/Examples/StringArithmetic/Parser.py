@@ -7,56 +7,29 @@ import MiniParse
 from . import ParsingUtilities
 
 
-class Parser:
-    def __call__(self, tokens):
-        class StringExprParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([StringTermParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.LiteralParser('+'), StringTermParser]))], ParsingUtilities.makeStringExpr).apply(cursor)
-
-        class StringTermParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.SequenceParser([IntTermParser, MiniParse.LiteralParser('*')])), StringFactorParser], ParsingUtilities.makeStringTerm).apply(cursor)
-
-        class StringFactorParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.AlternativeParser([StringParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), StringExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeStringFactor).apply(cursor)
-
-        class StringParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([MiniParse.LiteralParser('"'), MiniParse.RepeatedParser(CharParser), MiniParse.LiteralParser('"')], ParsingUtilities.makeString).apply(cursor)
-
-        class CharParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.AlternativeParser([MiniParse.LiteralParser('a'), MiniParse.LiteralParser('b'), MiniParse.LiteralParser('c'), MiniParse.LiteralParser('d'), MiniParse.LiteralParser('e'), MiniParse.LiteralParser('f')], ParsingUtilities.makeChar).apply(cursor)
+StringExprParser = MiniParse.RuleParser('StringExpr')
+StringTermParser = MiniParse.RuleParser('StringTerm')
+StringFactorParser = MiniParse.RuleParser('StringFactor')
+StringParser = MiniParse.RuleParser('String')
+CharParser = MiniParse.RuleParser('Char')
+IntTermParser = MiniParse.RuleParser('IntTerm')
+IntFactorParser = MiniParse.RuleParser('IntFactor')
+IntExprParser = MiniParse.RuleParser('IntExpr')
+IntParser = MiniParse.RuleParser('Int')
+DigitParser = MiniParse.RuleParser('Digit')
+
+StringExprParser.define(MiniParse.SequenceParser([StringTermParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.LiteralParser('+'), StringTermParser]))], ParsingUtilities.makeStringExpr))
+StringTermParser.define(MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.SequenceParser([IntTermParser, MiniParse.LiteralParser('*')])), StringFactorParser], ParsingUtilities.makeStringTerm))
+StringFactorParser.define(MiniParse.AlternativeParser([StringParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), StringExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeStringFactor))
+StringParser.define(MiniParse.RegularParser('"(?=(?P<g1>(?:[abcdef])*))(?P=g1)"', MiniParse.SequenceParser([MiniParse.LiteralParser('"'), MiniParse.RepeatedParser(CharParser), MiniParse.LiteralParser('"')], ParsingUtilities.makeString)))
+CharParser.define(MiniParse.SetParser(['a', 'b', 'c', 'd', 'e', 'f'], ParsingUtilities.makeChar))
+IntTermParser.define(MiniParse.OperatorPrecedenceParser(IntFactorParser, [(['*', '/'], 'left', ParsingUtilities.makeIntTerm)]))
+IntFactorParser.define(MiniParse.AlternativeParser([IntParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), IntExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeIntFactor))
+IntExprParser.define(MiniParse.OperatorPrecedenceParser(IntFactorParser, [(['+', '-'], 'left', ParsingUtilities.makeIntExpr), (['*', '/'], 'left', ParsingUtilities.makeIntTerm)]))
+IntParser.define(MiniParse.RegularParser('(?=(?P<g1>(?:\\-)?))(?P=g1)[0123456789](?=(?P<g2>(?:[0123456789])*))(?P=g2)', MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.LiteralParser('-')), DigitParser, MiniParse.RepeatedParser(DigitParser)], ParsingUtilities.makeInt)))
+DigitParser.define(MiniParse.SetParser(['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'], ParsingUtilities.makeDigit))
 
-        class IntTermParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([IntFactorParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.AlternativeParser([MiniParse.LiteralParser('*'), MiniParse.LiteralParser('/')]), IntFactorParser]))], ParsingUtilities.makeIntTerm).apply(cursor)
 
-        class IntFactorParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.AlternativeParser([IntParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), IntExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeIntFactor).apply(cursor)
-
-        class IntExprParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([IntTermParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.AlternativeParser([MiniParse.LiteralParser('+'), MiniParse.LiteralParser('-')]), IntTermParser]))], ParsingUtilities.makeIntExpr).apply(cursor)
-
-        class IntParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.LiteralParser('-')), DigitParser, MiniParse.RepeatedParser(DigitParser)], ParsingUtilities.makeInt).apply(cursor)
-
-        class DigitParser:
-            @staticmethod
-            def apply(cursor):
-                return MiniParse.AlternativeParser([MiniParse.LiteralParser('0'), MiniParse.LiteralParser('1'), MiniParse.LiteralParser('2'), MiniParse.LiteralParser('3'), MiniParse.LiteralParser('4'), MiniParse.LiteralParser('5'), MiniParse.LiteralParser('6'), MiniParse.LiteralParser('7'), MiniParse.LiteralParser('8'), MiniParse.LiteralParser('9')], ParsingUtilities.makeDigit).apply(cursor)
-
-        return MiniParse.parse(StringExprParser, tokens)
+class Parser:
+    def __call__(self, tokens, **options):
+        return MiniParse.parse(StringExprParser, tokens, **options)
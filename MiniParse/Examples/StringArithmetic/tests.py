@@ -2,20 +2,25 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+import random
 import unittest
 
 import MiniParse
 from . import Parser
+from . import DirectParser
 
 
 class StringArithmeticTestCase(unittest.TestCase):
+    parserClass = Parser.Parser
+    errorClass = MiniParse.ParsingError
+
     def parseAndDump(self, input, expectedOutput):
-        actualOutput = Parser.Parser()(input).dump()
+        actualOutput = self.parserClass()(input).dump()
         self.assertEqual(actualOutput, expectedOutput)
 
     def expectParsingError(self, input, expectedPosition, expectedExpected):
-        with self.assertRaises(MiniParse.ParsingError) as cm:
-            actualOutput = Parser.Parser()(input)
+        with self.assertRaises(self.errorClass) as cm:
+            actualOutput = self.parserClass()(input)
         self.assertEqual(cm.exception.message, "Syntax error")
         self.assertEqual(cm.exception.position, expectedPosition)
         self.assertEqual(cm.exception.expected, set(expectedExpected))
@@ -73,3 +78,100 @@ class StringArithmeticTestCase(unittest.TestCase):
 
     def testBadOperation(self):
         self.expectParsingError('(1%1)*"a"', 2, ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "-", "+", "*", "/", ")"])
+
+
+class DirectStringArithmeticTestCase(StringArithmeticTestCase):
+    parserClass = DirectParser.Parser
+    errorClass = DirectParser.ParsingError
+
+
+class IterativeStringArithmeticTestCase(StringArithmeticTestCase):
+    class parserClass:
+        parser = MiniParse.iterative(Parser.StringExprParser)
+
+        def __call__(self, tokens):
+            return MiniParse.parse(self.parser, tokens)
+
+    def testDeeplyNestedInput(self):
+        # The value can't be dumped: Arithmetics are computed recursively
+        self.assertIsNotNone(self.parserClass()("(" * 2000 + "3" + ")" * 2000 + '*"ab"'))
+
+
+class DirectBackendTestCase(unittest.TestCase):
+    def parse(self, parser, errorClass, input):
+        try:
+            return parser(input).dump()
+        except errorClass as e:
+            return (e.message, e.position, e.expected)
+
+    def testSameResultsAsCombinators(self):
+        r = random.Random(42)
+        for i in range(1000):
+            input = self.makeStringExpr(r, 3)
+            if r.random() < 0.5:
+                i = r.randrange(len(input) + 1)
+                input = input[:i] + r.choice('0+*/()"ax') + input[i + r.randrange(2):]
+            self.assertEqual(
+                self.parse(DirectParser.Parser(), DirectParser.ParsingError, input),
+                self.parse(Parser.Parser(), MiniParse.ParsingError, input)
+            )
+
+    def makeStringExpr(self, r, depth):
+        if depth == 0 or r.random() < 0.3:
+            return '"' + "".join(r.choice("abcdef") for i in range(r.randrange(3))) + '"'
+        elif r.random() < 0.3:
+            return "(" + self.makeStringExpr(r, depth - 1) + ")"
+        elif r.random() < 0.5:
+            return self.makeIntExpr(r, depth - 1) + "*" + self.makeStringExpr(r, depth - 1)
+        else:
+            return self.makeStringExpr(r, depth - 1) + "+" + self.makeStringExpr(r, depth - 1)
+
+    def makeIntExpr(self, r, depth):
+        if depth == 0 or r.random() < 0.3:
+            return r.choice(["", "-"]) + str(r.randrange(1, 30))
+        elif r.random() < 0.3:
+            return "(" + self.makeIntExpr(r, depth - 1) + ")"
+        else:
+            return self.makeIntExpr(r, depth - 1) + r.choice("+-*/") + self.makeIntExpr(r, depth - 1)
+
+
+class ParseManyTestCase(unittest.TestCase):
+    def testWorkers(self):
+        inputs = ['"ab"', '2*"a"', '"A"', '(1+1)*"abc"', '"abc'] * 20
+        results = list(MiniParse.parseMany("MiniParse.Examples.StringArithmetic.Parser:StringExprParser", inputs, workers=2, chunkSize=7))
+        self.assertEqual(len(results), len(inputs))
+        for input, result in zip(inputs, results):
+            try:
+                expected = Parser.Parser()(input).dump()
+            except MiniParse.ParsingError as e:
+                self.assertIsInstance(result, MiniParse.ParsingError)
+                self.assertEqual((result.position, result.expected), (e.position, e.expected))
+            else:
+                self.assertEqual(result.dump(), expected)
+
+
+class ParseEventsTestCase(unittest.TestCase):
+    def testGeneratedParser(self):
+        events = []
+
+        class Handler:
+            def enterRule(self, name, position):
+                events.append("<" + name)
+
+            def token(self, token, position):
+                events.append(token)
+
+            def exitRule(self, name, position):
+                events.append(name + ">")
+
+        MiniParse.parseEvents(Parser.StringExprParser, '2*"a"', Handler())
+        self.assertEqual(
+            events,
+            [
+                "<StringExpr", "<StringTerm",
+                "<IntTerm", "<IntFactor", "<Int", "<Digit", "2", "Digit>", "Int>", "IntFactor>", "IntTerm>",
+                "*",
+                "<StringFactor", "<String", '"', "<Char", "a", "Char>", '"', "String>", "StringFactor>",
+                "StringTerm>", "StringExpr>",
+            ]
+        )
@@ -20,6 +20,9 @@ class Builder:
     def makeRule(self, name, d):
         return Rule(name, d)
 
+    def makeAnnotatedRule(self, annotations, name, d):
+        return Rule(name, d)  # Annotations are not drawn
+
     def makeAlternative(self, elems):
         return self.__simplify(Alternative(elems))
 
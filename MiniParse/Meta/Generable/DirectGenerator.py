@@ -0,0 +1,69 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+from . import Prelude
+
+
+class DirectGenerator:
+    # Collects the functions of a standalone recursive descent parser. They all have the same signature:
+    #   def f(tokens, length, position, failure)
+    # and return (end, value), with end == -1 on failure. failure is [maxPosition, expected], updated only on
+    # failures, which gives the same ParsingError as MiniParse (see MiniParse.Core.Compiler).
+
+    def __init__(self, computeParserName):
+        self.computeParserName = computeParserName
+        self.__constants = []
+        self.__constantNames = {}
+        self.__functions = []
+        self.__variables = 0
+
+    def variable(self, prefix):
+        self.__variables += 1
+        return "%s%d" % (prefix, self.__variables)
+
+    def constant(self, source):
+        name = self.__constantNames.get(source)
+        if name is None:
+            name = "_constant%d" % len(self.__constants)
+            self.__constantNames[source] = name
+            self.__constants.append(name + " = " + source)
+        return name
+
+    def function(self, name, body):
+        self.__functions.append("def " + name + "(tokens, length, position, failure):")
+        self.__functions += self.indent(body)
+        self.__functions.append("")
+        self.__functions.append("")
+
+    def call(self, body, position, end, value):
+        name = self.variable("_parse")
+        self.function(name, body)
+        return ["%s, %s = %s(tokens, length, %s, failure)" % (end, value, name, position)]
+
+    @staticmethod
+    def indent(lines):
+        return ["    " + line for line in lines]
+
+    def generate(self, mainRule):
+        return "\n".join(
+            Prelude.parsingError
+            + Prelude.expect
+            + self.__constants
+            + ["", ""]
+            + self.__functions
+            + [
+                "class Parser:",
+                "    def __call__(self, tokens):",
+                "        failure = [0, set()]",
+                "        length = len(tokens)",
+                "        end, value = %s(tokens, length, 0, failure)" % self.computeParserName(mainRule),
+                "        if end == length:",
+                "            return value",
+                "        if end > failure[0]:",
+                "            failure[0], failure[1] = end, set()",
+                "        raise ParsingError(\"Syntax error\", failure[0], failure[1])",
+                "",
+            ]
+        )
+
@@ -0,0 +1,305 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+import collections
+
+from . import Prelude
+
+
+# How a production builds its value from the values of its symbols
+SEQUENCE = 0  # match(*values), or tuple(values) without match
+FIRST_VALUE = 1
+NO_VALUE = 2  # Absent optional
+PREPEND = 3  # (x, rest) of a repetition: rest is built in reverse order
+EMPTY_LIST = 4  # End of a repetition
+REVERSED = 5  # Whole repetition
+LIST = 6  # Fixed repetition
+
+
+class NotLL1Error(Exception):
+    def __init__(self, conflicts):
+        Exception.__init__(self, "Grammar is not LL(1):\n" + "\n".join(conflicts))
+        self.conflicts = conflicts
+
+
+class LL1Grammar:
+    # The productions of a Generable Syntax, with one nonterminal per rule and per nested composite expression.
+    # The order of productions of a nonterminal is the order of alternatives, because the parse table must give
+    # the same results as MiniParse's ordered choice. For LL(1) grammars, it tries the same alternatives as
+    # MiniParse at the position of the error, so it reports the same expected tokens.
+
+    def __init__(self):
+        self.__nonterminals = {}
+        self.__names = []
+        self.__rules = []
+        self.__terminals = []
+        self.__terminalIndexes = {}
+        self.__productions = []
+        self.__matches = []
+        self.__unsupported = []
+
+    def nonterminal(self, name):
+        index = self.__nonterminals.get(name)
+        if index is None:
+            index = len(self.__names)
+            self.__nonterminals[name] = index
+            self.__names.append(name)
+            self.__rules.append(name)
+        return index
+
+    def nested(self, parent, description):
+        index = len(self.__names)
+        self.__names.append(self.__rules[parent] + " " + description)
+        self.__rules.append(self.__rules[parent])
+        return index
+
+    def terminal(self, value):
+        index = self.__terminalIndexes.get(value)
+        if index is None:
+            index = len(self.__terminals)
+            self.__terminalIndexes[value] = index
+            self.__terminals.append(value)
+        return -1 - index
+
+    def production(self, nonterminal, symbols, kind, match=None):
+        if match is not None:
+            if match not in self.__matches:
+                self.__matches.append(match)
+            match = self.__matches.index(match)
+        self.__productions.append((nonterminal, tuple(symbols), kind, -1 if match is None else match))
+
+    def unsupported(self, nonterminal, construct):
+        self.__unsupported.append("%s: %s is not supported" % (self.__rules[nonterminal], construct))
+
+    @property
+    def matches(self):
+        return list(self.__matches)
+
+    def analyze(self, start):
+        return LL1Analysis(
+            self.__names, self.__rules, self.__terminals, self.__productions, self.__unsupported,
+            self.__nonterminals[start]
+        )
+
+
+class LL1Analysis:
+    def __init__(self, names, rules, terminals, productions, unsupported, start):
+        self.__names = names
+        self.__rules = rules
+        self.__terminals = terminals
+        self.__productions = productions
+        self.__start = start
+        self.__byNonterminal = [[] for name in names]
+        for index, production in enumerate(productions):
+            self.__byNonterminal[production[0]].append(index)
+        self.__computeFirst()
+        self.__computeFollow()
+        self.conflicts = list(unsupported)
+        self.__predictions = [self.__predict(nonterminal) for nonterminal in range(len(names))]
+
+    @property
+    def isLL1(self):
+        return len(self.conflicts) == 0
+
+    def __symbolFirst(self, symbol):
+        # (nullable, first terminals, expected terminals)
+        if symbol < 0:
+            return False, set([~symbol]), set([~symbol])
+        else:
+            return self.__nullable[symbol], self.__first[symbol], self.__expected[symbol]
+
+    def __sequenceFirst(self, symbols):
+        first = set()
+        expected = set()
+        for symbol in symbols:
+            nullable, symbolFirst, symbolExpected = self.__symbolFirst(symbol)
+            first |= symbolFirst
+            expected |= symbolExpected
+            if not nullable:
+                return False, first, expected
+        return True, first, expected
+
+    def __computeFirst(self):
+        # expected is what a failing MiniParse parser reports: the expected tokens of alternatives up to the first
+        # nullable one
+        count = len(self.__names)
+        self.__nullable = [False] * count
+        self.__first = [set() for i in range(count)]
+        self.__expected = [set() for i in range(count)]
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal, productions in enumerate(self.__byNonterminal):
+                nullable = False
+                first = set()
+                expected = set()
+                for index in productions:
+                    productionNullable, productionFirst, productionExpected = self.__sequenceFirst(self.__productions[index][1])
+                    first |= productionFirst
+                    if not nullable:
+                        expected |= productionExpected
+                    nullable = nullable or productionNullable
+                if (nullable, first, expected) != (self.__nullable[nonterminal], self.__first[nonterminal], self.__expected[nonterminal]):
+                    self.__nullable[nonterminal] = nullable
+                    self.__first[nonterminal] = first
+                    self.__expected[nonterminal] = expected
+                    changed = True
+
+    def __computeFollow(self):
+        # None stands for the end of input
+        self.__follow = [set() for name in self.__names]
+        self.__follow[self.__start].add(None)
+        changed = True
+        while changed:
+            changed = False
+            for nonterminal, symbols, kind, match in self.__productions:
+                for i, symbol in enumerate(symbols):
+                    if symbol >= 0:
+                        nullable, first, expected = self.__sequenceFirst(symbols[i + 1:])
+                        follow = set(first)
+                        if nullable:
+                            follow |= self.__follow[nonterminal]
+                        if not follow <= self.__follow[symbol]:
+                            self.__follow[symbol] |= follow
+                            changed = True
+
+    def __predict(self, nonterminal):
+        # Alternatives are numbered from 1 in conflicts
+        byToken = {}
+        default = -1
+        ambiguities = collections.OrderedDict()
+        for number, index in enumerate(self.__byNonterminal[nonterminal]):
+            nullable, first, expected = self.__sequenceFirst(self.__productions[index][1])
+            for terminal in sorted(first):
+                if terminal in byToken:
+                    ambiguities.setdefault("can start alternatives %d and %d" % (byToken[terminal] + 1, number + 1), []).append(terminal)
+                else:
+                    byToken[terminal] = number
+            if nullable:
+                if number != len(self.__byNonterminal[nonterminal]) - 1:
+                    self.__conflict(nonterminal, "nullable alternative %d is not the last one" % (number + 1))
+                else:
+                    default = number
+                    for terminal in sorted(self.__follow[nonterminal], key=lambda t: -1 if t is None else t):
+                        if terminal in byToken:
+                            ambiguities.setdefault("can start alternative %d and follow it" % (byToken[terminal] + 1), []).append(terminal)
+        for message, terminals in ambiguities.items():
+            self.__conflict(nonterminal, ", ".join(self.__describe(t) for t in terminals) + " " + message)
+        productions = self.__byNonterminal[nonterminal]
+        return (
+            dict((self.__terminals[terminal], productions[number]) for terminal, number in byToken.items()),
+            -1 if default == -1 else productions[default],
+            tuple(self.__terminals[terminal] for terminal in self.__expected[nonterminal]),
+        )
+
+    def __conflict(self, nonterminal, message):
+        conflict = self.__names[nonterminal] + ": " + message
+        if conflict not in self.conflicts:
+            self.conflicts.append(conflict)
+
+    def __describe(self, terminal):
+        return "end of input" if terminal is None else repr(self.__terminals[terminal])
+
+    @property
+    def table(self):
+        # Only tuples, dicts, ints and terminal values, so its repr is a Python literal
+        count = len(self.__names)
+        productions = []
+        for index, (nonterminal, symbols, kind, match) in enumerate(self.__productions):
+            skipped = set()
+            for other in self.__byNonterminal[nonterminal]:
+                if other == index:
+                    break
+                skipped |= self.__sequenceFirst(self.__productions[other][1])[2]
+            productions.append((
+                (count + index,) + tuple(reversed(symbols)),  # Pushed on the stack when predicted
+                len(symbols),
+                kind,
+                match,
+                tuple(self.__terminals[terminal] for terminal in skipped),
+            ))
+        return (tuple(self.__terminals), tuple(productions), tuple(self.__predictions), self.__start)
+
+    def generate(self, matches):
+        if not self.isLL1:
+            raise NotLL1Error(self.conflicts)
+        return (
+            "_matches = [" + ", ".join(matches) + "]\n"
+            + "_table = " + repr(self.table) + "\n"
+            + "\n\n"
+            + "\n".join(Prelude.parsingError)
+            + _driver
+        )
+
+
+_driver = '''
+class Parser:
+    def __call__(self, tokens):
+        terminals, productions, predictions, start = _table
+        count = len(predictions)
+        length = len(tokens)
+        position = 0
+        expected = set()  # At position
+        stack = [start]
+        values = []
+        while stack:
+            symbol = stack.pop()
+            if symbol >= count:  # End of a production: build its value, see kinds in MiniParse.Meta.Generable.LL1
+                pushed, size, kind, match, skipped = productions[symbol - count]
+                if size:
+                    arguments = values[-size:]
+                    del values[-size:]
+                else:
+                    arguments = []
+                if kind == 0:
+                    if match == -1:
+                        values.append(tuple(arguments))
+                    else:
+                        values.append(_matches[match](*arguments))
+                    continue
+                elif kind == 1:
+                    value = arguments[0]
+                elif kind == 2:
+                    value = None
+                elif kind == 3:
+                    value = arguments[1]
+                    value.append(arguments[0])
+                elif kind == 4:
+                    value = []
+                elif kind == 5:
+                    value = arguments[0]
+                    value.reverse()
+                else:
+                    value = arguments
+                if match != -1:
+                    value = _matches[match](value)
+                values.append(value)
+            elif symbol >= 0:  # Nonterminal
+                byToken, default, failure = predictions[symbol]
+                production = default
+                if position < length:
+                    try:
+                        production = byToken.get(tokens[position], default)
+                    except TypeError:
+                        pass
+                if production == -1:
+                    expected.update(failure)
+                    raise ParsingError("Syntax error", position, expected)
+                pushed, size, kind, match, skipped = productions[production]
+                expected.update(skipped)
+                stack.extend(pushed)
+            else:  # Terminal
+                terminal = terminals[~symbol]
+                if position < length and not tokens[position] != terminal:
+                    values.append(tokens[position])
+                    position += 1
+                    if expected:
+                        expected = set()
+                else:
+                    expected.add(terminal)
+                    raise ParsingError("Syntax error", position, expected)
+        if position != length:
+            raise ParsingError("Syntax error", position, expected)
+        return values[0]
+'''
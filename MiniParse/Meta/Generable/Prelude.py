@@ -0,0 +1,29 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Source lines shared by the standalone generated parsers (DirectGenerator and LL1), so that they raise the same
+# ParsingError as MiniParse.
+
+parsingError = [
+    "class ParsingError(Exception):",
+    "    def __init__(self, message, position, expected):",
+    "        Exception.__init__(self, message, position, expected)",
+    "        self.message = message",
+    "        self.position = position",
+    "        self.expected = expected",
+    "",
+    "",
+]
+
+# Same as MiniParse.Core.Compiler._expect
+expect = [
+    "def _expect(failure, position, expected):",
+    "    if position > failure[0]:",
+    "        failure[0] = position",
+    "        failure[1] = set(expected)",
+    "    else:",
+    "        failure[1].update(expected)",
+    "",
+    "",
+]
@@ -2,101 +2,507 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+import re
+
+from .DirectGenerator import DirectGenerator
+from .LL1 import LL1Grammar, SEQUENCE, FIRST_VALUE, NO_VALUE, PREPEND, EMPTY_LIST, REVERSED, LIST
+
 
 class Syntax:
     def __init__(self, rules):
         self.__rules = rules
 
     def generateMiniParser(self, mainRule, computeParserName, computeMatchName):
+        # The parser graph is built once, when the generated module is imported.
+        # Rules annotated with (* @operators *) are generated as OperatorPrecedenceParsers (other backends ignore
+        # annotations). Regular rules are generated as RegularParsers.
+        rules = dict((rule.name, rule) for rule in self.__rules)
+        patterns = self.regularPatterns()
         return (
-            "class Parser:\n"
-            + "    def __call__(self, tokens):\n"
-            + "\n".join(rule.generate(computeParserName, computeMatchName) for rule in self.__rules)
+            "".join(rule.generateDeclaration(computeParserName) for rule in self.__rules)
+            + "\n"
+            + "".join(rule.generateDefinition(computeParserName, computeMatchName, rules, patterns) for rule in self.__rules)
             + "\n"
-            + "        return MiniParse.parse(" + computeParserName(mainRule) + ", tokens)\n"
+            + "\n"
+            + "class Parser:\n"
+            + "    def __call__(self, tokens, **options):\n"
+            + "        return MiniParse.parse(" + computeParserName(mainRule) + ", tokens, **options)\n"
         )
 
+    def regularPatterns(self):
+        # Regular expressions of the rules that describe regular languages of characters: rules made of terminals of
+        # a single character, sequences, alternatives, options and repetitions, and references to such rules, without
+        # recursion. A pattern matches exactly the characters matched by the rule's parser: ordered choices and
+        # repetitions never backtrack into their elements, so they are made atomic with the (?=(...))\1 idiom.
+        # Rules that are a single terminal or a single set of terminals are not worth a regular expression.
+        rules = dict((rule.name, rule) for rule in self.__rules)
+        patterns = {}
+        for rule in self.__rules:
+            if not rule.isTerminalSet:
+                pattern = rule.regularPattern(rules, set(), [0])
+                if pattern is not None:
+                    patterns[rule.name] = pattern
+        return patterns
+
+    def generateDirectParser(self, mainRule, computeParserName, computeMatchName):
+        # A standalone recursive descent parser, with the same values and ParsingErrors as generateMiniParser
+        generator = DirectGenerator(computeParserName)
+        for rule in self.__rules:
+            rule.generateDirect(generator, computeMatchName)
+        return generator.generate(mainRule)
+
+    def analyzeLL1(self, mainRule, computeMatchName=lambda name: None):
+        grammar = LL1Grammar()
+        for rule in self.__rules:
+            rule.defineLL1(grammar, computeMatchName)
+        return grammar, grammar.analyze(mainRule)
+
+    def generateLL1Parser(self, mainRule, computeParserName, computeMatchName):
+        # A parse table and its driver, with the same values and ParsingErrors as generateMiniParser.
+        # Raises NotLL1Error, with the conflicts, if the grammar is not LL(1).
+        grammar, analysis = self.analyzeLL1(mainRule, computeMatchName)
+        return analysis.generate(grammar.matches)
+
 
 class Rule:
-    def __init__(self, name, definition):
+    def __init__(self, name, definition, annotations=()):
         self.__name = name
         self.__definition = definition
+        self.__annotations = annotations
+
+    @property
+    def name(self):
+        return self.__name
 
-    def generate(self, computeParserName, computeMatchName):
+    def generateDeclaration(self, computeParserName):
+        return computeParserName(self.__name) + " = MiniParse.RuleParser(" + repr(self.__name) + ")\n"
+
+    @property
+    def isTerminalSet(self):
+        return isinstance(self.__definition, (Terminal, NonTerminal)) or (isinstance(self.__definition, Alternative) and self.__definition.terminalValues is not None)
+
+    def generateDefinition(self, computeParserName, computeMatchName, rules, patterns):
         parserName = computeParserName(self.__name)
-        matchName = computeMatchName(self.__name)
-        if isinstance(self.__definition, (Terminal, NonTerminal)):  # @todo Use a virtual method...
-            return "        " + parserName + " = " + self.__definition.generate(computeParserName) + "\n"
+        if "operators" in self.__annotations:
+            definition = self.__generateOperators(computeParserName, computeMatchName, rules)
+        elif isinstance(self.__definition, (Terminal, NonTerminal)):  # @todo Use a virtual method...
+            definition = self.__definition.generate(computeParserName)
+        else:
+            definition = self.__definition.generate(computeParserName, ", " + computeMatchName(self.__name))
+        if self.__name in patterns:
+            definition = "MiniParse.RegularParser(" + repr(patterns[self.__name]) + ", " + definition + ")"
+        return parserName + ".define(" + definition + ")\n"
+
+    def regularPattern(self, rules, visiting, groups):
+        # None if the rule is not regular. groups counts the groups of the whole pattern, where rules are inlined.
+        if "operators" in self.__annotations or self.__name in visiting:
+            return None
+        visiting.add(self.__name)
+        pattern = self.__definition.regularPattern(rules, visiting, groups)
+        visiting.remove(self.__name)
+        return pattern
+
+    def operatorLevel(self):
+        # (operators, associativity, next rule name) if the rule is a level of OperatorPrecedenceParser
+        if isinstance(self.__definition, Sequence):
+            return self.__definition.operatorLevel(self.__name)
+
+    def __generateOperators(self, computeParserName, computeMatchName, rules):
+        # The chain of levels goes down from this rule as long as rules have the shape of a level
+        levels = []
+        names = set()
+        rule = self
+        while rule is not None and rule.name not in names and rule.operatorLevel() is not None:
+            names.add(rule.name)
+            operators, associativity, operand = rule.operatorLevel()
+            levels.append("(" + repr(operators) + ", " + repr(associativity) + ", " + computeMatchName(rule.name) + ")")
+            rule = rules.get(operand)
+        if not levels:
+            raise Exception("Rule " + self.__name + " is annotated with @operators but is not a level of operators")
+        return "MiniParse.OperatorPrecedenceParser(" + computeParserName(operand) + ", [" + ", ".join(levels) + "])"
+
+    def generateDirect(self, generator, computeMatchName):
+        if isinstance(self.__definition, (Terminal, NonTerminal)):
+            body = self.__definition.generateDirect(generator, "position", "end", "value") + ["return end, value"]
+        else:
+            body = self.__definition.generateDirectFunction(generator, computeMatchName(self.__name))
+        generator.function(generator.computeParserName(self.__name), body)
+
+    def defineLL1(self, grammar, computeMatchName):
+        nonterminal = grammar.nonterminal(self.__name)
+        if isinstance(self.__definition, (Terminal, NonTerminal)):
+            self.__definition.defineLL1(grammar, nonterminal)
         else:
-            return (
-                "        class " + parserName + ":\n"
-                + "            @staticmethod\n"
-                + "            def apply(cursor):\n"
-                + "                return " + self.__definition.generate(computeParserName, ", " + matchName) + ".apply(cursor)\n"
-            )
+            self.__definition.defineLL1(grammar, nonterminal, computeMatchName(self.__name))
 
 
 class Sequence:
     def __init__(self, terms):
         self.__terms = terms
 
+    def operatorLevel(self, name):
+        # Shapes of the levels of OperatorPrecedenceParser, in rule name:
+        #   name = next, {operators, next};
+        #   name = next, [operators, name];
+        #   name = {operators}, next;
+        if len(self.__terms) != 2:
+            return None
+        first, second = self.__terms
+        if isinstance(first, NonTerminal) and isinstance(second, (Repeated, Optional)):
+            inner = second.definition
+            if isinstance(inner, Sequence) and len(inner.__terms) == 2 and isinstance(inner.__terms[1], NonTerminal):
+                operators = _operators(inner.__terms[0])
+                operand = inner.__terms[1].name
+                if operators is not None and isinstance(second, Repeated) and operand == first.name:
+                    return operators, "left", first.name
+                if operators is not None and isinstance(second, Optional) and operand == name:
+                    return operators, "right", first.name
+        elif isinstance(first, Repeated) and isinstance(second, NonTerminal):
+            operators = _operators(first.definition)
+            if operators is not None:
+                return operators, "prefix", second.name
+        return None
+
+    def regularPattern(self, rules, visiting, groups):
+        patterns = [term.regularPattern(rules, visiting, groups) for term in self.__terms]
+        if None in patterns:
+            return None
+        return "".join(patterns)
+
     def generate(self, computeParserName, args=""):
         return "MiniParse.SequenceParser([" + ", ".join(t.generate(computeParserName) for t in self.__terms) + "]" + args + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        lines = []
+        current = "position"
+        values = []
+        for term in self.__terms:
+            termEnd = generator.variable("end")
+            termValue = generator.variable("value")
+            lines += term.generateDirect(generator, current, termEnd, termValue)
+            lines += ["if " + termEnd + " < 0:", "    return -1, None"]
+            current = termEnd
+            values.append(termValue)
+        if match is None:
+            result = "(" + "".join(v + ", " for v in values) + ")"
+        else:
+            result = generator.constant(match) + "(" + ", ".join(values) + ")"
+        return lines + ["return " + current + ", " + result]
+
+    def symbolLL1(self, grammar, parent):
+        nonterminal = grammar.nested(parent, "(..., ...)")
+        self.defineLL1(grammar, nonterminal)
+        return nonterminal
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.production(nonterminal, [term.symbolLL1(grammar, nonterminal) for term in self.__terms], SEQUENCE, match)
+
 
 class Alternative:
     def __init__(self, definitions):
         self.__definitions = definitions
 
+    @property
+    def terminalValues(self):
+        # None if some definitions are not terminals
+        if self.__isSet():
+            return [d.value for d in self.__definitions]
+
+    def regularPattern(self, rules, visiting, groups):
+        if self.__isSet() and all(len(d.value) == 1 for d in self.__definitions):
+            return "[" + "".join(re.escape(d.value) for d in self.__definitions) + "]"
+        patterns = [d.regularPattern(rules, visiting, groups) for d in self.__definitions]
+        if None in patterns:
+            return None
+        return _atomic("|".join(patterns), groups)
+
     def generate(self, computeParserName, args=""):
+        if all(isinstance(d, Terminal) for d in self.__definitions):
+            # A single-step SetParser reports the same expected set as an AlternativeParser of LiteralParsers
+            return "MiniParse.SetParser([" + ", ".join(repr(d.value) for d in self.__definitions) + "]" + args + ")"
         return "MiniParse.AlternativeParser([" + ", ".join(d.generate(computeParserName) for d in self.__definitions) + "]" + args + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        if self.__isSet():
+            return self.__generateDirectSet(generator, position, end, value, None)
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        if self.__isSet():
+            return self.__generateDirectSet(generator, "position", "end", "value", match) + ["return end, value"]
+        lines = []
+        for d in self.__definitions:
+            lines += d.generateDirect(generator, "position", "end", "value")
+            lines += ["if end >= 0:", "    return end, " + _applyMatch(generator, match, "value")]
+        return lines + ["return -1, None"]
+
+    def symbolLL1(self, grammar, parent):
+        nonterminal = grammar.nested(parent, "(... | ...)")
+        self.defineLL1(grammar, nonterminal)
+        return nonterminal
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        for d in self.__definitions:
+            grammar.production(nonterminal, [d.symbolLL1(grammar, nonterminal)], FIRST_VALUE, match)
+
+    def __isSet(self):
+        return all(isinstance(d, Terminal) for d in self.__definitions)
+
+    def __generateDirectSet(self, generator, position, end, value, match):
+        values = generator.constant("frozenset([" + ", ".join(repr(d.value) for d in self.__definitions) + "])")
+        return [
+            end + " = -1",
+            "if " + position + " < length:",
+            "    " + value + " = tokens[" + position + "]",
+            "    try:",
+            "        if " + value + " in " + values + ":",
+            "            " + end + " = " + position + " + 1",
+            "    except TypeError:",
+            "        pass",
+            "if " + end + " < 0:",
+            "    " + value + " = None",
+            "    if " + position + " >= failure[0]:",
+            "        _expect(failure, " + position + ", " + values + ")",
+            "else:",
+            "    " + value + " = " + _applyMatch(generator, match, value),
+        ]
+
 
 class Optional:
     def __init__(self, definition):
         self.__definition = definition
 
+    @property
+    def definition(self):
+        return self.__definition
+
+    def regularPattern(self, rules, visiting, groups):
+        pattern = self.__definition.regularPattern(rules, visiting, groups)
+        if pattern is None:
+            return None
+        return _atomic("(?:" + pattern + ")?", groups)
+
     def generate(self, computeParserName, args=""):
+        if args:
+            args = ", None" + args  # match is the third argument of OptionalParser
         return "MiniParse.OptionalParser(" + self.__definition.generate(computeParserName) + args + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        return self.__definition.generateDirect(generator, "position", "end", "value") + [
+            "if end < 0:",
+            "    return position, None",
+            "return end, " + _applyMatch(generator, match, "value"),
+        ]
+
+    def symbolLL1(self, grammar, parent):
+        nonterminal = grammar.nested(parent, "[...]")
+        self.defineLL1(grammar, nonterminal)
+        return nonterminal
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.production(nonterminal, [self.__definition.symbolLL1(grammar, nonterminal)], FIRST_VALUE, match)
+        grammar.production(nonterminal, [], NO_VALUE)
+
 
 class Repeated:
     def __init__(self, definition):
         self.__definition = definition
 
+    @property
+    def definition(self):
+        return self.__definition
+
+    def regularPattern(self, rules, visiting, groups):
+        pattern = self.__definition.regularPattern(rules, visiting, groups)
+        if pattern is None:
+            return None
+        return _atomic("(?:" + pattern + ")*", groups)
+
     def generate(self, computeParserName, args=""):
         return "MiniParse.RepeatedParser(" + self.__definition.generate(computeParserName) + args + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        return ["values = []", "while True:"] + generator.indent(
+            self.__definition.generateDirect(generator, "position", "end", "value") + [
+                "if end < 0:",
+                "    break",
+                "values.append(value)",
+                "position = end",
+            ]
+        ) + ["return position, " + _applyMatch(generator, match, "values")]
+
+    def symbolLL1(self, grammar, parent):
+        nonterminal = grammar.nested(parent, "{...}")
+        self.defineLL1(grammar, nonterminal)
+        return nonterminal
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        loop = grammar.nested(nonterminal, "{...}")
+        grammar.production(nonterminal, [loop], REVERSED, match)
+        grammar.production(loop, [self.__definition.symbolLL1(grammar, loop), loop], PREPEND)
+        grammar.production(loop, [], EMPTY_LIST)
+
 
 class Terminal:
     def __init__(self, value):
         self.__value = value
 
+    @property
+    def value(self):
+        return self.__value
+
+    def regularPattern(self, rules, visiting, groups):
+        # A terminal of several characters is a single token, not a sequence of characters
+        if len(self.__value) == 1:
+            return re.escape(self.__value)
+
     def generate(self, computeParserName):
         return "MiniParse.LiteralParser(" + repr(self.__value) + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        return [
+            "if " + position + " < length and not tokens[" + position + "] != " + repr(self.__value) + ":",
+            "    " + end + " = " + position + " + 1",
+            "    " + value + " = " + repr(self.__value),
+            "else:",
+            "    " + end + " = -1",
+            "    " + value + " = None",
+            "    if " + position + " >= failure[0]:",
+            "        _expect(failure, " + position + ", (" + repr(self.__value) + ",))",
+        ]
+
+    def symbolLL1(self, grammar, parent):
+        return grammar.terminal(self.__value)
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.production(nonterminal, [self.symbolLL1(grammar, nonterminal)], FIRST_VALUE, match)
+
 
 class NonTerminal:
     def __init__(self, name):
         self.__name = name
 
+    @property
+    def name(self):
+        return self.__name
+
+    def regularPattern(self, rules, visiting, groups):
+        rule = rules.get(self.__name)
+        if rule is not None:
+            return rule.regularPattern(rules, visiting, groups)
+
     def generate(self, computeParserName):
         return computeParserName(self.__name)
 
+    def generateDirect(self, generator, position, end, value):
+        return [end + ", " + value + " = " + generator.computeParserName(self.__name) + "(tokens, length, " + position + ", failure)"]
+
+    def symbolLL1(self, grammar, parent):
+        return grammar.nonterminal(self.__name)
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.production(nonterminal, [self.symbolLL1(grammar, nonterminal)], FIRST_VALUE, match)
+
 
 class Restriction:
     def __init__(self, base, exception):
         self.__base = base
         self.__exception = exception
 
+    def regularPattern(self, rules, visiting, groups):
+        return None
+
     def generate(self, computeParserName, args=""):
         return "MiniParse.RestrictionParser(" + self.__base.generate(computeParserName) + ", " + self.__exception.generate(computeParserName) + args + ")"
 
+    def generateDirect(self, generator, position, end, value):
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        # The exception is tried first, as a lookahead that doesn't contribute to the furthest failure
+        return [
+            "failureBeforeException = failure[:]",
+            "failure[0], failure[1] = -1, None",
+        ] + self.__exception.generateDirect(generator, "position", "excludedEnd", "value") + [
+            "failure[:] = failureBeforeException",
+        ] + self.__base.generateDirect(generator, "position", "end", "value") + [
+            "if end < 0 or end == excludedEnd:",
+            "    return -1, None",
+            "return end, " + _applyMatch(generator, match, "value"),
+        ]
+
+    def symbolLL1(self, grammar, parent):
+        grammar.unsupported(parent, "restriction")
+        return grammar.nested(parent, "... - ...")
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.unsupported(nonterminal, "restriction")
+
 
 class Repetition:
     def __init__(self, n, base):
         self.__n = n
         self.__base = base
 
+    def regularPattern(self, rules, visiting, groups):
+        pattern = self.__base.regularPattern(rules, visiting, groups)
+        if pattern is None:
+            return None
+        return "(?:" + pattern + "){" + str(self.__n) + "}"
+
     def generate(self, computeParserName, args=""):
         return "MiniParse.RepetitionParser(" + str(self.__n) + ", " + self.__base.generate(computeParserName) + args + ")"
+
+    def generateDirect(self, generator, position, end, value):
+        return generator.call(self.generateDirectFunction(generator), position, end, value)
+
+    def generateDirectFunction(self, generator, match=None):
+        return ["values = []", "for i in range(" + str(self.__n) + "):"] + generator.indent(
+            self.__base.generateDirect(generator, "position", "end", "value") + [
+                "if end < 0:",
+                "    return -1, None",
+                "values.append(value)",
+                "position = end",
+            ]
+        ) + ["return position, " + _applyMatch(generator, match, "values")]
+
+    def symbolLL1(self, grammar, parent):
+        nonterminal = grammar.nested(parent, str(self.__n) + " * ...")
+        self.defineLL1(grammar, nonterminal)
+        return nonterminal
+
+    def defineLL1(self, grammar, nonterminal, match=None):
+        grammar.production(nonterminal, [self.__base.symbolLL1(grammar, nonterminal)] * self.__n, LIST, match)
+
+
+def _operators(definition):
+    if isinstance(definition, Terminal):
+        return [definition.value]
+    elif isinstance(definition, Alternative):
+        return definition.terminalValues
+    else:
+        return None
+
+
+def _atomic(pattern, groups):
+    # Matches like pattern, but the regular expression engine can't backtrack into it. The lookahead is atomic, and
+    # the named backreference consumes what it captured.
+    groups[0] += 1
+    name = "g" + str(groups[0])
+    return "(?=(?P<" + name + ">" + pattern + "))(?P=" + name + ")"
+
+
+def _applyMatch(generator, match, value):
+    if match is None:
+        return value
+    else:
+        return generator.constant(match) + "(" + value + ")"
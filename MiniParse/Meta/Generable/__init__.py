@@ -12,6 +12,9 @@ class Builder:
     def makeRule(self, name, d):
         return Rule(name, d)
 
+    def makeAnnotatedRule(self, annotations, name, d):
+        return Rule(name, d, annotations)
+
     def makeAlternative(self, elems):
         return Alternative(elems)
 
@@ -2,16 +2,16 @@
 
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
+import itertools
 import unittest
 
 import MiniParse
 from MiniParse.Meta.Generable import builder
+from MiniParse.Meta.Generable.LL1 import NotLL1Error
 from MiniParse.Meta.Grammars.HandWrittenEbnf import parse as parseEbnf
 
 
-class GenerableIntegrationTestCase(unittest.TestCase):
-    def test(self):
-        s = parseEbnf(builder, """
+grammar = """
             Main = Toto | "titi" | TutuToto | ManyTata | MaybeTete | ThreeTuto | ManyTutaButNotTwo;
             Toto = "toto";
             TutuToto = "tutu", Toto;
@@ -19,7 +19,12 @@ class GenerableIntegrationTestCase(unittest.TestCase):
             MaybeTete = ["tete"];
             ThreeTuto = 3 * "tuto";
             ManyTutaButNotTwo = {"tuta"} - ("tuta", "tuta");
-        """)
+        """
+
+
+class GenerableIntegrationTestCase(unittest.TestCase):
+    def test(self):
+        s = parseEbnf(builder, grammar)
         code = s.generateMiniParser("Main", computeParserName=lambda rule: rule + "Parser", computeMatchName=lambda rule: "lambda *x: tuple(['" + rule + ":'] + list(x))")
         globs = {"MiniParse": MiniParse}
         exec(code, globs)
@@ -33,3 +38,199 @@ class GenerableIntegrationTestCase(unittest.TestCase):
         # self.assertEqual(p(["tete"]), ("Main:", ("MaybeTete:", "tete")))
         # self.assertEqual(p(["tuto", "tuto", "tuto"]), ())
         # self.assertEqual(p(["tuta", "tuta", "tuta"]), ())
+
+    def testAlternativeOfTerminalsIsASet(self):
+        s = parseEbnf(builder, """
+            Main = Digit, {Digit};
+            Digit = "0" | "1" | "2";
+        """)
+        code = s.generateMiniParser("Main", computeParserName=lambda rule: rule + "Parser", computeMatchName=lambda rule: "lambda *x: x")
+        self.assertIn("MiniParse.SetParser(['0', '1', '2']", code)
+        globs = {"MiniParse": MiniParse}
+        exec(code, globs)
+        p = globs["Parser"]()
+        self.assertEqual(p(["1", "0"]), (("1",), [("0",)]))
+        with self.assertRaises(MiniParse.ParsingError) as cm:
+            p(["1", "3"])
+        self.assertEqual(cm.exception.position, 1)
+        self.assertEqual(cm.exception.expected, set(["0", "1", "2"]))
+
+
+class BackendComparison:
+    # Helpers to compare the parsers generated by two backends
+    backend = "generateDirectParser"
+
+    def generate(self, generator):
+        code = generator("Main", computeParserName=lambda rule: rule + "Parser", computeMatchName=lambda rule: "lambda *x: tuple(['" + rule + ":'] + list(x))")
+        globs = {"MiniParse": MiniParse}
+        exec(code, globs)
+        return globs["Parser"](), globs.get("ParsingError", MiniParse.ParsingError)
+
+    def parse(self, parser, errorClass, tokens):
+        try:
+            return parser(tokens)
+        except errorClass as e:
+            return (e.message, e.position, e.expected)
+
+    def expectSameResultsAsCombinators(self, grammar, words, maxLength):
+        s = parseEbnf(builder, grammar)
+        combinators, combinatorsError = self.generate(s.generateMiniParser)
+        other, otherError = self.generate(getattr(s, self.backend))
+        for length in range(maxLength + 1):
+            for tokens in itertools.product(words, repeat=length):
+                tokens = list(tokens)
+                self.assertEqual(self.parse(other, otherError, tokens), self.parse(combinators, combinatorsError, tokens))
+
+
+class DirectBackendTestCase(BackendComparison, unittest.TestCase):
+    def testDoesNotUseMiniParse(self):
+        s = parseEbnf(builder, grammar)
+        self.assertNotIn("MiniParse", s.generateDirectParser("Main", lambda rule: rule + "Parser", lambda rule: "f"))
+
+    def testSameResultsAsCombinators(self):
+        self.expectSameResultsAsCombinators(grammar, ["toto", "titi", "tutu", "tata", "tete", "tuto", "tuta"], 4)
+
+    def testSameResultsAsCombinatorsWithAllConstructs(self):
+        self.expectSameResultsAsCombinators(
+            """
+                Main = {Item}, ["end"];
+                Item = ThreeTuto | TutuToto | ("tata", MaybeTete) | ("[", Restricted, "]") | Letter;
+                ThreeTuto = 3 * "tuto";
+                TutuToto = "tutu", Toto;
+                Toto = "toto";
+                MaybeTete = ["tete"];
+                Restricted = {"tuta"} - ("tuta", "tuta");
+                Letter = "a" | "b";
+            """,
+            ["tuto", "tutu", "toto", "tata", "tete", "tuta", "[", "]", "end", "a"],
+            4
+        )
+
+    def testExceptionIsNotExpected(self):
+        grammar = 'Main = ("a" - ("a", "b")), "c";'
+        self.expectSameResultsAsCombinators(grammar, ["a", "b", "c", "x"], 3)
+        direct, directError = self.generate(parseEbnf(builder, grammar).generateDirectParser)
+        self.assertEqual(self.parse(direct, directError, ["a", "x"]), ("Syntax error", 1, set(["c"])))
+
+
+class OperatorsAnnotationTestCase(BackendComparison, unittest.TestCase):
+    grammar = """
+        Main = Sum;
+        (* @operators *)
+        Sum = Product, {("+" | "-"), Product};
+        Product = Power, {"*", Power};
+        Power = Negation, ["^", Power];
+        Negation = {"-"}, Atom;
+        Atom = "a" | "(", Sum, ")";
+    """
+
+    def testGeneratesOperatorPrecedenceParser(self):
+        code = parseEbnf(builder, self.grammar).generateMiniParser("Sum", lambda rule: rule + "Parser", lambda rule: "f" + rule)
+        self.assertIn(
+            "SumParser.define(MiniParse.OperatorPrecedenceParser(AtomParser, ["
+            + "(['+', '-'], 'left', fSum), (['*'], 'left', fProduct), (['^'], 'right', fPower), (['-'], 'prefix', fNegation)"
+            + "]))",
+            code
+        )
+
+    def testSameResultsAsRuleChain(self):
+        # The direct backend ignores annotations
+        self.expectSameResultsAsCombinators(self.grammar, ["a", "+", "-", "*", "^", "(", ")"], 5)
+
+    def testNotALevel(self):
+        with self.assertRaises(Exception) as cm:
+            parseEbnf(builder, '(* @operators *) Main = "a";').generateMiniParser("Main", lambda rule: rule, lambda rule: "f")
+        self.assertEqual(cm.exception.args, ("Rule Main is annotated with @operators but is not a level of operators",))
+
+
+class RegularPatternsTestCase(unittest.TestCase):
+    grammar = """
+        Main = {Item | Number | Word}, ["."];
+        Item = "(", Main, ")";
+        Number = ["-"], Digit, {Digit}, [".", 2 * Digit];
+        Digit = "0" | "1" | "9";
+        Word = Greedy | Prefix;
+        Greedy = {"a"}, "a";
+        Prefix = ("a" | ("a", "b")), "c";
+        Restricted = {"a"} - "a";
+    """
+
+    def testPatterns(self):
+        patterns = parseEbnf(builder, self.grammar).regularPatterns()
+        # Main and Item are recursive, Digit is a set, Restricted is not regular
+        self.assertEqual(sorted(patterns), ["Greedy", "Number", "Prefix", "Word"])
+        self.assertEqual(patterns["Greedy"], "(?=(?P<g1>(?:a)*))(?P=g1)a")
+        self.assertEqual(patterns["Prefix"], "(?=(?P<g1>a|ab))(?P=g1)c")
+
+    def testGeneratesRegularParsers(self):
+        code = parseEbnf(builder, self.grammar).generateMiniParser("Main", lambda rule: rule + "Parser", lambda rule: "f" + rule)
+        self.assertIn("PrefixParser.define(MiniParse.RegularParser('(?=(?P<g1>a|ab))(?P=g1)c', MiniParse.SequenceParser([", code)
+        self.assertIn("DigitParser.define(MiniParse.SetParser(", code)
+
+    def testSameResultsAsCombinators(self):
+        s = parseEbnf(builder, self.grammar)
+        code = s.generateMiniParser("Main", lambda rule: rule + "Parser", lambda rule: "lambda *x: x")
+        globs = {"MiniParse": MiniParse}
+        exec(code, globs)
+        p = globs["MainParser"]
+        for length in range(5):
+            for tokens in itertools.product("(-0.9abc)", repeat=length):
+                tokens = "".join(tokens)
+                self.assertEqual(self.validate(p, tokens, optimistic=True), self.validate(p, tokens))
+
+    @staticmethod
+    def validate(parser, tokens, **options):
+        try:
+            return MiniParse.validate(parser, tokens, **options)
+        except MiniParse.ParsingError as e:
+            return (e.position, e.expected)
+
+
+class LL1TestCase(BackendComparison, unittest.TestCase):
+    backend = "generateLL1Parser"
+
+    grammar = """
+        Main = {Item}, ["end"];
+        Item = ThreeTuto | TutuToto | ("tata", MaybeTete) | ("[", {Item}, "]") | Letter;
+        ThreeTuto = 3 * "tuto";
+        TutuToto = "tutu", Toto;
+        Toto = "toto";
+        MaybeTete = ["tete"];
+        Letter = "a" | "b";
+    """
+
+    def conflicts(self, grammar):
+        grammar, analysis = parseEbnf(builder, grammar).analyzeLL1("Main")
+        return analysis.conflicts
+
+    def testLL1Grammar(self):
+        self.assertEqual(self.conflicts(self.grammar), [])
+
+    def testConflicts(self):
+        self.assertEqual(
+            self.conflicts("""
+                Main = A | B | [C], "c";
+                A = "a", "b";
+                B = "a" | "b";
+                C = "c";
+            """),
+            ["Main: 'a' can start alternatives 1 and 2", "Main [...]: 'c' can start alternative 1 and follow it"]
+        )
+
+    def testNullableAlternativeMustBeLast(self):
+        self.assertEqual(self.conflicts('Main = ["a"] | "b";'), ["Main: nullable alternative 1 is not the last one"])
+
+    def testRestrictionIsNotSupported(self):
+        self.assertEqual(self.conflicts('Main = {"a"} - "a";'), ["Main: restriction is not supported"])
+
+    def testGenerateNonLL1Grammar(self):
+        with self.assertRaises(NotLL1Error) as cm:
+            parseEbnf(builder, 'Main = ["a"] | "b";').generateLL1Parser("Main", lambda rule: rule, lambda rule: None)
+        self.assertEqual(cm.exception.conflicts, ["Main: nullable alternative 1 is not the last one"])
+
+    def testTableIsALiteral(self):
+        grammar, analysis = parseEbnf(builder, self.grammar).analyzeLL1("Main")
+        self.assertEqual(eval(repr(analysis.table)), analysis.table)
+
+    def testSameResultsAsCombinators(self):
+        self.expectSameResultsAsCombinators(self.grammar, ["tuto", "tutu", "toto", "tata", "tete", "[", "]", "end", "a", "b"], 4)
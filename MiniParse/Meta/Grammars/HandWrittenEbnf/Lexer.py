@@ -10,12 +10,23 @@ from . import Tokens as Tok
 
 class Lexer:
     def __init__(self):
+        # A single regular expression for all tokens, tried in the same order as separate expressions would be,
+        # followed by spaces. Each alternative has exactly one named group, which tells the kind of token.
         self.__space = re.compile("[ \t\n\r\v\f]*")
-        self.__terminal1 = re.compile('".*?"')
-        self.__terminal2 = re.compile("'.*?'")
-        self.__comment = re.compile("\(\*.*?\*\)", re.DOTALL)
-        self.__metaIdentifierWord = re.compile("[a-zA-Z][a-zA-Z0-9]*")
-        self.__integer = re.compile("[0-9]+")
+        self.__token = re.compile(
+            "(?:"
+            + "(?P<integer>[0-9]+)"
+            + '|"(?P<terminal1>[^\n]*?)"'
+            + "|'(?P<terminal2>[^\n]*?)'"
+            + "|\\(\\*(?P<comment>.*?)\\*\\)"
+            + "|(?P<unclosedComment>\\(\\*)"
+            + "|(?P<unclosedString>[\"'])"
+            + "|(?P<metaIdentifier>[a-zA-Z][a-zA-Z0-9]*(?:[ \t\n\r\v\f]+[a-zA-Z][a-zA-Z0-9]*)*)"
+            + "|(?P<operator>[-*,|=;()\\[\\]{}])"
+            + "|(?P<unexpected>.)"
+            + ")[ \t\n\r\v\f]*",
+            re.DOTALL
+        )
         self.__operators = {
             "*": Tok.Repetition,
             "-": Tok.Except,
@@ -31,47 +42,56 @@ class Lexer:
             "{": Tok.StartRepeat,
             "}": Tok.EndRepeat
         }
+        # Comments like (* @operators *) are annotations of the rule that follows them
+        self.__annotations = set(["operators"])
 
     def __call__(self, s):
-        return list(self.__run(s))
+        return list(self.iterate(s))
 
-    def __run(self, s):
-        i = self.__skipSpaces(s, 0)
-        while i < len(s):
-            i_before = i
-            i, tok = self.__next(s, i)
-            if not isinstance(tok, Tok.Comment):
-                yield i_before, tok
-
-    def __skipSpaces(self, s, i):
-        return self.__space.match(s, i).end()
-
-    def __next(self, s, i):
-        m = self.__integer.match(s, i)
-        if m:
-            return self.__skipSpaces(s, m.end()), Tok.Integer(int(m.group()))
-        m = self.__terminal1.match(s, i)
-        if m:
-            return self.__skipSpaces(s, m.end()), Tok.Terminal(m.group()[1:-1])
-        m = self.__terminal2.match(s, i)
-        if m:
-            return self.__skipSpaces(s, m.end()), Tok.Terminal(m.group()[1:-1])
-        m = self.__comment.match(s, i)
-        if m:
-            return self.__skipSpaces(s, m.end()), Tok.Comment(m.group()[2:-2].strip())
-        if s[i:i + 2] == "(*":
-            raise MiniParse.ParsingError("Unclosed comment", i, set())
-        if s[i] in ["'", '"']:
-            raise MiniParse.ParsingError("Unclosed string", i, set())
-        m = self.__metaIdentifierWord.match(s, i)
-        if m:
-            words = []
-            while m:
-                i = m.end()
-                words.append(m.group())
-                i = self.__skipSpaces(s, i)
-                m = self.__metaIdentifierWord.match(s, i)
-            return self.__skipSpaces(s, i), Tok.MetaIdentifier(words)
-        if s[i] in self.__operators:
-            return self.__skipSpaces(s, i + 1), self.__operators[s[i]]
-        raise MiniParse.ParsingError("Unexpected character", i, set())
+    def iterate(self, s):
+        # Generates the (offset, token) pairs
+        operators = self.__operators
+        # Tokens interned by their text: each identifier, terminal or integer is created once
+        metaIdentifiers = {}
+        terminals = {}
+        integers = {}
+        # Annotations found where a rule can start (at the beginning or after a ";"), yielded only if a rule does
+        # start after them. All other comments are skipped.
+        atRuleStart = True
+        annotations = []
+        # The last alternative matches any character, so tokens are contiguous
+        for m in self.__token.finditer(s, self.__space.match(s).end()):
+            kind = m.lastgroup
+            if kind == "operator":
+                token = operators[m.group(kind)]
+            elif kind == "metaIdentifier":
+                text = m.group(kind)
+                token = metaIdentifiers.get(text)
+                if token is None:
+                    token = metaIdentifiers[text] = Tok.MetaIdentifier(text.split())
+                for annotation in annotations:
+                    yield annotation
+            elif kind == "terminal1" or kind == "terminal2":
+                text = m.group(kind)
+                token = terminals.get(text)
+                if token is None:
+                    token = terminals[text] = Tok.Terminal(text)
+            elif kind == "integer":
+                text = m.group(kind)
+                token = integers.get(text)
+                if token is None:
+                    token = integers[text] = Tok.Integer(int(text))
+            elif kind == "comment":
+                comment = m.group(kind).strip()
+                if atRuleStart and comment.startswith("@") and comment[1:] in self.__annotations:
+                    annotations.append((m.start(), Tok.Annotation(comment[1:])))
+                continue
+            elif kind == "unclosedComment":
+                raise MiniParse.ParsingError("Unclosed comment", m.start(), set())
+            elif kind == "unclosedString":
+                raise MiniParse.ParsingError("Unclosed string", m.start(), set())
+            else:
+                raise MiniParse.ParsingError("Unexpected character", m.start(), set())
+            yield m.start(), token
+            atRuleStart = token is Tok.Terminator
+            annotations = []
@@ -3,23 +3,31 @@
 # Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
 
 from MiniParse import LiteralParser, SequenceParser, AlternativeParser, OptionalParser, RepeatedParser, parse
+from MiniParse.Core.First import First
 
 from . import Tokens as Tok
 
 
 class ClassParser:
-    def __init__(self, class_, match):
-        self.__class = class_
-        self.__match = match
+    # Accepts a token whose class is a key of matches, and calls the corresponding match function on it. Classes
+    # are looked up by type(token), so subclasses of the keys are not accepted.
+    def __init__(self, matches):
+        self.__matches = dict(matches)
+        self.__expected = [class_.__name__ for class_ in self.__matches]
 
     def apply(self, cursor):
         with cursor.backtracking as bt:
-            if cursor.finished or not isinstance(cursor.current, self.__class):
-                return bt.expected(self.__class.__name__)
+            match = None if cursor.finished else self.__matches.get(type(cursor.current))
+            if match is None:
+                cursor.addExpected(self.__expected)
+                return bt.failure()
             else:
                 m = cursor.current
                 cursor.advance()
-                return bt.success(self.__match(m))
+                return bt.success(cursor.match(match, m))
+
+    def computeFirst(self, getFirst):
+        return First([], self.__matches, False, self.__expected)
 
 
 # See http://www.cl.cam.ac.uk/~mgk25/iso-14977.pdf
@@ -34,18 +42,21 @@ class Parser:
         assert hasattr(builder, "makeAlternative")
         assert hasattr(builder, "makeSequence")
         assert hasattr(builder, "makeRule")
+        assert hasattr(builder, "makeAnnotatedRule")
         assert hasattr(builder, "makeSyntax")
 
         class Internal:
             # 4.21
             emptySequence = SequenceParser([], lambda: builder.makeSequence([]))
 
-            # 4.16
-            terminal = ClassParser(Tok.Terminal, lambda t: builder.makeTerminal(t.value))
+            # 4.14 and 4.16
+            nonTerminalOrTerminal = ClassParser({
+                Tok.MetaIdentifier: lambda name: builder.makeNonTerminal(name.value),
+                Tok.Terminal: lambda t: builder.makeTerminal(t.value),
+            })
 
             # 4.14
-            metaIdentifier = ClassParser(Tok.MetaIdentifier, lambda name: name.value)
-            nonTerminal = ClassParser(Tok.MetaIdentifier, lambda name: builder.makeNonTerminal(name.value))
+            metaIdentifier = ClassParser({Tok.MetaIdentifier: lambda name: name.value})
 
             # 4.13
             class groupedSequence:
@@ -92,15 +103,14 @@ class Parser:
                     optionalSequence,
                     repeatedSequence,
                     groupedSequence,
-                    nonTerminal,
-                    terminal,
+                    nonTerminalOrTerminal,
                     # specialSequence,  # @todo Implement
                     emptySequence
                 ]
             )
 
             # 4.9
-            integer = ClassParser(Tok.Integer, lambda i: i.value)
+            integer = ClassParser({Tok.Integer: lambda i: i.value})
 
             # 4.8
             syntacticFactor = AlternativeParser(
@@ -159,10 +169,14 @@ class Parser:
                 lambda d1, ds: d1 if len(ds) == 0 else builder.makeAlternative([d1] + ds)
             )
 
-            # 4.3
+            annotation = ClassParser({Tok.Annotation: lambda annotation: annotation.value})
+
+            # 4.3, with optional annotations
             syntaxRule = SequenceParser(
-                [metaIdentifier, LiteralParser(Tok.Defining), definitionsList, LiteralParser(Tok.Terminator)],
-                lambda name, defining, value, terminator: builder.makeRule(name, value)
+                [RepeatedParser(annotation), metaIdentifier, LiteralParser(Tok.Defining), definitionsList, LiteralParser(Tok.Terminator)],
+                lambda annotations, name, defining, value, terminator: (
+                    builder.makeAnnotatedRule(annotations, name, value) if annotations else builder.makeRule(name, value)
+                )
             )
 
             # 4.2
@@ -17,45 +17,47 @@ StartRepeat = "{"
 EndRepeat = "}"
 
 
-class Terminal:
+class _Token(object):
+    # Tokens with a value are immutable, hashable (their hash is computed once), and equal when they have the same
+    # class and value. The Lexer interns them: equal tokens of a text are the same object.
+    __slots__ = ("value", "_hash")
+
     def __init__(self, value):
         self.value = value
+        self._hash = hash((self.__class__.__name__, value))
 
     def __eq__(self, other):
-        return other.__class__ == Terminal and other.value == self.value
+        return other.__class__ is self.__class__ and other.value == self.value
 
-    def __repr__(self):  # pragma no cover
-        return "Terminal(" + self.value + ")"
+    def __ne__(self, other):
+        return not self == other
 
+    def __hash__(self):
+        return self._hash
 
-class Comment:
-    def __init__(self, value):
-        self.value = value
+    def __repr__(self):  # pragma no cover
+        return self.__class__.__name__ + "(" + str(self.value) + ")"
 
-    def __eq__(self, other):  # pragma no cover
-        return other.__class__ == Comment and other.value == self.value
 
-    def __repr__(self):  # pragma no cover
-        return "Comment(" + self.value + ")"
+class Terminal(_Token):
+    __slots__ = ()
 
 
-class MetaIdentifier:
-    def __init__(self, words):
-        self.value = " ".join(words)
+class Comment(_Token):
+    __slots__ = ()
 
-    def __eq__(self, other):
-        return other.__class__ == MetaIdentifier and other.value == self.value
 
-    def __repr__(self):  # pragma no cover
-        return "MetaIdentifier(" + self.value + ")"
+class Annotation(_Token):
+    # A comment starting with "@", like (* @operators *), before a rule
+    __slots__ = ()
 
 
-class Integer:
-    def __init__(self, value):
-        self.value = value
+class MetaIdentifier(_Token):
+    __slots__ = ()
 
-    def __eq__(self, other):
-        return other.__class__ == Integer and other.value == self.value
+    def __init__(self, words):
+        _Token.__init__(self, " ".join(words))
 
-    def __repr__(self):  # pragma no cover
-        return "Integer(" + str(self.value) + ")"
+
+class Integer(_Token):
+    __slots__ = ()
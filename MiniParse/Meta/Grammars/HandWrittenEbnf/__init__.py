@@ -8,24 +8,15 @@ from . import Parser
 
 
 def parse(builder, input):
-    def getLineCol(position):
-        before = input[:position]
-        lines = before.split("\n")
-        return len(lines) - 1, len(lines[-1])
-
+    locations = MiniParse.SourceLocations(input)
     lex = Lexer.Lexer()
     parse = Parser.Parser(builder)
     try:
-        tokens = lex(input)
+        tokens = MiniParse.LocatedTokens(lex.iterate(input), locations)
     except MiniParse.ParsingError as e:
-        position = e.position
-        raise MiniParse.ParsingError(e.message, getLineCol(position), e.expected)
+        raise MiniParse.ParsingError(e.message, locations.lineAndColumn(e.position), e.expected)
     try:
-        g = parse([t for i, t in tokens])
+        g = parse(tokens)
     except MiniParse.ParsingError as e:
-        if e.position < len(tokens):
-            position = tokens[e.position][0]
-        else:
-            position = len(input)
-        raise MiniParse.ParsingError(e.message, getLineCol(position), e.expected)
+        raise MiniParse.ParsingError(e.message, (e.line, e.column), e.expected)
     return g
@@ -47,6 +47,15 @@ class HandWrittenEbnfLexerTestCase(unittest.TestCase):
     def testComment(self):
         self.lex("(* foo\nbar *)", [])
 
+    def testAnnotation(self):
+        self.lex("(* @operators *) foo", [Tok.Annotation("operators"), Tok.MetaIdentifier(["foo"])])
+        self.lex("a; (* @operators *) (* @todo *) foo", [Tok.MetaIdentifier(["a"]), Tok.Terminator, Tok.Annotation("operators"), Tok.MetaIdentifier(["foo"])])
+
+    def testUnplacedAnnotationsAreComments(self):
+        self.lex("(* @todo *) foo", [Tok.MetaIdentifier(["foo"])])
+        self.lex("foo (* @operators *) bar", [Tok.MetaIdentifier(["foo"]), Tok.MetaIdentifier(["bar"])])
+        self.lex("(* @operators *) 'foo'", [Tok.Terminal("foo")])
+
     def testMetaIdentifier(self):
         self.lex("foo\nbar\tbaz toto", [Tok.MetaIdentifier(["foo", "bar", "baz", "toto"])])
 
@@ -84,3 +93,29 @@ class HandWrittenEbnfLexerTestCase(unittest.TestCase):
         with self.assertRaises(MiniParse.ParsingError) as cm:
             self.lexer("abcd = efgh; (* ijkl")
         self.assertEqual(cm.exception.args, ("Unclosed comment", 13, set()))
+
+    def testStringDoesNotSpanLines(self):
+        with self.assertRaises(MiniParse.ParsingError) as cm:
+            self.lexer('abcd = "ef\ngh";')
+        self.assertEqual(cm.exception.args, ("Unclosed string", 7, set()))
+
+    def testCommentSeparatesMetaIdentifiers(self):
+        self.lex(
+            "foo (* bar *) baz 12abc",
+            [Tok.MetaIdentifier(["foo"]), Tok.MetaIdentifier(["baz"]), Tok.Integer(12), Tok.MetaIdentifier(["abc"])],
+            [0, 14, 18, 20]
+        )
+
+    def testTokensAreHashable(self):
+        self.assertEqual(
+            set([Tok.Terminal("a"), Tok.Terminal("a"), Tok.MetaIdentifier(["a"]), Tok.Integer(1), Tok.Integer(1)]),
+            set([Tok.Terminal("a"), Tok.MetaIdentifier(["a"]), Tok.Integer(1)])
+        )
+        self.assertNotEqual(Tok.Terminal("a"), Tok.MetaIdentifier(["a"]))
+        self.assertNotEqual(Tok.Terminal("="), Tok.Defining)
+
+    def testEqualTokensAreInterned(self):
+        tokens = [t for i, t in self.lexer("a = 'x', a, 'x', 2 * a;")]
+        self.assertIs(tokens[0], tokens[4])
+        self.assertIs(tokens[0], tokens[10])
+        self.assertIs(tokens[2], tokens[6])
@@ -63,6 +63,17 @@ class HandWrittenEbnfParserTestCase(unittest.TestCase):
             )])
         )
 
+    def testAnnotatedRule(self):
+        self.parse("(* @operators *) (* @foo *) foo = bar;", b.makeSyntax([b.makeAnnotatedRule(["operators"], "foo", b.makeNonTerminal("bar"))]))
+
+    def testAnnotationLikeCommentInRule(self):
+        self.parse('a = "x" (* @todo later *) ;', b.makeSyntax([b.makeRule("a", b.makeTerminal("x"))]))
+        self.parse('a = "x" (* @operators *) ;', b.makeSyntax([b.makeRule("a", b.makeTerminal("x"))]))
+
+    def testAnnotationLikeCommentAfterLastRule(self):
+        self.parse('a = "x"; (* @end *)', b.makeSyntax([b.makeRule("a", b.makeTerminal("x"))]))
+        self.parse('a = "x"; (* @operators *)', b.makeSyntax([b.makeRule("a", b.makeTerminal("x"))]))
+
     def testEmpty(self):
         self.parse("foo = ;", b.makeSyntax([b.makeRule("foo", b.makeSequence([]))]))
 
@@ -6,7 +6,7 @@ import sys
 import pipes  # For pipes.quote: see http://stackoverflow.com/questions/4748344/whats-the-reverse-of-shlex-split
 import InteractiveCommandLine as ICL
 
-from . import Grammars.HandWrittenEbnf
+from .Grammars import HandWrittenEbnf
 from . import Generable
 from . import Drawable
 
@@ -25,24 +25,39 @@ class Generate(ICL.Command):
         self.addOption(ICL.AppendingOption("import", "Module to import in generated code", self.imports, ICL.ValueFromOneArgument("MODULE")))
         self.mainRule = None
         self.addOption(ICL.StoringOption("main-rule", "Main rule of the grammar", self, "mainRule", ICL.ValueFromOneArgument("NAME")))
+        self.backend = "combinators"
+        self.addOption(ICL.StoringOption("backend", "'combinators' to use MiniParse's parsers, 'direct' for a standalone recursive descent parser, 'll1' for a standalone table-driven parser (LL(1) grammars only)", self, "backend", ICL.ValueFromOneArgument("BACKEND")))
 
     def execute(self):
         inputName = self.__prog.inputName
         with open(inputName) as f:
-            g = Grammars.HandWrittenEbnf.parse(Generable.builder, f.read())
+            g = HandWrittenEbnf.parse(Generable.builder, f.read())
         if self.outputName is None:
             self.outputName = inputName[:-5] + ".py"
+        # Code is generated before opening the output file, which is not modified if the grammar doesn't suit the backend
+        if self.backend == "combinators":
+            imports = ["MiniParse"]
+            code = g.generateMiniParser(self.mainRule, self.computeParserName, self.computeMatchName)
+        elif self.backend == "direct":
+            imports = []
+            code = g.generateDirectParser(self.mainRule, self.computeParserName, self.computeMatchName)
+        elif self.backend == "ll1":
+            imports = []
+            code = g.generateLL1Parser(self.mainRule, self.computeParserName, self.computeMatchName)
+        else:
+            raise Exception("Unknown backend " + self.backend)
         with open(self.outputName, "w") as f:
             f.write("# This file was generated by MiniParse.Meta. Manual modifications will likely be lost.\n")
             f.write("# Command line:\n#     python -m MiniParse.Meta " + " ".join(pipes.quote(a) for a in sys.argv[1:]) + "\n")
             f.write("\n")
-            f.write("import MiniParse\n")
-            f.write("\n")
+            for i in imports:
+                f.write("import " + i + "\n")
+                f.write("\n")
             for i in self.imports:
                 f.write("import " + i + "\n")
             f.write("\n")
             f.write("\n")
-            f.write(g.generateMiniParser(self.mainRule, self.computeParserName, self.computeMatchName))
+            f.write(code)
 
 
 class Draw(ICL.Command):
@@ -57,7 +72,7 @@ class Draw(ICL.Command):
 
         inputName = self.__prog.inputName
         with open(inputName) as f:
-            g = Grammars.HandWrittenEbnf.parse(Drawable.builder, f.read())
+            g = HandWrittenEbnf.parse(Drawable.builder, f.read())
         if self.outputName is None:
             self.outputName = inputName[:-5] + ".png"
         img = cairo.ImageSurface(cairo.FORMAT_RGB24, 1, 1)
@@ -0,0 +1,112 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Compares the HandWrittenEbnf Lexer, which matches a single regular expression per token, with the previous lexer,
+# which tried one regular expression per kind of token at each position.
+# Run from the root of the repository: python benchmarks/EbnfLexer.py
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+import MiniParse.Meta.Grammars.HandWrittenEbnf.Tokens as Tok
+from MiniParse.Meta.Grammars.HandWrittenEbnf.Lexer import Lexer
+
+
+class SequentialLexer:
+    def __init__(self):
+        self.__space = re.compile("[ \t\n\r\v\f]*")
+        self.__terminal1 = re.compile('".*?"')
+        self.__terminal2 = re.compile("'.*?'")
+        self.__comment = re.compile("\\(\\*.*?\\*\\)", re.DOTALL)
+        self.__metaIdentifierWord = re.compile("[a-zA-Z][a-zA-Z0-9]*")
+        self.__integer = re.compile("[0-9]+")
+        self.__operators = {
+            "*": Tok.Repetition, "-": Tok.Except, ",": Tok.Concatenate, "|": Tok.DefinitionSeparator,
+            "=": Tok.Defining, ";": Tok.Terminator, "(": Tok.StartGroup, ")": Tok.EndGroup,
+            "[": Tok.StartOption, "]": Tok.EndOption, "{": Tok.StartRepeat, "}": Tok.EndRepeat
+        }
+
+    def __call__(self, s):
+        return list(self.__run(s))
+
+    def __run(self, s):
+        i = self.__skipSpaces(s, 0)
+        while i < len(s):
+            i_before = i
+            i, tok = self.__next(s, i)
+            if not isinstance(tok, Tok.Comment):
+                yield i_before, tok
+
+    def __skipSpaces(self, s, i):
+        return self.__space.match(s, i).end()
+
+    def __next(self, s, i):
+        m = self.__integer.match(s, i)
+        if m:
+            return self.__skipSpaces(s, m.end()), Tok.Integer(int(m.group()))
+        m = self.__terminal1.match(s, i)
+        if m:
+            return self.__skipSpaces(s, m.end()), Tok.Terminal(m.group()[1:-1])
+        m = self.__terminal2.match(s, i)
+        if m:
+            return self.__skipSpaces(s, m.end()), Tok.Terminal(m.group()[1:-1])
+        m = self.__comment.match(s, i)
+        if m:
+            comment = m.group()[2:-2].strip()
+            if comment.startswith("@"):
+                return self.__skipSpaces(s, m.end()), Tok.Annotation(comment[1:])
+            return self.__skipSpaces(s, m.end()), Tok.Comment(comment)
+        if s[i:i + 2] == "(*":
+            raise MiniParse.ParsingError("Unclosed comment", i, set())
+        if s[i] in ["'", '"']:
+            raise MiniParse.ParsingError("Unclosed string", i, set())
+        m = self.__metaIdentifierWord.match(s, i)
+        if m:
+            words = []
+            while m:
+                i = m.end()
+                words.append(m.group())
+                i = self.__skipSpaces(s, i)
+                m = self.__metaIdentifierWord.match(s, i)
+            return self.__skipSpaces(s, i), Tok.MetaIdentifier(words)
+        if s[i] in self.__operators:
+            return self.__skipSpaces(s, i + 1), self.__operators[s[i]]
+        raise MiniParse.ParsingError("Unexpected character", i, set())
+
+
+def syntheticGrammar(rules):
+    # Rules like those of generated grammars: multi-word identifiers, terminals, repetitions and comments
+    return "".join(
+        "(* rule {0} *)\nrule number {0} = ['-'], 2 * digit, {{ rule number {1} | \"x{0}\" }}, (\"a\" - 'b');\n".format(i, (i + 1) % rules)
+        for i in range(rules)
+    )
+
+
+def compare(name, text, number):
+    sequential = SequentialLexer()
+    single = Lexer()
+    assert [(i, repr(t)) for i, t in sequential(text)] == [(i, repr(t)) for i, t in single(text)]
+    before = min(timeit.repeat(lambda: sequential(text), number=number, repeat=3))
+    after = min(timeit.repeat(lambda: single(text), number=number, repeat=3))
+    print("{:<24} sequential: {:8.2f} ms  single regex: {:8.2f} ms  speedup: {:.2f}x".format(
+        name, 1000 * before / number, 1000 * after / number, before / after
+    ))
+
+
+def main():
+    with open(os.path.join(os.path.dirname(__file__), "..", "MiniParse", "Meta", "Grammars", "GeneratedEbnf", "Grammar.ebnf")) as f:
+        compare("GeneratedEbnf (6 KB)", f.read(), 100)
+    text = syntheticGrammar(100000)
+    compare("100k rules ({} MB)".format(len(text) // 1000000), text, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Compares the generated StringArithmetic parser, whose parser graph is built once at import, with the code
+# previously generated for the same grammar, which built the parser graph again on each apply, and with the
+# standalone parser generated by the direct backend.
+# Run from the root of the repository: python benchmarks/GeneratedParsers.py
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+from MiniParse.Examples.StringArithmetic import Parser as StringArithmetic
+from MiniParse.Examples.StringArithmetic import DirectParser as DirectStringArithmetic
+from MiniParse.Examples.StringArithmetic import ParsingUtilities
+
+
+class PerApplyParser:
+    def __call__(self, tokens, **options):
+        class StringExprParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([StringTermParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.LiteralParser('+'), StringTermParser]))], ParsingUtilities.makeStringExpr).apply(cursor)
+
+        class StringTermParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.SequenceParser([IntTermParser, MiniParse.LiteralParser('*')])), StringFactorParser], ParsingUtilities.makeStringTerm).apply(cursor)
+
+        class StringFactorParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.AlternativeParser([StringParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), StringExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeStringFactor).apply(cursor)
+
+        class StringParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([MiniParse.LiteralParser('"'), MiniParse.RepeatedParser(CharParser), MiniParse.LiteralParser('"')], ParsingUtilities.makeString).apply(cursor)
+
+        class CharParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SetParser(['a', 'b', 'c', 'd', 'e', 'f'], ParsingUtilities.makeChar).apply(cursor)
+
+        class IntTermParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([IntFactorParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.SetParser(['*', '/']), IntFactorParser]))], ParsingUtilities.makeIntTerm).apply(cursor)
+
+        class IntFactorParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.AlternativeParser([IntParser, MiniParse.SequenceParser([MiniParse.LiteralParser('('), IntExprParser, MiniParse.LiteralParser(')')])], ParsingUtilities.makeIntFactor).apply(cursor)
+
+        class IntExprParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([IntTermParser, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.SetParser(['+', '-']), IntTermParser]))], ParsingUtilities.makeIntExpr).apply(cursor)
+
+        class IntParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SequenceParser([MiniParse.OptionalParser(MiniParse.LiteralParser('-')), DigitParser, MiniParse.RepeatedParser(DigitParser)], ParsingUtilities.makeInt).apply(cursor)
+
+        class DigitParser:
+            @staticmethod
+            def apply(cursor):
+                return MiniParse.SetParser(['0', '1', '2', '3', '4', '5', '6', '7', '8', '9'], ParsingUtilities.makeDigit).apply(cursor)
+
+        return MiniParse.parse(StringExprParser, tokens, **options)
+
+
+def main():
+    arithmetic = '(' + '+'.join(['(12*3-4)/2'] * 50) + ')*("abc"+"def")'
+    perApply = PerApplyParser()
+    builtOnce = StringArithmetic.Parser()
+    direct = DirectStringArithmetic.Parser()
+    assert perApply(arithmetic).dump() == builtOnce(arithmetic).dump() == direct(arithmetic).dump()
+    number = 20
+    before = min(timeit.repeat(lambda: perApply(arithmetic), number=number, repeat=5))
+    after = min(timeit.repeat(lambda: builtOnce(arithmetic), number=number, repeat=5))
+    print("StringArithmetic per apply: {:7.2f} ms  built once: {:7.2f} ms  speedup: {:.2f}x".format(
+        1000 * before / number, 1000 * after / number, before / after
+    ))
+    after = min(timeit.repeat(lambda: direct(arithmetic), number=number, repeat=5))
+    print("StringArithmetic per apply: {:7.2f} ms  direct:     {:7.2f} ms  speedup: {:.2f}x".format(
+        1000 * before / number, 1000 * after / number, before / after
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Measures the cost of ParsingSession.edit (invalidating the IncrementalMemo) and of the parse that follows it,
+# compared to a full parse, on documents of increasing sizes. Edits replace a random digit. edit should stay
+# about constant: it examines only the columns near the edit and the few columns that reach further.
+# Run from the root of the repository: python benchmarks/IncrementalEdit.py [number of edits]
+
+from __future__ import print_function
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+
+
+# value = digit | "[", [value, {",", value}], "]";
+value = MiniParse.RuleParser("value")
+items = MiniParse.SequenceParser(
+    [value, MiniParse.RepeatedParser(MiniParse.SequenceParser([MiniParse.LiteralParser(","), value], lambda comma, v: v))],
+    lambda first, others: [first] + others
+)
+value.define(MiniParse.AlternativeParser([
+    MiniParse.SetParser("0123456789", int),
+    MiniParse.SequenceParser([MiniParse.LiteralParser("["), MiniParse.OptionalParser(items, []), MiniParse.LiteralParser("]")], lambda o, v, c: v),
+]))
+
+
+def measure(size, edits):
+    tokens = "[" + ",".join("[1,[2,3],4]" for i in range(size // 12)) + "]"
+    digits = [position for position, token in enumerate(tokens) if token.isdigit()]
+    session = MiniParse.ParsingSession(value, tokens)
+    start = time.time()
+    session.parse()
+    full = time.time() - start
+    r = random.Random(42)
+    editing = 0
+    parsing = 0
+    for i in range(edits):
+        position = r.choice(digits)
+        start = time.time()
+        session.edit(position, 1, str(r.randrange(10)))
+        editing += time.time() - start
+        start = time.time()
+        session.parse()
+        parsing += time.time() - start
+    return full, editing / edits, parsing / edits
+
+
+def main():
+    edits = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print("{:>8}  {:>12}  {:>12}  {:>12}".format("tokens", "full parse", "edit", "reparse"))
+    for size in (1000, 10000, 100000):
+        full, editing, parsing = measure(size, edits)
+        print("{:>8}  {:>10.2f}ms  {:>10.3f}ms  {:>10.3f}ms".format(size, full * 1000, editing * 1000, parsing * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Compares parse(..., optimistic=True) with the default single diagnostic pass.
+# Run from the root of the repository: python benchmarks/OptimisticParsing.py
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+from MiniParse.Examples.StringArithmetic import Parser as StringArithmetic
+from MiniParse.Meta.Generable import builder
+from MiniParse.Meta.Grammars.HandWrittenEbnf import Lexer, Parser as Ebnf
+
+
+def compare(name, function, number):
+    default = min(timeit.repeat(lambda: function(optimistic=False), number=number, repeat=5))
+    optimistic = min(timeit.repeat(lambda: function(optimistic=True), number=number, repeat=5))
+    print("{:<16} default: {:7.2f} ms  optimistic: {:7.2f} ms  speedup: {:.2f}x".format(
+        name, 1000 * default / number, 1000 * optimistic / number, default / optimistic
+    ))
+
+
+def main():
+    arithmetic = '(' + '+'.join(['(12*3-4)/2'] * 50) + ')*("abc"+"def")'
+    stringArithmetic = StringArithmetic.Parser()
+    compare("StringArithmetic", lambda **options: stringArithmetic(arithmetic, **options), 20)
+
+    with open(os.path.join(os.path.dirname(__file__), "..", "MiniParse", "Meta", "Grammars", "GeneratedEbnf", "Grammar.ebnf")) as f:
+        tokens = [t for i, t in Lexer.Lexer()(f.read())]
+    ebnf = Ebnf.Parser(builder).internal.syntax
+    compare("Grammar.ebnf", lambda **options: MiniParse.parse(ebnf, tokens, **options), 10)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Measures the throughput of parseMany on independent StringArithmetic expressions, with increasing numbers of
+# worker processes, up to the number of cores.
+# Run from the root of the repository: python benchmarks/ParseMany.py [number of inputs]
+
+from __future__ import print_function
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+
+
+parser = "MiniParse.Examples.StringArithmetic.Parser:StringExprParser"
+
+
+def makeStringExpr(r, depth):
+    if depth == 0 or r.random() < 0.3:
+        return '"' + "".join(r.choice("abcdef") for i in range(r.randrange(3))) + '"'
+    elif r.random() < 0.5:
+        return makeIntExpr(r, depth - 1) + "*" + makeStringExpr(r, depth - 1)
+    else:
+        return makeStringExpr(r, depth - 1) + "+" + makeStringExpr(r, depth - 1)
+
+
+def makeIntExpr(r, depth):
+    if depth == 0 or r.random() < 0.3:
+        return str(r.randrange(1, 30))
+    else:
+        return "(" + makeIntExpr(r, depth - 1) + r.choice("+-*/") + makeIntExpr(r, depth - 1) + ")"
+
+
+def measure(inputs, workers):
+    start = time.time()
+    count = 0
+    for result in MiniParse.parseMany(parser, inputs, workers=workers, chunkSize=512):
+        count += 1
+    assert count == len(inputs)
+    return len(inputs) / (time.time() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    r = random.Random(42)
+    inputs = [makeStringExpr(r, 4) for i in range(count)]
+    cores = multiprocessing.cpu_count()
+    serial = measure(inputs, 1)
+    print("{:>2} worker:  {:9.0f} inputs/s".format(1, serial))
+    workers = 2
+    while workers <= cores:
+        throughput = measure(inputs, workers)
+        print("{:>2} workers: {:9.0f} inputs/s  speedup: {:.2f}x".format(workers, throughput, throughput / serial))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
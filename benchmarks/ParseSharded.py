@@ -0,0 +1,55 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Measures parseSharded on a single input made of StringArithmetic expressions terminated by ";", with increasing
+# numbers of worker processes, up to the number of cores.
+# Run from the root of the repository: python benchmarks/ParseSharded.py [number of expressions]
+
+from __future__ import print_function
+
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+from MiniParse.Examples.StringArithmetic.Parser import StringExprParser
+
+from ParseMany import makeStringExpr
+
+record = MiniParse.SequenceParser([StringExprParser, MiniParse.LiteralParser(";")], lambda expr, terminator: expr)
+
+
+def isBoundary(token):
+    return token == ";"
+
+
+def measure(tokens, workers):
+    start = time.time()
+    values = MiniParse.parseSharded("__main__:record", tokens, isBoundary, workers=workers, shardSize=len(tokens) // (4 * workers) + 1)
+    duration = time.time() - start
+    return duration, len(values)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    r = random.Random(42)
+    tokens = "".join(makeStringExpr(r, 4) + ";" for i in range(count))
+    cores = multiprocessing.cpu_count()
+    serial, values = measure(tokens, 1)
+    print("{} tokens".format(len(tokens)))
+    print("{:>2} worker:  {:7.2f} s".format(1, serial))
+    workers = 2
+    while workers <= cores:
+        duration, shardedValues = measure(tokens, workers)
+        assert shardedValues == values
+        print("{:>2} workers: {:7.2f} s  speedup: {:.2f}x".format(workers, duration, serial / duration))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# coding: utf8
+
+# Copyright 2013-2015 Vincent Jacques <vincent@vincent-jacques.net>
+
+# Compares parsing a list of token objects with parsing an array("i") of their ids in a Vocabulary.
+# Run from the root of the repository: python benchmarks/Vocabulary.py
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import MiniParse
+
+
+class Token:
+    # A typical token object of a tokenizer
+    def __init__(self, kind):
+        self.kind = kind
+
+    def __eq__(self, other):
+        return other == self.kind
+
+    def __ne__(self, other):
+        return other != self.kind
+
+    def __hash__(self):
+        return hash(self.kind)
+
+
+def makeParser(literal):
+    class factor:
+        @staticmethod
+        def apply(cursor):
+            return cursor.apply(factorParser)
+
+    term = MiniParse.SequenceParser([factor, MiniParse.RepeatedParser(MiniParse.SequenceParser([literal("*"), factor]))])
+    expr = MiniParse.SequenceParser([term, MiniParse.RepeatedParser(MiniParse.SequenceParser([literal("+"), term]))])
+    factorParser = MiniParse.AlternativeParser([literal("1"), MiniParse.SequenceParser([literal("("), expr, literal(")")])])
+    return expr
+
+
+def measureMemory(make):
+    tracemalloc.start()
+    tokens = make()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tokens, size
+
+
+def main():
+    text = "+".join(["(1*1+1)*1"] * 20000)
+    vocabulary = MiniParse.Vocabulary(["1", "+", "*", "(", ")"])
+    objects, objectsSize = measureMemory(lambda: [Token(c) for c in text])
+    ids, idsSize = measureMemory(lambda: vocabulary.encode(text))
+    print("{} tokens  objects: {:.1f} bytes per token  ids: {:.1f} bytes per token".format(
+        len(text), objectsSize / len(text), idsSize / len(text)
+    ))
+    objectsParser = makeParser(MiniParse.LiteralParser)
+    idsParser = makeParser(vocabulary.literal)
+    assert MiniParse.parse(objectsParser, objects) == vocabulary.parse(idsParser, ids)
+    before = min(timeit.repeat(lambda: MiniParse.parse(objectsParser, objects), number=1, repeat=5))
+    after = min(timeit.repeat(lambda: vocabulary.parse(idsParser, ids), number=1, repeat=5))
+    print("parse  objects: {:7.2f} ms  ids: {:7.2f} ms  speedup: {:.2f}x".format(1000 * before, 1000 * after, before / after))
+
+
+if __name__ == "__main__":
+    main()